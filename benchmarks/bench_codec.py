@@ -0,0 +1,99 @@
+# benchmarks/bench_codec.py
+# 역할: orchestrate 도메인 메시지 encode/decode 비용 비교 (1건당 µs)
+#   - before: asdict() + json.dumps(ensure_ascii=False).encode / json.loads(decode) + user_id/userId 수동 조회
+#   - after : orchestrate.app.codec (설치된 백엔드별: msgspec / orjson / json)
+# 사용: python benchmarks/bench_codec.py [--count 200000]
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import timeit
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from orchestrate.app.domain import ToTranslator, ToSecurity
+
+TRANSLATOR = ToTranslator(job_id=482913, user_id=1107,
+                          file_path="s3://ai-migration-input/uploads/1107/전자정부_게시판_모듈_v3.8.zip",
+                          input_egov_frame_ver="3.8", output_egov_frame_ver="4.2",
+                          is_test_code=True, conversion_type="CODE")
+SECURITY = ToSecurity(job_id=482914, user_id=1107,
+                      filePath="s3://ai-migration-input/uploads/1107/보안점검_대상_프로젝트.zip")
+
+# 백엔드가 보내는 camelCase 형태 (orchestrate가 java-message로 받는 요청)
+REQUEST = json.dumps({'eventType': 'ConversionRequested', 'timestamp': 1755069341605, 'jobId': 482913,
+                      'userId': 1107, 'filePath': TRANSLATOR.file_path, 'inputeGovFrameVer': '3.8',
+                      'outputeGovFrameVer': '4.2', 'isTestCode': True, 'conversionType': 'CODE'},
+                     ensure_ascii=False).encode('utf-8')
+
+
+def baseline_encode(obj):
+    return json.dumps(asdict(obj), ensure_ascii=False).encode('utf-8')
+
+
+def baseline_decode_translator(data):
+    r = json.loads(data.decode('utf-8'))
+    return ToTranslator(job_id=r.get('job_id') or r.get('jobId'),
+                        user_id=r.get('user_id') or r.get('userId'),
+                        file_path=r.get('file_path') or r.get('filePath'),
+                        input_egov_frame_ver=r.get('input_egov_frame_ver') or r.get('inputeGovFrameVer'),
+                        output_egov_frame_ver=r.get('output_egov_frame_ver') or r.get('outputeGovFrameVer'),
+                        is_test_code=r.get('is_test_code', r.get('isTestCode')),
+                        conversion_type=r.get('conversion_type') or r.get('conversionType'))
+
+
+def baseline_decode_security(data):
+    r = json.loads(data.decode('utf-8'))
+    return ToSecurity(job_id=r.get('job_id') or r.get('jobId'),
+                      user_id=r.get('user_id') or r.get('userId'),
+                      filePath=r.get('file_path') or r.get('filePath'))
+
+
+def _us(fn, count):
+    return min(timeit.repeat(fn, number=count, repeat=3)) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=200000)
+    args = parser.parse_args()
+
+    translator_bytes = baseline_encode(TRANSLATOR)
+    security_bytes = baseline_encode(SECURITY)
+
+    rows = [('before (asdict+json)', {
+        'encode ToTranslator': _us(lambda: baseline_encode(TRANSLATOR), args.count),
+        'encode ToSecurity': _us(lambda: baseline_encode(SECURITY), args.count),
+        'decode ToTranslator': _us(lambda: baseline_decode_translator(translator_bytes), args.count),
+        'decode ToSecurity': _us(lambda: baseline_decode_security(security_bytes), args.count),
+        'decode request(camel)': _us(lambda: baseline_decode_translator(REQUEST), args.count),
+    })]
+
+    for backend in ('msgspec', 'orjson', 'json'):
+        os.environ['MESSAGE_CODEC'] = backend
+        codec = importlib.reload(importlib.import_module('orchestrate.app.codec'))
+        if codec.BACKEND != backend:
+            continue  # 미설치
+        assert codec.decode(codec.encode(TRANSLATOR), ToTranslator) == TRANSLATOR
+        assert codec.decode(REQUEST, ToTranslator) == TRANSLATOR
+        rows.append((f"codec ({backend})", {
+            'encode ToTranslator': _us(lambda: codec.encode(TRANSLATOR), args.count),
+            'encode ToSecurity': _us(lambda: codec.encode(SECURITY), args.count),
+            'decode ToTranslator': _us(lambda: codec.decode(translator_bytes, ToTranslator), args.count),
+            'decode ToSecurity': _us(lambda: codec.decode(security_bytes, ToSecurity), args.count),
+            'decode request(camel)': _us(lambda: codec.decode(REQUEST, ToTranslator), args.count),
+        }))
+
+    columns = list(rows[0][1])
+    print(f"{'µs / message':<22}" + ''.join(f"{c:>24}" for c in columns))
+    for name, values in rows:
+        print(f"{name:<22}" + ''.join(f"{values[c]:>24.2f}" for c in columns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_java_parser.py
+# 역할: Java 파서 백엔드(javalang / tree_sitter) 비교 — 파싱 처리량, 폴백률, 레코드 일치율
+#   - 코퍼스(기본: examples/version)의 .java 전체를 백엔드별로 JavaAnalyzer 생성 + extract_classes/extract_functions
+#   - 폴백률: is_parsed=False (→ java_lenient_fallback 정규식 경로로 가는 파일) 비율
+#   - 일치율: 두 백엔드가 모두 파싱한 파일 중 클래스 레코드 / 함수 호출 목록이 javalang과 같은 파일 비율
+#   - 최신 문법 probe(records, text blocks, var 람다, switch 식, sealed)의 폴백 여부도 함께 출력
+# 사용: python benchmarks/bench_java_parser.py [--corpus examples/version] [--backends javalang,tree_sitter] [--limit 0]
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from translate.app.analyzer.java_backends import BACKENDS, available_backends
+
+MODERN_PROBES = {
+    "Record.java": "public record Point(int x, int y) {\n    public Point {\n        if (x < 0) throw new IllegalArgumentException();\n    }\n}\n",
+    "TextBlock.java": 'class TextBlock {\n    String sql = """\n        SELECT * FROM board\n        """;\n}\n',
+    "VarLambda.java": "import java.util.function.BiFunction;\nclass VarLambda {\n    BiFunction<Integer, Integer, Integer> add = (var a, var b) -> a + b;\n}\n",
+    "SwitchExpr.java": "class SwitchExpr {\n    int f(String s) {\n        return switch (s) {\n            case \"a\" -> 1;\n            default -> { yield 0; }\n        };\n    }\n}\n",
+    "Sealed.java": "sealed interface Shape permits Circle {}\nfinal class Circle implements Shape {}\n",
+}
+
+
+def run(backend, files):
+    analyzer_cls = BACKENDS[backend]
+    records, fallbacks = {}, 0
+    start = time.perf_counter()
+    for path in files:
+        analyzer = analyzer_cls(str(path))
+        if not analyzer.is_parsed:
+            fallbacks += 1
+            records[path] = None
+            continue
+        records[path] = (analyzer.extract_classes(), [f["calls"] for f in analyzer.extract_functions()])
+    return time.perf_counter() - start, fallbacks, records
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', default=str(ROOT / 'examples' / 'version'))
+    parser.add_argument('--backends', default=','.join(available_backends()))
+    parser.add_argument('--limit', type=int, default=0, help='파일 수 제한 (0: 전체)')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # 파싱 실패 경고는 폴백률로만 집계
+
+    files = sorted(Path(args.corpus).rglob('*.java'))
+    if args.limit:
+        files = files[:args.limit]
+    size = sum(p.stat().st_size for p in files)
+    backends = [b for b in args.backends.split(',') if b]
+    missing = [b for b in backends if b not in available_backends()]
+    if missing:
+        sys.exit(f"not installed: {', '.join(missing)} (available: {', '.join(available_backends())})")
+    print(f"corpus: {args.corpus}  files: {len(files)}  size: {size / 1e6:.1f}MB")
+
+    results = {}
+    for backend in backends:
+        elapsed, fallbacks, records = results[backend] = run(backend, files)
+        print(f"{backend:12s} {elapsed:7.2f}s  {len(files) / elapsed:8.0f} files/s  {size / 1e6 / elapsed:6.2f} MB/s"
+              f"  fallback: {fallbacks}/{len(files)} ({fallbacks / max(len(files), 1):.1%})")
+
+    base = results.get('javalang')
+    for backend in backends:
+        if backend == 'javalang' or base is None:
+            continue
+        both = [p for p in files if base[2][p] is not None and results[backend][2][p] is not None]
+        same_classes = sum(base[2][p][0] == results[backend][2][p][0] for p in both)
+        same_calls = sum(base[2][p][1] == results[backend][2][p][1] for p in both)
+        print(f"{backend} vs javalang on {len(both)} files parsed by both: "
+              f"classes identical {same_classes / max(len(both), 1):.1%}, calls identical {same_calls / max(len(both), 1):.1%}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        probes = []
+        for name, code in MODERN_PROBES.items():
+            path = Path(tmp) / name
+            path.write_text(code, encoding='utf-8')
+            probes.append(path)
+        for backend in backends:
+            parsed = [p.stem for p in probes if BACKENDS[backend](str(p)).is_parsed]
+            print(f"modern syntax {backend:12s} parsed {len(parsed)}/{len(probes)}: {', '.join(parsed) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
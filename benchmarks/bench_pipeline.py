@@ -0,0 +1,119 @@
+# benchmarks/bench_pipeline.py
+# 역할: Kafka 클러스터 없이 orchestrate → conversion/security → agent-res → python-message 전체 흐름 부하 테스트
+#   - MESSAGE_TRANSPORT=memory 로 모든 서비스가 같은 InMemoryBroker를 공유
+#   - orchestrate는 실제 MessageConsumer(step: lane 큐잉 → weighted-fair dispatch → 오프셋 저장)를 그대로 사용
+#   - translate/security 에이전트는 고정 처리시간(--service-ms)만큼 대기 후 agent-res로 응답하는 모의 워커
+#   - python-message 도착 시각으로 end-to-end 처리량/지연(p50/p95/max)을 측정
+# 사용: python benchmarks/bench_pipeline.py [--count 2000] [--workers 4] [--service-ms 1] [--partitions 3]
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ['MESSAGE_TRANSPORT'] = 'memory'
+os.environ.setdefault('CONS_TOPIC', 'java-message,agent-res')
+os.environ.setdefault('GROUP_ID', 'bench-orchestrate')
+os.environ.setdefault('AUTO_OFFSET_RESET', 'earliest')
+
+from orchestrate.app.transport import InMemoryBroker, use_memory_broker, create_consumer, create_producer
+
+AGENT_BY_TOPIC = {'conversion': 'EGOV', 'security': 'SECU'}
+
+
+def _request(i):
+    if i % 2:
+        return {'eventType': 'SecurityRequested', 'timestamp': time.time(), 'jobId': i, 'userId': i % 7,
+                'filePath': f"s3://bench/{i}.zip"}
+    return {'eventType': 'ConversionRequested', 'timestamp': time.time(), 'jobId': i, 'userId': i % 7,
+            'filePath': f"s3://bench/{i}.zip", 'inputeGovFrameVer': '3.8', 'outputeGovFrameVer': '3.10',
+            'isTestCode': False, 'conversionType': 'CODE'}
+
+
+def agent_worker(topic, group, service_sec, stop):
+    """conversion/security 요청을 받아 처리시간만큼 대기 후 agent-res로 결과 전송 (헤더/키 유지 확인용)"""
+    consumer = create_consumer({'group.id': group, 'auto.offset.reset': 'earliest'})
+    consumer.subscribe([topic])
+    producer = create_producer({})
+    while not stop.is_set():
+        for message in consumer.consume(num_messages=100, timeout=0.1):
+            request = json.loads(message.value())
+            if service_sec:
+                time.sleep(service_sec)
+            producer.produce('agent-res', key=message.key(), headers=[('AGENT', AGENT_BY_TOPIC[topic])],
+                             value=json.dumps({'jobId': request['job_id'], 'userId': request['user_id'],
+                                               'status': 'SUCCESS'}).encode('utf-8'))
+    consumer.close()
+
+
+def orchestrate_loop(consumer, stop):
+    """MessageConsumer.consume()의 loop 1회분(step)을 반복 (종료 가능하도록 stop 이벤트 사용)"""
+    while not stop.is_set():
+        consumer.step(timeout=0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=4, help='에이전트 토픽별 모의 워커 수')
+    parser.add_argument('--service-ms', type=float, default=1.0, help='모의 에이전트 1건 처리시간')
+    parser.add_argument('--partitions', type=int, default=3)
+    args = parser.parse_args()
+
+    broker = InMemoryBroker(args.partitions)
+    use_memory_broker(broker)
+
+    from orchestrate.app.consumer import MessageConsumer
+    orchestrator = MessageConsumer()
+    orchestrator.logger.setLevel(logging.WARNING)
+    orchestrator.producer.logger.setLevel(logging.WARNING)
+
+    stop = threading.Event()
+    threads = [threading.Thread(target=orchestrate_loop, args=(orchestrator, stop), daemon=True)]
+    for topic in AGENT_BY_TOPIC:
+        threads += [threading.Thread(target=agent_worker, args=(topic, f"bench-{topic}", args.service_ms / 1000, stop),
+                                     daemon=True) for _ in range(args.workers)]
+    for t in threads:
+        t.start()
+
+    sink = create_consumer({'group.id': 'bench-backend', 'auto.offset.reset': 'earliest'})
+    sink.subscribe(['python-message'])
+    backend = create_producer({})
+
+    sent_at, latencies, agents = {}, [], {}
+    start = time.perf_counter()
+    for i in range(args.count):
+        sent_at[i] = time.perf_counter()
+        backend.produce('java-message', value=json.dumps(_request(i)).encode('utf-8'))
+
+    deadline = time.monotonic() + 60
+    while len(latencies) < args.count and time.monotonic() < deadline:
+        for message in sink.consume(num_messages=500, timeout=0.5):
+            now = time.perf_counter()
+            latencies.append(now - sent_at[json.loads(message.value())['jobId']])
+            agent = dict(message.headers() or [])['AGENT'].decode()
+            agents[agent] = agents.get(agent, 0) + 1
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    for t in threads:
+        t.join(timeout=2)
+    sink.close()
+
+    latencies.sort()
+    received = len(latencies)
+    pct = lambda p: latencies[min(received - 1, int(received * p))] * 1000 if received else 0.0
+    print(f"requests: {args.count}  received: {received}  by agent: {agents}")
+    print(f"throughput: {received / elapsed:,.0f} req/s  ({elapsed:.2f}s)")
+    print(f"latency ms  p50: {pct(0.50):.1f}  p95: {pct(0.95):.1f}  max: {pct(1.0):.1f}")
+
+
+if __name__ == '__main__':
+    main()
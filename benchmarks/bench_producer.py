@@ -0,0 +1,85 @@
+# benchmarks/bench_producer.py
+# 역할: agent-res 진행 이벤트 전송 처리량(messages/sec) 비교
+#   - before: 메시지마다 produce() + flush() (기존 MessageProducer.send_message 방식)
+#   - after : 공유 MessageProducer (비동기 delivery + 백그라운드 poll + linger/batch, 종료 시 1회 flush)
+# 사용: python benchmarks/bench_producer.py [--count 5000] [--rtt-ms 2] [--bootstrap host:port]
+#       --bootstrap 미지정 시 librdkafka 내장 mock 클러스터(브로커 RTT 지정 가능)를 띄워서 측정한다.
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from confluent_kafka import Producer
+
+
+def _start_mock_cluster(rtt_ms):
+    """mock 클러스터를 소유하는 클라이언트와 bootstrap 주소를 반환"""
+    owner = Producer({'test.mock.num.brokers': 1, 'test.mock.broker.rtt': rtt_ms, 'log_level': 0})
+    broker = next(iter(owner.list_topics(timeout=10).brokers.values()))
+    return owner, f"{broker.host}:{broker.port}"
+
+
+def _payload(i):
+    return {'userId': 1, 'jobId': 1, 'status': 'SUCCESS',
+            'description': f"전자정부 표준 프레임워크의 controller 계층 코드 변환이 완료되었습니다. ({i})"}
+
+
+def bench_flush_per_message(bootstrap, topic, count):
+    producer = Producer({'bootstrap.servers': bootstrap, 'log_level': 0})
+    start = time.perf_counter()
+    for i in range(count):
+        producer.produce(topic, value=json.dumps(_payload(i), ensure_ascii=False).encode('utf-8'),
+                         headers=[('AGENT', 'EGOV')], callback=lambda err, msg: None)
+        producer.flush()
+    return count / (time.perf_counter() - start)
+
+
+def bench_shared_producer(bootstrap, topic, count):
+    os.environ['KAFKA_SERVER'] = bootstrap
+    from orchestrate.app.producer import MessageProducer
+
+    producer = MessageProducer()
+    producer.logger.setLevel(logging.WARNING)  # 측정에서 delivery 로그 I/O는 제외
+    start = time.perf_counter()
+    for i in range(count):
+        producer.send_message(topic, _payload(i), headers=[('AGENT', 'EGOV')])
+    remaining = producer.flush()
+    elapsed = time.perf_counter() - start
+    if remaining:
+        print(f"[warn] {remaining} message(s) not delivered")
+    return count / elapsed
+
+
+def main():
+    p = argparse.ArgumentParser(description="Kafka producer throughput: flush-per-message vs shared async producer")
+    p.add_argument('--count', type=int, default=5000)
+    p.add_argument('--topic', default='agent-res-bench')
+    p.add_argument('--rtt-ms', type=int, default=2, help="mock 브로커 왕복 지연(ms)")
+    p.add_argument('--bootstrap', default=None)
+    args = p.parse_args()
+
+    owner = None
+    bootstrap = args.bootstrap
+    if not bootstrap:
+        owner, bootstrap = _start_mock_cluster(args.rtt_ms)
+        print(f"[mock] bootstrap={bootstrap}, rtt={args.rtt_ms}ms")
+
+    before = bench_flush_per_message(bootstrap, args.topic, args.count)
+    after = bench_shared_producer(bootstrap, args.topic, args.count)
+
+    print(f"messages      : {args.count}")
+    print(f"before (flush): {before:,.0f} msg/s")
+    print(f"after  (async): {after:,.0f} msg/s")
+    print(f"speedup       : x{after / before:.1f}")
+    del owner
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# benchmarks/bench_role_inference.py
+# 역할: StructureMapper 역할 추론이 분석 시간에서 차지하는 비중 측정 (Python + Java 혼합 코퍼스)
+#   - 파싱: parse_python_file / parse_java_file을 단일 프로세스로 돌린 시간 (캐시 없음)
+#   - 역할 추론: analyze_python / analyze_java와 같은 방식으로 클래스/독립 함수에 infer_* 호출한 시간
+#     (HintMatcher 백엔드별 — substring / ahocorasick, 백엔드 간 결과 일치 여부도 확인)
+#   - 기본 코퍼스: Python 표준 라이브러리 + examples/version (.java)
+# 사용: python benchmarks/bench_role_inference.py [--python-corpus DIR] [--java-corpus DIR] [--limit 0] [--repeat 3]
+
+import argparse
+import logging
+import sys
+import sysconfig
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from translate.app.analyzer import hint_matcher
+from translate.app.analyzer.parallel_analyzer import parse_python_file, parse_java_file
+from translate.app.analyzer.structure_mapper import StructureMapper
+
+
+def collect(files, parse, language, corpus):
+    records, start = [], time.perf_counter()
+    for path in files:
+        try:
+            parsed = parse(str(path))
+        except Exception:  # 코퍼스에 섞인 깨진 파일은 건너뛴다 (비중 측정만 목적)
+            continue
+        source_info = {"language": language, "rel_path": str(path.relative_to(corpus))}
+        records.append((source_info, parsed))
+    return time.perf_counter() - start, records
+
+
+def mapper_for(backend):
+    """backend로 힌트 테이블을 다시 컴파일한 StructureMapper"""
+    mapper = StructureMapper()
+    for attr in ("_PATH_MATCHER", "_CLASS_BODY_MATCHER", "_FUNCTION_BODY_MATCHER", "_DECORATOR_MATCHER"):
+        setattr(mapper, attr, hint_matcher.HintMatcher(getattr(StructureMapper, attr).table, backend=backend))
+    return mapper
+
+
+def infer_roles(mapper, py_records, java_records):
+    roles = []
+    for source_info, (py_classes, py_funcs) in py_records:
+        for func in py_funcs:
+            if not func.get('class'):
+                roles.append(mapper.infer_standalone_function_role({**func, "source_info": source_info}))
+        for cls in py_classes:
+            class_methods = [f for f in py_funcs if f.get('class') == cls.get('name')]
+            roles.append(mapper.infer_class_role({**cls, "source_info": source_info, "functions": class_methods}))
+    for source_info, classes in java_records:
+        for cls in classes:
+            roles.append(mapper.infer_class_role({**cls, "source_info": source_info}))
+    return roles
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--python-corpus', default=sysconfig.get_paths()['stdlib'])
+    parser.add_argument('--java-corpus', default=str(ROOT / 'examples' / 'version'))
+    parser.add_argument('--limit', type=int, default=0, help='언어별 파일 수 제한 (0: 전체)')
+    parser.add_argument('--repeat', type=int, default=3, help='역할 추론 반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    py_corpus, java_corpus = Path(args.python_corpus), Path(args.java_corpus)
+    py_files = sorted(p for p in py_corpus.rglob('*.py') if 'site-packages' not in p.parts)
+    java_files = sorted(java_corpus.rglob('*.java'))
+    if args.limit:
+        py_files, java_files = py_files[:args.limit], java_files[:args.limit]
+
+    py_parse, py_records = collect(py_files, parse_python_file, 'python', py_corpus)
+    java_parse, java_records = collect(java_files, parse_java_file, 'java', java_corpus)
+    n_classes = sum(len(c) for _, (c, _) in py_records) + sum(len(c) for _, c in java_records)
+    n_funcs = sum(1 for _, (_, fs) in py_records for f in fs if not f.get('class'))
+    body_mb = (sum(len(c.get('body') or '') for _, (cs, _) in py_records for c in cs)
+               + sum(len(f.get('body') or '') for _, (_, fs) in py_records for f in fs)) / 1e6
+    parse_time = py_parse + java_parse
+    print(f"python: {len(py_records)} files ({py_parse:.2f}s parse)  java: {len(java_records)} files ({java_parse:.2f}s parse)")
+    print(f"records: {n_classes} classes + {n_funcs} standalone functions, python bodies {body_mb:.1f}MB")
+
+    backends = ['substring'] + (['ahocorasick'] if hint_matcher.ahocorasick is not None else [])
+    results = {}
+    for backend in backends:
+        mapper = mapper_for(backend)
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            roles = infer_roles(mapper, py_records, java_records)
+            best = min(best, time.perf_counter() - start)
+        results[backend] = roles
+        per_record = best / max(n_classes + n_funcs, 1) * 1e6
+        print(f"role inference {backend:12s} {best * 1000:8.1f}ms  {per_record:6.1f}us/record"
+              f"  share of parse+role: {best / (parse_time + best):.2%}")
+    if len(results) > 1:
+        print(f"backends agree: {results['substring'] == results['ahocorasick']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,11 @@
 from dotenv import load_dotenv
 import os
-from confluent_kafka import Consumer, KafkaException
+from transport import create_consumer, TransportError
 import json
 from log import Logger
 from agent import call_agent
+from producer import MessageProducer
+from retry import RetryRouter
 load_dotenv()
 
 class MessageConsumer:
@@ -13,29 +15,35 @@ class MessageConsumer:
         self.topic = os.environ.get('CONS_TOPIC')
         self.group_id = os.environ.get('GROUP_ID')
         self.auto_offset_reset = os.environ.get('AUTO_OFFSET_RESET')
-        self.consumer = Consumer({
+        self.consumer = create_consumer({
                                     'bootstrap.servers': self.broker,
                                     'group.id': self.group_id, # consumer의 id
-                                    'auto.offset.reset': self.auto_offset_reset  # 처음 실행시 가장 마지막 offset부터
+                                    'auto.offset.reset': self.auto_offset_reset,  # 처음 실행시 가장 마지막 offset부터
+                                    'enable.auto.offset.store': False  # 처리(또는 retry/DLQ 전송)가 끝난 메시지만 커밋 대상
                                 })
-        self.consumer.subscribe([self.topic])
+        self.producer = MessageProducer()
+        self.retry = RetryRouter(self.producer, self.logger)
+        self.consumer.subscribe(self.retry.topics([self.topic]))
 
     def consume(self):
         try:
             print(f"start consume: {self.topic}")
 
             while True:
+                self.retry.release(self.consumer)
                 message = self.consumer.poll(1.0)
                 if message is None:
                     continue
                 if message.error():
                     print(f"Kafka error: {message.error()}")
-                else:
+                elif not self.retry.hold(self.consumer, message):
                     self.handle_message(message)
-        except KafkaException as e:
+                    self.consumer.store_offsets(message)
+        except TransportError as e:
             self.logger.error(e)
         finally:
             self.consumer.close()
+            self.producer.close()
 
     def handle_message(self, message):
         try:
@@ -47,6 +55,7 @@ class MessageConsumer:
 
         except Exception as e:
             self.logger.exception(e)
+            self.retry.route(message, e)
 
 if __name__ == '__main__':
     consumer = MessageConsumer()
@@ -0,0 +1,134 @@
+# chatbot/app/retry.py
+# 역할: 처리에 실패한 메시지를 단계별 retry 토픽(지수 backoff)으로 보내고, 시도 횟수 초과/재시도 불가 오류는 DLQ로 보낸다
+#   - <topic>.retry.<n> : n번째 재시도 대기 토픽, 지연 = RETRY_BASE_DELAY_SEC * RETRY_BACKOFF^(n-1) (상한 RETRY_MAX_DELAY_SEC)
+#   - <topic>.dlq       : 더 이상 재시도하지 않는 메시지 (실패 사유/오류 종류/원래 위치를 헤더에 기록)
+#   - 시도 횟수, 원래 토픽, 재처리 가능 시각은 헤더(x-retry-*)로 전달하고 key/기존 헤더/값은 그대로 유지
+#   - retry 토픽 메시지가 재처리 시각 전이면 그 파티션만 pause + seek 해두고 시각이 되면 resume
+#     (같은 tier의 메시지는 같은 지연을 가지므로 뒤의 메시지도 아직 대기 중 → 원래 토픽/다른 파티션은 계속 처리)
+
+import os
+import json
+import time
+import traceback
+
+from transport import TopicPartition
+
+RETRY_TIERS = int(os.environ.get('RETRY_TIERS', '3'))
+RETRY_BASE_DELAY_SEC = float(os.environ.get('RETRY_BASE_DELAY_SEC', '5'))
+RETRY_BACKOFF = float(os.environ.get('RETRY_BACKOFF', '6'))
+RETRY_MAX_DELAY_SEC = float(os.environ.get('RETRY_MAX_DELAY_SEC', '3600'))
+
+# 메시지 자체가 잘못된 경우(JSON 파싱 실패): 다시 시도해도 실패하므로 바로 DLQ
+# (그 밖의 ValueError/KeyError/TypeError는 처리 코드 쪽 오류일 수 있어 retry tier를 거친다)
+NON_RETRYABLE = (json.JSONDecodeError,)
+
+H_ATTEMPT = 'x-retry-attempt'
+H_ORIGINAL_TOPIC = 'x-retry-original-topic'
+H_NOT_BEFORE = 'x-retry-not-before'
+H_ERROR = 'x-retry-error'
+H_ERROR_TYPE = 'x-retry-error-type'
+H_ORIGIN = 'x-retry-origin'
+RETRY_HEADERS = (H_ATTEMPT, H_ORIGINAL_TOPIC, H_NOT_BEFORE, H_ERROR, H_ERROR_TYPE, H_ORIGIN)
+
+
+def retry_topic(topic: str, tier: int) -> str:
+    return f"{topic}.retry.{tier}"
+
+
+def dlq_topic(topic: str) -> str:
+    return f"{topic}.dlq"
+
+
+def retry_delay(tier: int) -> float:
+    return min(RETRY_BASE_DELAY_SEC * RETRY_BACKOFF ** (tier - 1), RETRY_MAX_DELAY_SEC)
+
+
+def _header(headers, name):
+    for k, v in headers or []:
+        if k == name:
+            return v.decode('utf-8') if isinstance(v, bytes) else v
+    return None
+
+
+class RetryRouter:
+    def __init__(self, producer, logger):
+        self.producer = producer
+        self.logger = logger
+        self.held = {}  # (topic, partition) -> 재처리 가능 시각(epoch sec)
+
+    @staticmethod
+    def topics(topics) -> list:
+        """구독 대상: 원래 토픽 + tier별 retry 토픽"""
+        return [t for topic in topics for t in [topic] + [retry_topic(topic, n) for n in range(1, RETRY_TIERS + 1)]]
+
+    @staticmethod
+    def original_topic(message) -> str:
+        return _header(message.headers(), H_ORIGINAL_TOPIC) or message.topic()
+
+    @staticmethod
+    def attempts(message) -> int:
+        return int(_header(message.headers(), H_ATTEMPT) or 0)
+
+    def hold(self, consumer, message) -> bool:
+        """
+        재처리 시각 전인 retry 메시지면 파티션을 pause 하고 그 오프셋으로 되돌린 뒤 True
+        이미 hold 중인 파티션의 메시지(같은 consume 배치의 뒤쪽 메시지)는 seek 없이 True
+        → 먼저 hold한 가장 앞 오프셋이 유지되어 resume 후 거기서부터 다시 읽는다
+        """
+        if (message.topic(), message.partition()) in self.held:
+            return True
+        not_before = _header(message.headers(), H_NOT_BEFORE)
+        if not_before is None or float(not_before) <= time.time():
+            return False
+        tp = TopicPartition(message.topic(), message.partition(), message.offset())
+        consumer.pause([tp])
+        consumer.seek(tp)
+        self.held[(message.topic(), message.partition())] = float(not_before)
+        return True
+
+    def release(self, consumer):
+        """재처리 시각이 지난 retry 파티션을 resume"""
+        now = time.time()
+        due = [tp for tp, not_before in self.held.items() if not_before <= now]
+        if due:
+            for tp in due:
+                del self.held[tp]
+            consumer.resume([TopicPartition(t, p) for t, p in due])
+
+    def active(self, partitions) -> list:
+        """hold 중인 retry 파티션을 제외 (backpressure resume 시 사용)"""
+        return [tp for tp in partitions if (tp.topic, tp.partition) not in self.held]
+
+    def forget(self, partitions):
+        for tp in partitions:
+            self.held.pop((tp.topic, tp.partition), None)
+
+    def route(self, message, error: BaseException) -> str:
+        """실패한 메시지를 다음 retry tier 또는 DLQ로 보내고 보낸 토픽을 반환"""
+        return self.route_value(message.topic(), message.value(), key=message.key(),
+                                headers=message.headers(), error=error,
+                                origin=f"{message.topic()}[{message.partition()}]@{message.offset()}")
+
+    def route_value(self, topic, value: bytes, key=None, headers=None, error: BaseException = None, origin=None) -> str:
+        original = _header(headers, H_ORIGINAL_TOPIC) or topic
+        attempt = int(_header(headers, H_ATTEMPT) or 0) + 1
+        reason = ''.join(traceback.format_exception_only(type(error), error)).strip()[:1000]
+
+        kept = [(k, v) for k, v in headers or [] if k not in RETRY_HEADERS]
+        kept += [(H_ATTEMPT, str(attempt)),
+                 (H_ORIGINAL_TOPIC, original),
+                 (H_ERROR, reason),
+                 (H_ERROR_TYPE, type(error).__name__),
+                 (H_ORIGIN, _header(headers, H_ORIGIN) or origin or topic)]
+
+        if isinstance(error, NON_RETRYABLE) or attempt > RETRY_TIERS:
+            target = dlq_topic(original)
+            self.logger.error(f"{topic} → {target} (attempt {attempt}) | key: {key} | reason: {reason}")
+        else:
+            target = retry_topic(original, attempt)
+            delay = retry_delay(attempt)
+            kept.append((H_NOT_BEFORE, f"{time.time() + delay:.3f}"))
+            self.logger.warning(f"{topic} → {target} in {delay:.0f}s (attempt {attempt}) | key: {key} | reason: {reason}")
+
+        self.producer.relay(target, value, key=key, headers=kept)
+        return target
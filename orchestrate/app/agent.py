@@ -1,35 +1,53 @@
+import os
 from typing import TypedDict
 from orchestrate.app.producer import MessageProducer
 from orchestrate.app.domain import ToTranslator, ToAuditor, ToSecurity
-from dataclasses import asdict
+from orchestrate.app.codec import convert
 
 producer = MessageProducer()
 
 class State(TypedDict):
     message: str
 
-def call_agent(request):
+def _key(message):
+    # 같은 사용자의 요청은 같은 파티션으로 (jobId는 null일 수 있어 key로 쓰지 않음, 값이 없으면 key 없이 전송)
+    return None if message.user_id is None else str(message.user_id)
+
+def lane_topic(topic, lane=None):
+    '''PRIORITY_TOPICS=1 이면 lane 전용 토픽(예: conversion.bulk)으로, 아니면 기존 토픽으로 보낸다 (받는 쪽 CONS_TOPIC에 lane 토픽 추가 필요)'''
+    if lane and os.environ.get('PRIORITY_TOPICS', '0') == '1':
+        return f"{topic}.{lane}"
+    return topic
+
+def _request_conversion(request, lane=None):
+    message = convert(ToTranslator, request)
+    producer.send_message(lane_topic('conversion', lane), message=message, key=_key(message))
+
+def _request_security(request, lane=None):
+    message = convert(ToSecurity, request)
+    producer.send_message(lane_topic('security', lane), message=message, key=_key(message))
+
+def _request_chatbot(request, lane=None):
+    producer.send_message(lane_topic('chatbot', lane), convert(ToAuditor, request))
+
+# eventType -> 처리 함수
+HANDLERS = {
+    'ConversionRequested': _request_conversion,
+    'SecurityRequested': _request_security,
+    'ChatbotRequested': _request_chatbot,
+}
+
+def call_agent(request, lane=None):
     '''
     request: {'eventType': 'ConversionRequested', 'timestamp': 1755069341605, 'jobId': None, 'userId': 11, 'filePath': None, 'inputeGovFrameVer': '3.8', 'outputeGovFrameVer': '3.10', 'isTestCode': True, 'conversionType': 'CODE'}
     '''
-    if request['eventType'] == 'ConversionRequested':
-        producer.send_message('conversion', message=asdict(ToTranslator(job_id=request['jobId'],
-                                                                        user_id=request['userId'],
-                                                                        file_path=request['filePath'],
-                                                                        input_egov_frame_ver=request['inputeGovFrameVer'],
-                                                                        output_egov_frame_ver=request['outputeGovFrameVer'],
-                                                                        is_test_code=request['isTestCode'],
-                                                                        conversion_type=request['conversionType'])))
-    elif request['eventType'] == 'SecurityRequested':
-        producer.send_message('security',message=asdict(ToSecurity(job_id=request['jobId'],
-                                                                   user_id=request['userId'],
-                                                                   filePath=request['filePath'])))
-    elif request['eventType'] == 'ChatbotRequested':
-        producer.send_message('chatbot', asdict(ToAuditor(id=request['id'])))
+    handler = HANDLERS.get(request.get('eventType'))
+    if handler is not None:
+        handler(request, lane)
 
 
 
 if __name__ == '__main__':
     # graph = build_agent()
     # graph.invoke({'message': 'test'})
-    call_agent({"id":1,"agentName":"TRANSLATOR"})
\ No newline at end of file
+    call_agent({"id":1,"agentName":"TRANSLATOR"})
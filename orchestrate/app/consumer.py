@@ -1,12 +1,19 @@
 from dotenv import load_dotenv
 import os
-from confluent_kafka import Consumer, KafkaException
+import time
+from orchestrate.app.transport import create_consumer, TopicPartition, TransportError
 import json
 from orchestrate.app.log import Logger
 from orchestrate.app.agent import call_agent
 from orchestrate.app.producer import MessageProducer
+from orchestrate.app.retry import RetryRouter
+from orchestrate.app.codec import loads, DecodeError
+from orchestrate.app.scheduler import LaneScheduler, OffsetTracker, LANE_BY_FINISH_AGENT, lane_of
 load_dotenv()
 
+# 에이전트 응답은 파싱 없이 원본 bytes/헤더 그대로 백엔드 토픽으로 전달
+RELAY_TOPICS = {'agent-res': 'python-message'}
+
 class MessageConsumer:
     def __init__(self):
         self.logger = Logger(name='consumer').logger
@@ -14,65 +21,132 @@ class MessageConsumer:
         self.topic = os.environ.get('CONS_TOPIC')
         self.group_id = os.environ.get('GROUP_ID')
         self.auto_offset_reset = os.environ.get('AUTO_OFFSET_RESET')
-        self.consumer = Consumer({
+        self.batch_size = int(os.environ.get('CONSUME_BATCH_SIZE', '500'))
+        self.max_queued = int(os.environ.get('LANE_MAX_QUEUED', '1000'))  # 대기 요청이 이만큼 쌓이면 요청 파티션 pause
+        self.metrics_interval = float(os.environ.get('LANE_METRICS_INTERVAL_SEC', '60'))
+        self.consumer = create_consumer({
                                     'bootstrap.servers': self.broker,
                                     'group.id': self.group_id, # consumer의 id
                                     'auto.offset.reset': self.auto_offset_reset,  # 처음 실행시 가장 마지막 offset부터
-                                    'max.poll.interval.ms': 1800000
+                                    'max.poll.interval.ms': 1800000,
+                                    'enable.auto.offset.store': False  # dispatch(또는 relay/retry/DLQ 전송)가 끝난 메시지만 커밋 대상
                                 })
-        self.consumer.subscribe([t for t in self.topic.split(',')])
         self.producer = MessageProducer()
+        self.retry = RetryRouter(self.producer, self.logger)
+        self.scheduler = LaneScheduler()
+        self.offsets = OffsetTracker()
+        self.paused = []
+        self._metrics_at = time.monotonic()
+        self.consumer.subscribe(self.retry.topics(self.topic.split(',')), on_revoke=self._on_revoke)
+
+    def _on_revoke(self, consumer, partitions):
+        # 큐에 남은(커밋되지 않은) 요청은 새 담당 consumer가 다시 읽으므로 버린다
+        revoked = {(tp.topic, tp.partition) for tp in partitions}
+        dropped = self.scheduler.drop(revoked)
+        if dropped:
+            self.logger.info(f"revoked {sorted(revoked)} → dropped {dropped} queued request(s)")
+        for topic, partition in revoked:
+            self.offsets.forget(topic, partition)
+        self.retry.forget(partitions)
+        self.paused = [tp for tp in self.paused if (tp.topic, tp.partition) not in revoked]
 
     def consume(self):
         try:
             print(f"start consume: {self.topic}")
             while True:
-                message = self.consumer.poll(1.0)
-                if message is None:
-                    continue
-                if message.error():
-                    print(f"Kafka error: {message.error()}")
-                else:
-                    print("Headers:")
-                    if message.headers():
-                        for header in message.headers():
-                            key, value = header
-                            print(f"  {key}: {value.decode('utf-8') if value else None}")
-                            
-                    self.handle_message(message)
-        except KafkaException as e:
+                self.step()
+        except TransportError as e:
             self.logger.error(e)
         finally:
             self.consumer.close()
+            self.producer.close()
+
+    def step(self, timeout: float = 1.0):
+        '''consume loop 1회: 받기 → lane 큐잉/relay → weighted-fair dispatch → 처리 끝난 연속 구간 오프셋 저장'''
+        self.retry.release(self.consumer)
+        messages = self.consumer.consume(num_messages=self.batch_size, timeout=timeout)
+        for message in messages:
+            if message.error():
+                print(f"Kafka error: {message.error()}")
+            elif not self.retry.hold(self.consumer, message):
+                self.offsets.track(message.topic(), message.partition(), message.offset())
+                self.handle_message(message)
+        self.dispatch()
+        self.store_offsets()
+        self.backpressure()
+
+    def _done(self, message):
+        self.offsets.done(message.topic(), message.partition(), message.offset())
 
     def handle_message(self, message):
+        '''java-message 요청은 lane 큐에 넣고(dispatch는 dispatch()에서), 그 밖의 메시지는 여기서 처리를 끝낸다'''
         try:
-            request = json.loads(message.value().decode('utf-8'))
-
-            self.logger.info(f"{message.topic()} | key: {message.key()} | value: {request}")
-
-            if message.topic() == 'java-message':
-                call_agent(request)
-            elif message.topic() == 'agent-res':
-                print('!!!!!!!!!!!!!!!!!!!')
-                self.producer.send_message('python-message', request, headers=message.headers())
-
-                ## 에이전트 별로 처리가 필요할 때 사용
-                # if message.headers():
-                #     for header in message.headers():
-                #         key, value = header
-                #         value = value.decode('utf-8') if value else None
-                #         if (key, value) == ('AGENT', 'ANALYSIS'):
-                #             self.producer.send_message('java', request)
-                #         elif (key, value) == ('AGENT', 'EGOV'):
-                #             self.producer.send_message('java', request)
-                            
-                # with open("agent_test5.json", "w", encoding='utf-8') as json_file:
-                #     json.dump(request, json_file, ensure_ascii=False, indent=2)
+            topic = self.retry.original_topic(message)
+            relay_topic = RELAY_TOPICS.get(topic)
+            if relay_topic:
+                self.logger.info(f"{message.topic()} → {relay_topic} | key: {message.key()} | headers: {message.headers()} | bytes: {len(message.value() or b'')}")
+                self.producer.relay(relay_topic, message.value(), key=message.key(), headers=message.headers())
+                self._complete(message)
+            else:
+                request = loads(message.value())
+
+                self.logger.info(f"{message.topic()} | key: {message.key()} | headers: {message.headers()} | value: {request}")
+
+                lane = lane_of(request) if topic == 'java-message' else None
+                if lane is not None:
+                    self.scheduler.push(lane, request, source=message)
+                    return
 
         except Exception as e:
             self.logger.exception(e)
+            self.retry.route(message, e)
+        self._done(message)
+
+    def _complete(self, message):
+        '''작업 종료 이벤트(EGOV/SECU)면 그 lane의 in-flight 1건 반납 (relay는 원본 그대로, 여기서만 payload를 읽는다)'''
+        agent = dict(message.headers() or []).get('AGENT')
+        agent = agent.decode('utf-8') if isinstance(agent, bytes) else agent
+        if agent not in LANE_BY_FINISH_AGENT:
+            return
+        try:
+            self.scheduler.complete(agent, loads(message.value()))
+        except DecodeError:
+            pass
+
+    def dispatch(self):
+        '''lane 가중치/tenant 순서대로, in-flight 상한 안에서 대기 요청을 에이전트 토픽으로 보낸다'''
+        self.scheduler.expire()
+        for lane, request, source, waited in self.scheduler.drain():
+            try:
+                call_agent(request, lane=lane)
+                self.scheduler.started(lane, request)
+            except Exception as e:
+                self.logger.exception(e)
+                if source is not None:
+                    self.retry.route(source, e)
+            if source is not None:
+                self._done(source)
+
+        if time.monotonic() - self._metrics_at >= self.metrics_interval:
+            self._metrics_at = time.monotonic()
+            self.logger.info(f"lane metrics: {json.dumps(self.scheduler.metrics())}")
+
+    def store_offsets(self):
+        committable = self.offsets.committable()
+        if committable:
+            self.consumer.store_offsets(offsets=[TopicPartition(t, p, offset) for (t, p), offset in committable.items()])
+
+    def backpressure(self):
+        '''대기 요청이 LANE_MAX_QUEUED 이상이면 요청 파티션만 pause (agent-res는 계속 받아야 in-flight가 줄어든다)'''
+        if len(self.scheduler) >= self.max_queued:
+            if not self.paused:
+                relay_sources = set(self.retry.topics(RELAY_TOPICS))
+                self.paused = [tp for tp in self.retry.active(self.consumer.assignment()) if tp.topic not in relay_sources]
+                self.consumer.pause(self.paused)
+        elif self.paused:
+            self.consumer.resume(self.retry.active(self.paused))
+            self.paused = []
 
 if __name__ == '__main__':
     consumer = MessageConsumer()
-    consumer.consume()
\ No newline at end of file
+    consumer.consume()
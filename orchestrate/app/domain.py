@@ -3,9 +3,9 @@ from typing import Optional
 
 @dataclass
 class ToTranslator:
-    job_id: int
+    job_id: Optional[int]      # ConversionRequested 시점에는 아직 없을 수 있음 (jobId: null)
     user_id: int
-    file_path: str
+    file_path: Optional[str]   # 업로드 전 요청은 filePath: null
     input_egov_frame_ver: str
     output_egov_frame_ver: str
     is_test_code: bool
@@ -13,9 +13,9 @@ class ToTranslator:
 
 @dataclass
 class ToSecurity:
-    job_id: int
+    job_id: Optional[int]
     user_id: int
-    filePath: str
+    filePath: Optional[str]    # 비어 있으면 security consumer가 FAIL_BAD_REQUEST로 회신
 
 @dataclass
 class ToAuditor:
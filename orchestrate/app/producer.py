@@ -1,30 +1,88 @@
 from dotenv import load_dotenv
 import os
-from confluent_kafka import Producer
-import json
+import atexit
+import threading
+from orchestrate.app.transport import create_producer
 from orchestrate.app.log import Logger
+from orchestrate.app.codec import dumps
 
 load_dotenv()
 
 class MessageProducer:
-    def __init__(self):
+    '''
+    프로세스 전역에서 하나의 librdkafka Producer를 공유한다.
+    - produce()는 비동기로 큐에 적재만 하고, delivery report는 백그라운드 poll 스레드가 처리
+    - linger/batch 설정은 환경변수로 조정
+    - 종료 시(atexit) 한 번만 flush
+    '''
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._init_producer()
+                cls._instance = instance
+        return cls._instance
+
+    def _init_producer(self):
         self.logger = Logger(name='producer').logger
         self.broker = os.environ.get('KAFKA_SERVER')
-        self.producer = Producer({
+        self.flush_timeout = float(os.environ.get('PRODUCER_FLUSH_TIMEOUT', '30'))
+        self.producer = create_producer({
                                     'bootstrap.servers': self.broker,
+                                    'linger.ms': int(os.environ.get('PRODUCER_LINGER_MS', '20')),
+                                    'batch.num.messages': int(os.environ.get('PRODUCER_BATCH_NUM_MESSAGES', '10000')),
+                                    'batch.size': int(os.environ.get('PRODUCER_BATCH_SIZE', '1048576')),
+                                    'compression.type': os.environ.get('PRODUCER_COMPRESSION', 'none'),
                                 })
-    
+        self._closed = threading.Event()
+        self._poller = threading.Thread(target=self._poll_loop, name='producer-poll', daemon=True)
+        self._poller.start()
+        atexit.register(self.close)
+
+    def _poll_loop(self):
+        # delivery callback은 poll()을 호출한 스레드에서 실행된다
+        while not self._closed.is_set():
+            self.producer.poll(0.1)
+
     def delivery_callback(self, err, msg):
         if err:
             self.logger.error('ERROR: Message failed delivery: {}'.format(err))
         else:
-            self.logger.info(f"Produced event to {msg.topic()} | key: {msg.key()} | value: {json.loads(msg.value().decode('utf-8'))}")
-            
-    def send_message(self, topic, message: dict, headers=None):
-        message = json.dumps(message, ensure_ascii=False).encode('utf-8')
-        self.producer.produce(topic, value=message, headers=headers, callback=self.delivery_callback)
-        self.producer.flush()
+            self.logger.info(f"Produced event to {msg.topic()} [{msg.partition()}] @ {msg.offset()} | key: {msg.key()} | bytes: {len(msg.value() or b'')}")
+
+    def send_message(self, topic, message, headers=None, key=None):
+        '''message: dict 또는 도메인 dataclass (codec으로 UTF-8 JSON 직렬화)'''
+        message = dumps(message)
+        self._produce(topic, value=message, key=key, headers=headers)
+
+    def relay(self, topic, value: bytes, key=None, headers=None):
+        '''이미 직렬화된 메시지를 파싱/재직렬화 없이 그대로 전달'''
+        self._produce(topic, value=value, key=key, headers=headers)
+
+    def _produce(self, topic, value, key=None, headers=None):
+        while True:
+            try:
+                self.producer.produce(topic, value=value, key=key, headers=headers, callback=self.delivery_callback)
+                return
+            except BufferError:
+                # 로컬 큐가 가득 찬 경우: delivery report가 빠질 때까지 잠시 대기 후 재시도
+                self.producer.poll(0.5)
+
+    def flush(self, timeout=None):
+        return self.producer.flush(self.flush_timeout if timeout is None else timeout)
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        remaining = self.flush()
+        self._closed.set()
+        self._poller.join(timeout=1.0)
+        if remaining:
+            self.logger.error(f'{remaining} message(s) were not delivered before shutdown')
 
 if __name__ == '__main__':
     producer = MessageProducer()
-    producer.send_message("test")
+    producer.send_message("test", {})
@@ -0,0 +1,231 @@
+# orchestrate/app/scheduler.py
+# 역할: java-message 요청을 우선순위 lane(eventType) x tenant(userId)별로 큐잉하고 weighted-fair 하게 dispatch
+#   - lane 간: smooth weighted round-robin (LANE_WEIGHTS 비율대로 섞어서 내보냄, 큰 변환 작업이 몰려도 대화형 요청이 먼저 나감)
+#   - lane 내부: tenant 간 round-robin (한 사용자의 대량 요청이 다른 사용자를 막지 않음)
+#   - lane별 in-flight 상한(LANE_MAX_INFLIGHT): dispatch 후 agent-res 종료 이벤트가 올 때까지 1건으로 센다.
+#     상한에 닿은 lane은 건너뛰므로 bulk 요청은 orchestrate에 남고, 그 사이 다른 lane이 먼저 나간다.
+#     종료 이벤트는 (userId, jobId)로 맞추고 jobId가 null이면 같은 사용자의 가장 오래된 null 건과 맞춘다.
+#     종료 이벤트가 오지 않는 건(작업 유실 등)은 LANE_INFLIGHT_TIMEOUT_SEC 뒤 자리를 반납한다.
+#   - lane별 대기 건수(depth)/대기 시간(wait)/in-flight 수를 metrics()로 노출
+#   - OffsetTracker: 큐에 남은 요청은 커밋하지 않도록 파티션별로 dispatch가 끝난 연속 구간까지만 커밋 대상으로 계산
+
+import os
+import time
+from collections import OrderedDict, deque
+
+LANE_INTERACTIVE = 'interactive'
+LANE_STANDARD = 'standard'
+LANE_BULK = 'bulk'
+
+LANE_BY_EVENT = {
+    'ChatbotRequested': LANE_INTERACTIVE,
+    'SecurityRequested': LANE_STANDARD,
+    'ConversionRequested': LANE_BULK,
+}
+
+# agent-res AGENT 헤더 → 작업이 끝났음을 알리는 lane (진행 이벤트와 달리 종료 이벤트에는 status가 있다)
+#   변환은 마지막 단계(EGOV), 보안 점검은 SECU 종료 이벤트 1건으로 끝난다. 챗봇은 종료 이벤트가 없어 상한을 두지 않는다.
+LANE_BY_FINISH_AGENT = {
+    'EGOV': LANE_BULK,
+    'SECU': LANE_STANDARD,
+}
+
+DEFAULT_WEIGHTS = {LANE_INTERACTIVE: 8, LANE_STANDARD: 4, LANE_BULK: 1}
+DEFAULT_MAX_INFLIGHT = {LANE_INTERACTIVE: 0, LANE_STANDARD: 8, LANE_BULK: 4}   # 0: 상한 없음
+
+LANE_INFLIGHT_TIMEOUT_SEC = float(os.environ.get('LANE_INFLIGHT_TIMEOUT_SEC', '3600'))
+
+
+def _lane_setting(name: str, defaults: dict, minimum: int) -> dict:
+    """<name>=interactive:8,standard:4,bulk:1 형식의 환경변수로 lane별 값 재정의"""
+    values = dict(defaults)
+    for item in filter(None, os.environ.get(name, '').split(',')):
+        lane, _, value = item.partition(':')
+        values[lane.strip()] = max(minimum, int(value))
+    return values
+
+
+def lane_weights() -> dict:
+    return _lane_setting('LANE_WEIGHTS', DEFAULT_WEIGHTS, 1)
+
+
+def lane_limits() -> dict:
+    return _lane_setting('LANE_MAX_INFLIGHT', DEFAULT_MAX_INFLIGHT, 0)
+
+
+def lane_of(request: dict):
+    """처리할 수 없는 eventType이면 None"""
+    return LANE_BY_EVENT.get(request.get('eventType'))
+
+
+def _id(value):
+    return None if value is None else str(value)
+
+
+def tenant_of(request: dict):
+    return _id(request.get('tenantId') or request.get('userId'))
+
+
+class LaneScheduler:
+    def __init__(self, weights: dict = None, limits: dict = None, inflight_timeout: float = None):
+        self.weights = weights or lane_weights()
+        self.limits = {lane: 0 for lane in self.weights}
+        self.limits.update(lane_limits() if limits is None else limits)
+        self.inflight_timeout = LANE_INFLIGHT_TIMEOUT_SEC if inflight_timeout is None else inflight_timeout
+        self.lanes = {lane: OrderedDict() for lane in self.weights}   # lane -> tenant -> deque[(enqueued_at, request, source)]
+        self.inflight = {lane: deque() for lane in self.weights}      # lane -> deque[(tenant, job_id, dispatched_at)]
+        self.current = {lane: 0 for lane in self.weights}
+        self.stats = {lane: {'dispatched': 0, 'completed': 0, 'expired': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+                      for lane in self.weights}
+
+    def push(self, lane: str, request: dict, source=None):
+        """source: 요청을 담고 있던 원본 메시지 (dispatch 후 오프셋 처리/retry 라우팅용)"""
+        self.lanes[lane].setdefault(tenant_of(request), deque()).append((time.monotonic(), request, source))
+
+    def depth(self, lane: str) -> int:
+        return sum(len(q) for q in self.lanes[lane].values())
+
+    def __len__(self):
+        return sum(self.depth(lane) for lane in self.lanes)
+
+    def has_capacity(self, lane: str) -> bool:
+        limit = self.limits.get(lane, 0)
+        return not limit or len(self.inflight[lane]) < limit
+
+    def _pick_lane(self):
+        active = [lane for lane, tenants in self.lanes.items() if tenants and self.has_capacity(lane)]
+        if not active:
+            return None
+        total = 0
+        for lane in active:
+            self.current[lane] += self.weights[lane]
+            total += self.weights[lane]
+        lane = max(active, key=lambda l: self.current[l])
+        self.current[lane] -= total
+        return lane
+
+    def pop(self):
+        """다음 요청 (lane, request, source, waited_sec) 또는 None (대기 요청이 없거나 모든 lane이 in-flight 상한)"""
+        lane = self._pick_lane()
+        if lane is None:
+            return None
+        tenants = self.lanes[lane]
+        tenant, queue = next(iter(tenants.items()))
+        enqueued_at, request, source = queue.popleft()
+        del tenants[tenant]
+        if queue:
+            tenants[tenant] = queue  # 다음 차례를 위해 맨 뒤로
+
+        waited = time.monotonic() - enqueued_at
+        stat = self.stats[lane]
+        stat['wait_total'] += waited
+        stat['wait_max'] = max(stat['wait_max'], waited)
+        return lane, request, source, waited
+
+    def drain(self):
+        """
+        보낼 수 있는 요청을 weighted-fair 순서로 꺼낸다.
+        꺼낸 요청을 보냈으면 다음 요청을 꺼내기 전에 started()를 호출해야 in-flight 상한이 반영된다.
+        """
+        while True:
+            item = self.pop()
+            if item is None:
+                return
+            yield item
+
+    def started(self, lane: str, request: dict):
+        """dispatch 완료 → 종료 이벤트(complete) 또는 timeout(expire) 전까지 in-flight"""
+        self.stats[lane]['dispatched'] += 1
+        if self.limits.get(lane, 0):
+            self.inflight[lane].append((tenant_of(request), _id(request.get('jobId')), time.monotonic()))
+
+    def complete(self, agent: str, message: dict) -> bool:
+        """agent-res 종료 이벤트로 in-flight 1건 반납. 맞는 건이 없으면(재시작 전 dispatch, 이미 timeout 등) False"""
+        lane = LANE_BY_FINISH_AGENT.get(agent)
+        if lane not in self.inflight or not isinstance(message, dict) or message.get('status') is None:
+            return False
+        tenant, job_id = tenant_of(message), _id(message.get('jobId'))
+        inflight = self.inflight[lane]
+        match = next((entry for entry in inflight if entry[:2] == (tenant, job_id)), None)
+        if match is None:
+            match = next((entry for entry in inflight if entry[:2] == (tenant, None)), None)
+        if match is None:
+            return False
+        inflight.remove(match)
+        self.stats[lane]['completed'] += 1
+        return True
+
+    def expire(self):
+        """LANE_INFLIGHT_TIMEOUT_SEC 안에 종료 이벤트가 오지 않은 in-flight 건을 반납"""
+        deadline = time.monotonic() - self.inflight_timeout
+        for lane, inflight in self.inflight.items():
+            while inflight and inflight[0][2] <= deadline:
+                inflight.popleft()
+                self.stats[lane]['expired'] += 1
+
+    def drop(self, partitions) -> int:
+        """revoke된 파티션((topic, partition))에서 온 대기 요청을 버린다 (커밋되지 않았으므로 새 담당 consumer가 다시 읽는다)"""
+        dropped = 0
+        for tenants in self.lanes.values():
+            for tenant in list(tenants):
+                queue = tenants[tenant]
+                kept = deque(entry for entry in queue
+                             if entry[2] is None or (entry[2].topic(), entry[2].partition()) not in partitions)
+                dropped += len(queue) - len(kept)
+                if kept:
+                    tenants[tenant] = kept
+                else:
+                    del tenants[tenant]
+        return dropped
+
+    def metrics(self) -> dict:
+        now = time.monotonic()
+        result = {}
+        for lane, tenants in self.lanes.items():
+            stat = self.stats[lane]
+            oldest = min((q[0][0] for q in tenants.values() if q), default=None)
+            result[lane] = {
+                'depth': self.depth(lane),
+                'tenants': len(tenants),
+                'inflight': len(self.inflight[lane]),
+                'inflight_limit': self.limits.get(lane, 0),
+                'dispatched': stat['dispatched'],
+                'completed': stat['completed'],
+                'expired': stat['expired'],
+                'wait_avg_ms': round(stat['wait_total'] / stat['dispatched'] * 1000, 1) if stat['dispatched'] else 0.0,
+                'wait_max_ms': round(stat['wait_max'] * 1000, 1),
+                'oldest_wait_ms': round((now - oldest) * 1000, 1) if oldest is not None else 0.0,
+            }
+        return result
+
+
+class OffsetTracker:
+    """파티션별로 받은 오프셋과 처리(dispatch/relay/retry 라우팅) 완료 여부를 추적하여 커밋 가능한 위치를 계산"""
+    def __init__(self):
+        self.partitions = {}  # (topic, partition) -> OrderedDict[offset, done]
+
+    def track(self, topic, partition, offset):
+        self.partitions.setdefault((topic, partition), OrderedDict())[offset] = False
+
+    def done(self, topic, partition, offset):
+        offsets = self.partitions.get((topic, partition))
+        if offsets is not None and offset in offsets:
+            offsets[offset] = True
+
+    def committable(self):
+        """{(topic, partition): next_offset} — 앞에서부터 연속으로 완료된 구간까지만"""
+        result = {}
+        for tp, offsets in self.partitions.items():
+            last = None
+            while offsets:
+                offset, finished = next(iter(offsets.items()))
+                if not finished:
+                    break
+                offsets.popitem(last=False)
+                last = offset
+            if last is not None:
+                result[tp] = last + 1
+        return result
+
+    def forget(self, topic, partition):
+        self.partitions.pop((topic, partition), None)
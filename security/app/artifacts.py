@@ -0,0 +1,114 @@
+# security/app/artifacts.py
+# 역할: claim-check 패턴으로 큰 결과 payload를 메시지 밖(artifact store)으로 분리
+#   - 직렬화 크기가 CLAIM_CHECK_THRESHOLD_BYTES 이하면 기존처럼 'result'에 inline
+#   - 초과하면 zstd 압축 후 저장소(로컬 디렉토리 또는 s3://, S3 호환 endpoint 지원)에 저장하고
+#     메시지에는 'resultRef'(위치/코덱/크기/해시)와 'manifest'(최상위 항목 요약)만 담는다
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from security.app.utils import _is_s3_uri, _parse_s3_uri
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 환경에서는 zlib로 대체
+    zstandard = None
+import zlib
+
+ARTIFACT_STORE = os.environ.get('ARTIFACT_STORE', str(Path(__file__).resolve().parent / "artifacts"))
+CLAIM_CHECK_THRESHOLD_BYTES = int(os.environ.get('CLAIM_CHECK_THRESHOLD_BYTES', str(512 * 1024)))
+
+
+def _compress(raw: bytes):
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=int(os.environ.get('ARTIFACT_ZSTD_LEVEL', '3'))).compress(raw), 'zstd'
+    return zlib.compress(raw, 6), 'zlib'
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd artifacts")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == 'zlib':
+        return zlib.decompress(data)
+    return data
+
+
+def _s3_client():
+    import boto3
+    return boto3.client("s3", endpoint_url=os.environ.get('ARTIFACT_S3_ENDPOINT') or None)
+
+
+def _put(key: str, data: bytes) -> str:
+    if _is_s3_uri(ARTIFACT_STORE):
+        bucket, prefix = _parse_s3_uri(ARTIFACT_STORE)
+        object_key = f"{prefix.rstrip('/')}/{key}" if prefix else key
+        _s3_client().put_object(Bucket=bucket, Key=object_key, Body=data)
+        return f"s3://{bucket}/{object_key}"
+    path = Path(ARTIFACT_STORE) / key
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return path.resolve().as_uri()
+
+
+def _get(uri: str) -> bytes:
+    if _is_s3_uri(uri):
+        bucket, key = _parse_s3_uri(uri)
+        return _s3_client().get_object(Bucket=bucket, Key=key)['Body'].read()
+    return Path(url2pathname(urlparse(uri).path)).read_bytes()
+
+
+def build_manifest(result) -> dict:
+    """최상위 항목별 종류/개수/직렬화 크기 (리스트의 원소가 name을 가지면 이름 목록 포함)"""
+    if not isinstance(result, dict):
+        return {}
+    manifest = {}
+    for k, v in result.items():
+        entry = {'type': type(v).__name__,
+                 'bytes': len(json.dumps(v, ensure_ascii=False, default=str).encode('utf-8'))}
+        if isinstance(v, (list, dict)):
+            entry['count'] = len(v)
+        if isinstance(v, list) and v and all(isinstance(x, dict) and 'name' in x for x in v):
+            entry['names'] = [x['name'] for x in v]
+        manifest[k] = entry
+    return manifest
+
+
+def offload_result(job_id, name: str, result) -> dict:
+    """메시지에 병합할 필드를 반환: {'result': ...} 또는 {'resultRef': ..., 'manifest': ...}"""
+    raw = json.dumps(result, ensure_ascii=False, default=str).encode('utf-8')
+    if len(raw) <= CLAIM_CHECK_THRESHOLD_BYTES:
+        return {'result': result}
+
+    digest = hashlib.sha256(raw).hexdigest()
+    data, codec = _compress(raw)
+    uri = _put(f"{job_id}/{name}-{digest[:16]}.json.{codec}", data)
+    return {
+        'resultRef': {
+            'uri': uri,
+            'codec': codec,
+            'contentType': 'application/json',
+            'size': len(raw),
+            'compressedSize': len(data),
+            'sha256': digest,
+        },
+        'manifest': build_manifest(result),
+    }
+
+
+def load_result(message: dict):
+    """offload_result로 만든 필드(inline 또는 reference)에서 원래 결과를 복원"""
+    ref = message.get('resultRef')
+    if not ref:
+        return message.get('result')
+    raw = _decompress(_get(ref['uri']), ref.get('codec'))
+    if hashlib.sha256(raw).hexdigest() != ref.get('sha256'):
+        raise ValueError(f"artifact checksum mismatch: {ref['uri']}")
+    return json.loads(raw.decode('utf-8'))
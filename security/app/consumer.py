@@ -1,10 +1,14 @@
 from dotenv import load_dotenv
 import os
-from confluent_kafka import Consumer, KafkaException
-import json
+from security.app.transport import create_consumer, TransportError
 from security.app.log import Logger
 from security.app.producer import MessageProducer
+from security.app.progress import ProgressStream
 from security.app.security_pipeline import run_security_pipeline
+from security.app.ledger import JobLedger, input_digest
+from security.app.retry import RetryRouter
+from security.app.codec import loads, convert, lookup, DecodeError
+from security.app.domain import ToSecurity
 load_dotenv()
 
 class MessageConsumer:
@@ -14,64 +18,92 @@ class MessageConsumer:
         self.topic = os.environ.get('CONS_TOPIC')
         self.group_id = os.environ.get('GROUP_ID')
         self.auto_offset_reset = os.environ.get('AUTO_OFFSET_RESET')
-        self.consumer = Consumer({
+        self.consumer = create_consumer({
                                     'bootstrap.servers': self.broker,
                                     'group.id': self.group_id, # consumer의 id
-                                    'auto.offset.reset': self.auto_offset_reset  # 처음 실행시 가장 마지막 offset부터
+                                    'auto.offset.reset': self.auto_offset_reset,  # 처음 실행시 가장 마지막 offset부터
+                                    'enable.auto.offset.store': False  # 처리(또는 retry/DLQ 전송)가 끝난 메시지만 커밋 대상
                                 })
-        self.consumer.subscribe([self.topic])
         self.producer = MessageProducer()
+        self.retry = RetryRouter(self.producer, self.logger)
+        self.consumer.subscribe(self.retry.topics(self.topic.split(',')))
+        self.progress = ProgressStream()
+        self.ledger = JobLedger()
 
     def consume(self):
         try:
             print(f"start consume: {self.topic}")
 
             while True:
+                self.retry.release(self.consumer)
                 message = self.consumer.poll(1.0)
                 if message is None:
                     continue
                 if message.error():
                     print(f"Kafka error: {message.error()}")
-                else:
+                elif not self.retry.hold(self.consumer, message):
                     self.handle_message(message)
-        except KafkaException as e:
+                    self.consumer.store_offsets(message)
+        except TransportError as e:
             self.logger.error(e)
         finally:
             self.consumer.close()
+            self.producer.close()
 
     def handle_message(self, message):
         try:
-            request = json.loads(message.value().decode('utf-8'))
+            raw = loads(message.value())
 
-            self.logger.info(f"{message.topic()} | key: {message.key()} | value: {request}")
+            self.logger.info(f"{message.topic()} | key: {message.key()} | value: {raw}")
             
             # call_agent(request)
 
-            # --- 파이프라인 실행에 필요한 필드만 추출 ---
-            user_id   = request.get('user_id')   or request.get('userId')
-            job_id    = request.get('job_id')    or request.get('jobId')
-            file_path = request.get('file_path') or request.get('filePath')     # s3://, http(s)://, 로컬 zip/폴더 OK
+            # --- 파이프라인 실행에 필요한 필드를 검증된 구조체로 (user_id/userId 등 표기 무관) ---
+            try:
+                request = convert(ToSecurity, raw)
+                # codec은 null jobId/filePath도 받아들이지만 보안 점검에는 셋 다 필요 (jobId는 원장 key)
+                missing = [name for name, value in (('userId', request.user_id), ('jobId', request.job_id),
+                                                    ('filePath', request.filePath)) if value in (None, '')]
+                reason = f"missing fields: {', '.join(missing)}" if missing else None
+            except DecodeError as e:
+                request, reason = None, str(e)
 
-            # 필수 값 검증
-            missing = [k for k, v in {'userId': user_id, 'jobId': job_id, 'filePath': file_path}.items() if v in (None, '')]
-            if missing:
+            # 필수 값 검증 실패: 파이프라인을 돌리지 않고 바로 실패 회신
+            if reason:
+                fields = raw if isinstance(raw, dict) else {}
                 payload = {
                     "eventType": "SecurityFinished",
-                    "userId": user_id,
-                    "jobId": job_id,
+                    "userId": lookup(fields, 'user_id'),
+                    "jobId": lookup(fields, 'job_id'),
                     "status": "FAIL_BAD_REQUEST",
                     "exitCode": 1,
-                    "reason": f"missing fields: {', '.join(missing)}"
+                    "reason": reason
                 }
-                self.producer.send_message('agent-res', payload, headers=[('AGENT', 'SECU')])
+                self.progress.finish(payload, agent='SECU')
+                return
+
+            user_id, job_id = request.user_id, request.job_id
+            file_path = request.filePath     # s3://, http(s)://, 로컬 zip/폴더 OK
+
+            # --- 이미 완료된 (jobId, 입력) 이면 파이프라인을 다시 돌리지 않고 저장된 결과를 회신 ---
+            digest = input_digest(file_path)
+            done, stored = self.ledger.completed_result(job_id, digest)
+            if done:
+                self.logger.info(f"job {job_id} already completed → resend stored result")
+                self.progress.finish(stored, agent='SECU')
                 return
 
             # --- 단일 실행 파이프라인 호출 (중간 체크포인트/로그는 pipeline에서 처리) ---
-            result = run_security_pipeline(
-                user_id=user_id,
-                job_id=job_id,
-                file_path=file_path
-            )
+            self.ledger.start(job_id, digest)
+            try:
+                result = run_security_pipeline(
+                    user_id=user_id,
+                    job_id=job_id,
+                    file_path=file_path
+                )
+            except Exception as e:
+                self.ledger.fail(job_id, digest, repr(e))
+                raise
             # result에는 status, exitCode, projectKey, projectRootPath, projectRootName, outputsDir, checkpoints 포함
 
             # --- 결과 회신 (토픽/헤더는 기존 유지) ---
@@ -81,10 +113,15 @@ class MessageConsumer:
                 "jobId": job_id,
                 **result
             }
-            self.producer.send_message('agent-res', payload, headers=[('AGENT', 'SECU')])
+            if result.get('status') == 'SUCCESS':
+                self.ledger.complete(job_id, digest, payload)
+            else:
+                self.ledger.fail(job_id, digest, str(result.get('status')))
+            self.progress.finish(payload, agent='SECU')
 
         except Exception as e:
             self.logger.exception(e)
+            self.retry.route(message, e)
 
 if __name__ == '__main__':
     consumer = MessageConsumer()
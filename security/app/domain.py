@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# orchestrate → security 토픽 메시지 (orchestrate/app/domain.py의 ToSecurity와 동일해야 함)
+@dataclass
+class ToSecurity:
+    job_id: Optional[int]
+    user_id: int
+    filePath: Optional[str]    # 비어 있으면 security consumer가 FAIL_BAD_REQUEST로 회신
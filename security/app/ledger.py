@@ -0,0 +1,97 @@
+# security/app/ledger.py
+# 역할: 재전달(재시작/리밸런스로 인한 replay)된 요청을 다시 실행하지 않도록 하는 로컬 멱등성 원장(SQLite)
+#   - key: (jobId, 입력 content hash)
+#   - status: RUNNING / DONE / FAILED, 결과는 JSON 파일로 저장하고 위치만 기록
+#   - DONE이면 저장된 결과를 반환, RUNNING/FAILED면 다시 실행 (RUNNING은 이전 프로세스가 중단된 경우)
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from security.app.utils import _is_s3_uri, _is_http_uri
+
+LEDGER_DIR = Path(os.environ.get('JOB_LEDGER_DIR', Path(__file__).resolve().parent / "ledger"))
+
+STATUS_RUNNING = 'RUNNING'
+STATUS_DONE = 'DONE'
+STATUS_FAILED = 'FAILED'
+
+
+def input_digest(file_path: str) -> str:
+    """로컬 파일은 내용의 SHA-256, 원격(s3/http) 입력은 URI 자체의 SHA-256"""
+    h = hashlib.sha256()
+    if not (_is_s3_uri(file_path) or _is_http_uri(file_path)) and os.path.isfile(file_path):
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+    else:
+        h.update(str(file_path).encode('utf-8'))
+    return h.hexdigest()
+
+
+class JobLedger:
+    def __init__(self, directory: Path = LEDGER_DIR):
+        self.directory = Path(directory)
+        self.results_dir = self.directory / "results"
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.directory / "jobs.db"), timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id          TEXT NOT NULL,
+                input_hash      TEXT NOT NULL,
+                status          TEXT NOT NULL,
+                result_location TEXT,
+                error           TEXT,
+                updated_at      REAL NOT NULL,
+                PRIMARY KEY (job_id, input_hash)
+            )
+        """)
+
+    def lookup(self, job_id, input_hash: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT status, result_location, error, updated_at FROM jobs WHERE job_id = ? AND input_hash = ?",
+            (str(job_id), input_hash)).fetchone()
+        if row is None:
+            return None
+        return {'status': row[0], 'result_location': row[1], 'error': row[2], 'updated_at': row[3]}
+
+    def _upsert(self, job_id, input_hash, status, result_location=None, error=None):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO jobs (job_id, input_hash, status, result_location, error, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (str(job_id), input_hash, status, result_location, error, time.time()))
+
+    def start(self, job_id, input_hash: str):
+        self._upsert(job_id, input_hash, STATUS_RUNNING)
+
+    def complete(self, job_id, input_hash: str, result) -> str:
+        location = self.results_dir / f"{job_id}_{input_hash[:16]}.json"
+        tmp = location.with_suffix('.tmp')
+        tmp.write_text(json.dumps(result, ensure_ascii=False, default=str), encoding='utf-8')
+        os.replace(tmp, location)
+        self._upsert(job_id, input_hash, STATUS_DONE, result_location=str(location))
+        return str(location)
+
+    def fail(self, job_id, input_hash: str, error: str):
+        self._upsert(job_id, input_hash, STATUS_FAILED, error=error)
+
+    def load_result(self, entry: dict):
+        location = (entry or {}).get('result_location')
+        if not location or not os.path.exists(location):
+            return None
+        with open(location, encoding='utf-8') as f:
+            return json.load(f)
+
+    def completed_result(self, job_id, input_hash: str):
+        """DONE 상태이고 결과 파일이 남아있으면 (True, result), 아니면 (False, None)"""
+        entry = self.lookup(job_id, input_hash)
+        if entry and entry['status'] == STATUS_DONE:
+            result = self.load_result(entry)
+            if result is not None:
+                return True, result
+        return False, None
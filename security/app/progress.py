@@ -0,0 +1,76 @@
+# security/app/progress.py
+# 역할: agent-res 진행 이벤트 스트림 (프로세스 전역 1개)
+#   - update(): 진행 이벤트. (jobId, userId, AGENT)별로 window 안의 이벤트는 마지막 것만 남겨 묶어서 전송,
+#               직전에 보낸 것과 description이 같으면 버림
+#   - finish(): 종료(SUCCESS/FAIL) 이벤트. 대기 중인 진행 이벤트를 버리고 즉시 전송
+
+import os
+import time
+import threading
+from security.app.producer import MessageProducer
+
+
+class ProgressStream:
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._init_stream()
+                cls._instance = instance
+        return cls._instance
+
+    def _init_stream(self):
+        self.producer = MessageProducer()
+        self.topic = os.environ.get('PROGRESS_TOPIC', 'agent-res')
+        self.window = float(os.environ.get('PROGRESS_WINDOW_SEC', '2.0'))
+        self._state_lock = threading.Lock()
+        self._last = {}     # key -> (sent_at, description)
+        self._pending = {}  # key -> message
+        self._timers = {}   # key -> threading.Timer
+
+    @staticmethod
+    def _key(message: dict, agent: str):
+        # jobId가 없는(null) 요청끼리 섞이지 않도록 userId까지 key에 포함
+        return (message.get('jobId'), message.get('userId'), agent)
+
+    def _send(self, key, message: dict, agent: str):
+        self._last[key] = (time.monotonic(), message.get('description'))
+        self.producer.send_message(topic=self.topic, message=message, headers=[('AGENT', agent)])
+
+    def update(self, message: dict, agent: str):
+        key = self._key(message, agent)
+        with self._state_lock:
+            last = self._last.get(key)
+            latest = self._pending[key].get('description') if key in self._pending else (last and last[1])
+            if last and latest == message.get('description'):
+                return
+            if last is None or (key not in self._pending and time.monotonic() - last[0] >= self.window):
+                self._send(key, message, agent)
+                return
+            self._pending[key] = message
+            if key not in self._timers:
+                delay = max(0.0, last[0] + self.window - time.monotonic())
+                timer = threading.Timer(delay, self._flush, args=(key, agent))
+                timer.daemon = True
+                self._timers[key] = timer
+                timer.start()
+
+    def _flush(self, key, agent: str):
+        with self._state_lock:
+            self._timers.pop(key, None)
+            message = self._pending.pop(key, None)
+            if message is not None:
+                self._send(key, message, agent)
+
+    def finish(self, message: dict, agent: str):
+        key = self._key(message, agent)
+        with self._state_lock:
+            timer = self._timers.pop(key, None)
+            if timer:
+                timer.cancel()
+            self._pending.pop(key, None)
+            self._send(key, message, agent)
+            self._last.pop(key, None)
@@ -9,6 +9,7 @@ import os, re, sys, subprocess, shutil, stat
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 from security.app.utils import prepare_workspace_from_input
+from security.app.artifacts import offload_result
 from dotenv import load_dotenv
 import json
 
@@ -256,7 +257,8 @@ def run_security_pipeline(*,
         "eventType": "SecurityFinished",
         "userId": user_id,
         "jobId": job_id,
-        "result": result_payload,
+        # 임계값 초과 시 artifact store에 저장하고 참조(resultRef)+manifest만 전달
+        **offload_result(job_id, "security-result", result_payload),
     }
 
     # 성공/실패와 무관하게 로컬 정리 (디버깅 시 KEEP_LOCAL=1 로 보존)
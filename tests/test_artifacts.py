@@ -0,0 +1,72 @@
+# tests/test_artifacts.py
+# 역할: claim-check (offload_result/load_result) + java_to_egov 종료 이벤트 (저장 실패 시에도 FAIL 이벤트 전송)
+
+import importlib
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import pytest
+
+
+@pytest.fixture(params=('translate', 'security'))
+def artifacts(request, monkeypatch, tmp_path):
+    module = importlib.import_module(f"{request.param}.app.artifacts")
+    monkeypatch.setattr(module, 'ARTIFACT_STORE', str(tmp_path / 'store'))
+    monkeypatch.setattr(module, 'CLAIM_CHECK_THRESHOLD_BYTES', 200)
+    return module
+
+
+def test_small_result_stays_inline(artifacts, tmp_path):
+    fields = artifacts.offload_result(1, 'egov-result', {'status': 'ok'})
+    assert fields == {'result': {'status': 'ok'}}
+    assert artifacts.load_result(fields) == {'status': 'ok'}
+    assert not (tmp_path / 'store').exists()
+
+
+def test_large_result_is_stored_by_reference(artifacts):
+    result = {'classes': [{'name': f"C{i}", 'body': '본문 ' * 20} for i in range(10)], 'language': 'java'}
+    fields = artifacts.offload_result(7, 'egov-result', result)
+    assert set(fields) == {'resultRef', 'manifest'}
+    ref = fields['resultRef']
+    assert ref['compressedSize'] < ref['size']
+    assert Path(url2pathname(urlparse(ref['uri']).path)).parent.name == '7'
+    assert fields['manifest']['classes']['count'] == 10
+    assert fields['manifest']['classes']['names'] == [f"C{i}" for i in range(10)]
+    assert fields['manifest']['language'] == {'type': 'str', 'bytes': len('"java"')}
+    assert artifacts.load_result(fields) == result
+
+
+def test_checksum_mismatch_is_detected(artifacts):
+    fields = artifacts.offload_result(7, 'egov-result', {'data': 'x' * 1000})
+    fields['resultRef']['sha256'] = '0' * 64
+    with pytest.raises(ValueError):
+        artifacts.load_result(fields)
+
+
+def test_java_to_egov_sends_fail_event_when_offload_fails(monkeypatch):
+    pytest.importorskip('langchain')
+    orchestrator = importlib.import_module('translate.app.orchestrator')
+
+    class Graph:
+        def invoke(self, state, config=None):
+            return {'classes': []}
+
+    class EgovAgent:
+        def build_graph(self):
+            return Graph()
+
+        def init_state(self, user_id, job_id, changeset_path=None):
+            return {}
+
+    def broken_store(job_id, name, result):
+        raise OSError('artifact store unavailable')
+
+    sent = []
+    monkeypatch.setattr(orchestrator, 'ConversionEgovAgent', EgovAgent)
+    monkeypatch.setattr(orchestrator, 'offload_result', broken_store)
+    monkeypatch.setattr(orchestrator.progress, 'update', lambda message, agent: None)
+    monkeypatch.setattr(orchestrator.progress, 'finish', lambda message, agent: sent.append((agent, message)))
+    orchestrator.java_to_egov(1, 2)
+    (agent, message), = sent
+    assert agent == 'EGOV' and message['status'] == 'FAIL' and message['result'] == {}
@@ -0,0 +1,117 @@
+# tests/test_call_graph.py
+# 역할: call_graph — StringPool, CSR 구성, 호출 해석 규칙, callees/callers/methods_of, save/load, Java 레코드 → 클래스 간 간선
+
+import pytest
+
+from translate.app.analyzer.call_graph import NO_ID, ProjectGraph, StringPool, _csr, module_name
+from translate.app.analyzer.feature_clusters import call_graph, cluster_classes
+from translate.app.analyzer.parallel_analyzer import parse_java_file
+from translate.app.nodes.analyze import _feature_of
+
+
+def _func(name, cls=None, calls=()):
+    return {"name": name, "class": cls, "calls": [{"target": t} for t in calls]}
+
+
+def _names(graph, syms):
+    return sorted((graph.symbol(s) for s in syms), key=lambda s: (s[0], s[1] or "", s[2]))
+
+
+@pytest.fixture
+def graph():
+    g = ProjectGraph()
+    g.add_functions("app.board", [
+        _func("BoardService", "BoardService"),
+        _func("list", "BoardService", ["self.load", "boardDao.select", "helper", "print"]),
+        _func("load", "BoardService", ["user_repo.find"]),
+        _func("helper"),
+    ])
+    g.add_functions("app.dao", [_func("select", "BoardDao")])
+    g.add_functions("app.user", [_func("find", "UserRepo"), _func("make", calls=["BoardService"])])
+    return g.freeze()
+
+
+def test_module_name():
+    assert module_name("pkg/sub/mod.py") == "pkg.sub.mod"
+    assert module_name("pkg/__init__.py") == "pkg"
+    assert module_name("src\\com\\acme\\Board.java") == "src.com.acme.Board"
+
+
+def test_string_pool_interns_once():
+    pool = StringPool(["a", "b", "a"])
+    assert len(pool) == 2
+    assert pool.intern("b") == 1 and pool.id("c") == NO_ID
+    assert pool[0] == "a" and pool[NO_ID] is None
+
+
+def test_csr_keeps_input_order_per_source():
+    offsets, targets = _csr(3, [(2, 0), (0, 2), (2, 1), (0, 1)])
+    assert offsets.tolist() == [0, 2, 2, 4]
+    assert targets.tolist() == [2, 1, 0, 1]
+
+
+def test_resolution_rules(graph):
+    lst = graph.find("app.board", "BoardService", "list")
+    assert _names(graph, graph.callees(lst)) == [
+        ("app.board", None, "helper"),           # 같은 모듈 함수
+        ("app.board", "BoardService", "load"),   # self.load
+        ("app.dao", "BoardDao", "select"),       # boardDao → BoardDao (프로젝트에 하나뿐)
+    ]
+    load = graph.find("app.board", "BoardService", "load")
+    assert _names(graph, graph.callees(load)) == [("app.user", "UserRepo", "find")]  # user_repo → UserRepo
+    make = graph.find("app.user", None, "make")
+    assert _names(graph, graph.callees(make)) == [("app.board", "BoardService", "BoardService")]  # 생성자
+    assert graph.unresolved == 1  # print
+
+
+def test_callers_and_methods_of(graph):
+    select = graph.find("app.dao", "BoardDao", "select")
+    assert _names(graph, graph.callers(select)) == [("app.board", "BoardService", "list")]
+    assert [graph.symbol(s)[2] for s in graph.methods_of("app.board", "BoardService")] == ["BoardService", "list", "load"]
+    assert len(graph.methods_of("app.board", "Missing")) == 0
+    assert graph.find("app.board", "BoardService", "missing") == NO_ID
+
+
+def test_ambiguous_class_name_is_not_resolved():
+    g = ProjectGraph()
+    g.add_functions("a", [_func("run", "Worker")])
+    g.add_functions("b", [_func("run", "Worker")])
+    g.add_functions("c", [_func("go", "Main", ["worker.run"])])
+    g.freeze()
+    assert len(g.callees(g.find("c", "Main", "go"))) == 0
+    assert g.unresolved == 1
+
+
+def test_save_load_round_trip(graph, tmp_path):
+    path = str(tmp_path / "call_graph.json")
+    graph.save(path)
+    loaded = ProjectGraph.load(path)
+    assert loaded.stats() == graph.stats()
+    for sym in range(len(graph)):
+        assert loaded.symbol(sym) == graph.symbol(sym)
+        assert loaded.callees(sym).tolist() == graph.callees(sym).tolist()
+        assert loaded.callers(sym).tolist() == graph.callers(sym).tolist()
+    assert loaded.methods_of("app.board", "BoardService").tolist() == graph.methods_of("app.board", "BoardService").tolist()
+
+
+def test_parse_java_file_attaches_method_calls(tmp_path):
+    path = tmp_path / "BoardController.java"
+    path.write_text("package a;\npublic class BoardController {\n"
+                    "  private BoardService boardService;\n"
+                    "  public String list() { boardService.selectList(); return \"x\"; }\n}\n")
+    [cls] = parse_java_file(str(path))
+    assert cls["methods"] == [{"name": "list", "calls": ["boardService.selectList"]}]
+
+
+def test_java_call_edges_join_features():
+    # 타입 참조(references)가 없어도 해석된 호출로 묶인다
+    records = [
+        {"name": "BoardController", "source_info": {"rel_path": "web/BoardController.java"}, "role": {"type": "CONTROLLER"},
+         "references": [], "methods": [{"name": "list", "calls": ["articleManager.fetch"]}]},
+        {"name": "ArticleManager", "source_info": {"rel_path": "biz/ArticleManager.java"}, "role": {"type": "UTIL"},
+         "references": [], "methods": [{"name": "fetch", "calls": []}]},
+    ]
+    graph = call_graph(records)
+    assert graph.edge_count == 1
+    features = cluster_classes(records, _feature_of, graph)
+    assert [sorted(c["name"] for c in v) for v in features.values()] == [["ArticleManager", "BoardController"]]
@@ -0,0 +1,124 @@
+# tests/test_codec.py
+# 역할: 메시지 codec (snake_case/camelCase 키, null, 숫자 문자열 ID, 검증 실패) — 서비스별 사본 3개 모두
+
+import importlib
+
+import pytest
+
+SERVICES = ('orchestrate', 'security', 'translate')
+
+CAMEL = {'eventType': 'ConversionRequested', 'timestamp': 1755069341605, 'jobId': 5, 'userId': 11,
+         'filePath': 's3://bucket/p.zip', 'inputeGovFrameVer': '3.8', 'outputeGovFrameVer': '3.10',
+         'isTestCode': True, 'conversionType': 'CODE'}
+SNAKE = {'job_id': 5, 'user_id': 11, 'file_path': 's3://bucket/p.zip', 'input_egov_frame_ver': '3.8',
+         'output_egov_frame_ver': '3.10', 'is_test_code': True, 'conversion_type': 'CODE'}
+
+
+# 도메인 클래스를 정의한 서비스만 (translate에는 ToSecurity, security에는 ToTranslator가 없다)
+TRANSLATOR_SERVICES = ('orchestrate', 'translate')
+SECURITY_SERVICES = ('orchestrate', 'security')
+
+
+def _load(service):
+    return (importlib.import_module(f"{service}.app.codec"),
+            importlib.import_module(f"{service}.app.domain"))
+
+
+@pytest.fixture(params=SERVICES)
+def service(request):
+    return _load(request.param)
+
+
+@pytest.fixture(params=TRANSLATOR_SERVICES)
+def translator(request):
+    codec, domain = _load(request.param)
+    return codec, domain.ToTranslator
+
+
+@pytest.fixture(params=SECURITY_SERVICES)
+def security(request):
+    codec, domain = _load(request.param)
+    return codec, domain.ToSecurity
+
+
+@pytest.mark.parametrize('payload', [CAMEL, SNAKE], ids=['camelCase', 'snake_case'])
+def test_convert_accepts_both_key_styles(translator, payload):
+    codec, cls = translator
+    message = codec.convert(cls, payload)
+    assert message == cls(job_id=5, user_id=11, file_path='s3://bucket/p.zip', input_egov_frame_ver='3.8',
+                          output_egov_frame_ver='3.10', is_test_code=True, conversion_type='CODE')
+
+
+def test_null_job_id_and_file_path_pass_through(translator):
+    """call_agent 문서의 예시 요청 그대로 (jobId/filePath가 아직 null)"""
+    codec, cls = translator
+    message = codec.convert(cls, {**CAMEL, 'jobId': None, 'filePath': None})
+    assert message.job_id is None and message.file_path is None
+    assert codec.decode(codec.encode(message), cls) == message
+
+
+def test_security_request_with_null_file_path(security):
+    codec, cls = security
+    message = codec.convert(cls, {'jobId': None, 'userId': 11, 'filePath': None})
+    assert message.job_id is None and message.filePath is None
+
+
+@pytest.mark.parametrize('raw, expected', [('42', 42), (' 7 ', 7), ('-3', -3)])
+def test_numeric_string_ids_become_ints(translator, raw, expected):
+    codec, cls = translator
+    message = codec.convert(cls, {**CAMEL, 'jobId': raw, 'userId': raw})
+    assert message.job_id == expected and message.user_id == expected
+
+
+@pytest.mark.parametrize('field, value', [('userId', 'abc'), ('userId', '1.5'), ('userId', True),
+                                          ('userId', None), ('isTestCode', 'yes'), ('conversionType', 3)])
+def test_invalid_values_raise_decode_error(translator, field, value):
+    codec, cls = translator
+    with pytest.raises(codec.DecodeError):
+        codec.convert(cls, {**CAMEL, field: value})
+
+
+def test_missing_required_field(translator):
+    codec, cls = translator
+    payload = {k: v for k, v in SNAKE.items() if k != 'conversion_type'}
+    with pytest.raises(codec.DecodeError) as info:
+        codec.convert(cls, payload)
+    assert info.value.missing == ['conversion_type']
+
+
+def test_invalid_json_is_decode_error(service):
+    codec, _ = service
+    with pytest.raises(codec.DecodeError):
+        codec.loads(b'{"jobId": ')
+
+
+def test_non_object_is_decode_error(translator):
+    codec, cls = translator
+    with pytest.raises(codec.DecodeError):
+        codec.convert(cls, ['not', 'an', 'object'])
+
+
+def test_encode_keeps_non_ascii(service):
+    codec, _ = service
+    assert codec.loads(codec.encode({'description': '분석 완료'})) == {'description': '분석 완료'}
+    assert '분석'.encode('utf-8') in codec.encode({'description': '분석 완료'})
+
+
+def test_lookup_ignores_key_style(service):
+    codec, _ = service
+    assert codec.lookup({'jobId': 3}, 'job_id') == 3
+    assert codec.lookup({'user_id': 4}, 'userId') == 4
+    assert codec.lookup({}, 'job_id', 'none') == 'none'
+
+
+def test_call_agent_forwards_docstring_example(monkeypatch):
+    monkeypatch.setenv('MESSAGE_TRANSPORT', 'memory')
+    agent = importlib.import_module('orchestrate.app.agent')
+    sent = []
+    monkeypatch.setattr(agent.producer, 'send_message',
+                        lambda topic, message, headers=None, key=None: sent.append((topic, message, key)))
+    agent.call_agent({'eventType': 'ConversionRequested', 'timestamp': 1755069341605, 'jobId': None, 'userId': 11,
+                      'filePath': None, 'inputeGovFrameVer': '3.8', 'outputeGovFrameVer': '3.10',
+                      'isTestCode': True, 'conversionType': 'CODE'})
+    (topic, message, key), = sent
+    assert (topic, key, message.job_id, message.file_path) == ('conversion', '11', None, None)
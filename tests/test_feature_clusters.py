@@ -0,0 +1,114 @@
+# tests/test_feature_clusters.py
+# 역할: feature_clusters — union-find, 참조 추출, 이름/의존 관계 clustering, 나열 순서와 무관한 feature 이름
+
+import random
+
+from translate.app.analyzer import feature_clusters
+from translate.app.analyzer.feature_clusters import UnionFind, cluster_classes, type_references
+from translate.app.analyzer.source_table import SourceTable
+from translate.app.nodes.analyze import _feature_of, _feature_bodies
+
+
+def _cls(rel_path, name, references=(), role='UTIL'):
+    return {'name': name, 'source_info': {'rel_path': rel_path}, 'role': {'type': role},
+            'references': list(references)}
+
+
+def _names(features):
+    return {feature: sorted(c['name'] for c in classes) for feature, classes in features.items()}
+
+
+def test_union_find_merges_by_size_and_compresses_paths():
+    uf = UnionFind(5)
+    uf.union(0, 1)
+    uf.union(2, 3)
+    root = uf.union(0, 2)
+    assert uf.size[root] == 4
+    assert {uf.find(i) for i in range(4)} == {root}
+    assert uf.find(4) == 4
+    assert uf.union(1, 3) == root  # 이미 같은 묶음
+
+
+def test_type_references_keeps_known_names_only():
+    text = '@Service\npublic class BoardService { BoardDAO dao; List<BoardVO> list(String q) { return Util.x(); } }'
+    known = {'BoardService', 'BoardDAO', 'BoardVO', 'Service'}
+    assert type_references(text, known, 'BoardService') == ['BoardDAO', 'BoardVO']
+
+
+def test_same_stem_in_same_directory_is_one_feature():
+    classes = [_cls('board/BoardController.java', 'BoardController'),
+               _cls('board/BoardService.java', 'BoardService'),
+               _cls('user/UserService.java', 'UserService')]
+    assert _names(cluster_classes(classes, _feature_of)) == {
+        'board': ['BoardController', 'BoardService'], 'user': ['UserService']}
+
+
+def test_references_join_classes_with_different_stems():
+    classes = [_cls('board/BoardService.java', 'BoardService', ['ArticleMapper']),
+               _cls('board/ArticleMapper.java', 'ArticleMapper')]
+    assert _names(cluster_classes(classes, _feature_of)) == {'board': ['ArticleMapper', 'BoardService']}
+
+
+def test_exception_and_configuration_do_not_glue_features():
+    classes = [_cls('a/BoardService.java', 'BoardService', ['CommonException']),
+               _cls('a/UserService.java', 'UserService', ['CommonException']),
+               _cls('a/CommonException.java', 'CommonException', role='EXCEPTION')]
+    assert len(cluster_classes(classes, _feature_of)) == 3
+
+
+def test_hub_classes_are_not_used_as_edges(monkeypatch):
+    monkeypatch.setattr(feature_clusters, 'FEATURE_CLUSTER_MAX_DEGREE', 2)
+    classes = [_cls(f'm/Caller{i}Service.java', f'Caller{i}Service', ['CommonUtil']) for i in range(3)]
+    classes.append(_cls('m/CommonUtil.java', 'CommonUtil'))
+    assert len(cluster_classes(classes, _feature_of)) == 4
+
+
+def test_cluster_size_is_capped(monkeypatch):
+    monkeypatch.setattr(feature_clusters, 'FEATURE_CLUSTER_MAX_SIZE', 2)
+    classes = [_cls('c/AService.java', 'AService', ['BMapper']),
+               _cls('c/BMapper.java', 'BMapper', ['CHelper']),
+               _cls('c/CHelper.java', 'CHelper')]
+    sizes = sorted(len(v) for v in cluster_classes(classes, _feature_of).values())
+    assert sizes == [1, 2]
+
+
+def test_ambiguous_reference_resolves_to_nearest_directory():
+    classes = [_cls('v1/board/BoardService.java', 'BoardService', ['ArticleDAO']),
+               _cls('v1/board/ArticleDAO.java', 'ArticleDAO'),
+               _cls('v2/board/ArticleDAO.java', 'ArticleDAO')]
+    features = cluster_classes(classes, _feature_of)
+    joined = [v for v in features.values() if len(v) == 2][0]
+    assert {c['source_info']['rel_path'] for c in joined} == {'v1/board/BoardService.java', 'v1/board/ArticleDAO.java'}
+
+
+def test_colliding_names_do_not_depend_on_enumeration_order():
+    classes = [_cls(f'{d}/commands/DeleteCommand.java', 'DeleteCommand') for d in ('erd', 'uml', 'db', 'flow')]
+    expected = {feature: [c['source_info']['rel_path'] for c in v]
+                for feature, v in cluster_classes(classes, _feature_of).items()}
+    assert expected['deletecommand'] == ['db/commands/DeleteCommand.java']  # 첫 멤버가 사전순으로 가장 앞선 묶음
+    assert len(expected) == 4 and all(f.startswith('deletecommand') for f in expected)
+    for seed in range(5):
+        shuffled = classes[:]
+        random.Random(seed).shuffle(shuffled)
+        assert {feature: [c['source_info']['rel_path'] for c in v]
+                for feature, v in cluster_classes(shuffled, _feature_of).items()} == expected
+
+
+def test_adding_a_later_group_keeps_existing_names():
+    classes = [_cls('a/DeleteCommand.java', 'DeleteCommand'), _cls('b/DeleteCommand.java', 'DeleteCommand')]
+    before = set(cluster_classes(classes, _feature_of))
+    after = set(cluster_classes(classes + [_cls('c/DeleteCommand.java', 'DeleteCommand')], _feature_of))
+    assert before < after
+
+
+def test_feature_bodies_dedups_identical_text_only(tmp_path):
+    # 서로 다른 파일의 같은 내용 보조 클래스는 본문 하나로 (나머지 클래스는 각자 본문)
+    same = 'class LabelProvider {}'
+    (tmp_path / 'A.java').write_text('class A {}\n' + same)
+    (tmp_path / 'B.java').write_text('class B {}\n' + same)
+    classes = [{'name': 'A', 'spans': [[0, 10]], 'source_info': {'rel_path': 'A.java'}, 'role': {'type': 'UTIL'}},
+               {'name': 'LabelProvider', 'spans': [[11, 33]], 'source_info': {'rel_path': 'A.java'}, 'role': {'type': 'UTIL'}},
+               {'name': 'B', 'spans': [[0, 10]], 'source_info': {'rel_path': 'B.java'}, 'role': {'type': 'UTIL'}},
+               {'name': 'LabelProvider', 'spans': [[11, 33]], 'source_info': {'rel_path': 'B.java'}, 'role': {'type': 'UTIL'}}]
+    bodies = _feature_bodies(classes, SourceTable(str(tmp_path)), {'A.java': 'x', 'B.java': 'y'})
+    assert sorted(bodies['util']) == ['class A {}', 'class B {}', same]
@@ -0,0 +1,103 @@
+# tests/test_file_extractor.py
+# 역할: FileExtractor 스트리밍 추출 — 제외 규칙(VCS/IDE는 어디서든, 빌드 산출물은 모듈 루트에서만), 안전성/크기 제한, sha256/인코딩
+
+import hashlib
+import os
+import zipfile
+
+import pytest
+
+from translate.app.analyzer.file_extractor import FileExtractor, ExtractLimitError
+
+
+def _zip(path, members):
+    with zipfile.ZipFile(path, 'w') as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+def _selected(zip_path, **kwargs):
+    out = os.path.join(os.path.dirname(zip_path), 'out')
+    extractor = FileExtractor(zip_path, extract_dir=out, **kwargs)
+    return [os.path.relpath(f['path'], out).replace(os.sep, '/') for f in extractor.extract_supported()], extractor
+
+
+def test_vcs_and_ide_directories_are_pruned_at_any_depth(tmp_path):
+    names, extractor = _selected(_zip(tmp_path / 'p.zip', {
+        'proj/src/A.java': 'class A {}',
+        'proj/.git/hooks/x.py': '',
+        'proj/sub/.idea/workspace.xml': '',
+        'proj/web/node_modules/lib/index.js': '',
+        'proj/pkg/__pycache__/m.py': '',
+    }))
+    assert names == ['proj/src/A.java']
+    assert extractor.skipped['pruned'] == 4
+
+
+def test_build_output_pruned_only_at_module_root(tmp_path):
+    names, _ = _selected(_zip(tmp_path / 'p.zip', {
+        'proj/pom.xml': '<project/>',
+        'proj/target/generated/Gen.java': '',
+        'proj/core/pom.xml': '<project/>',
+        'proj/core/target/classes/Copy.java': '',
+        'proj/core/src/main/java/com/acme/build/Builder.java': 'class Builder {}',
+        'proj/core/src/main/java/com/acme/target/Target.java': 'class Target {}',
+    }))
+    assert names == ['proj/core/pom.xml',
+                     'proj/core/src/main/java/com/acme/build/Builder.java',
+                     'proj/core/src/main/java/com/acme/target/Target.java',
+                     'proj/pom.xml']
+
+
+def test_python_package_named_dist_is_kept(tmp_path):
+    names, _ = _selected(_zip(tmp_path / 'p.zip', {
+        'app/setup.py': '',
+        'app/dist/app-1.0/app/main.py': '',
+        'app/src/tools/dist/__init__.py': '',
+        'app/src/tools/build.py': '',
+    }))
+    assert names == ['app/setup.py', 'app/src/tools/build.py', 'app/src/tools/dist/__init__.py']
+
+
+def test_build_output_at_archive_root_without_marker(tmp_path):
+    names, _ = _selected(_zip(tmp_path / 'p.zip', {
+        'build/gen/G.java': '', 'src/build/B.java': '', 'src/A.java': '',
+    }))
+    assert names == ['src/A.java', 'src/build/B.java']
+
+
+def test_build_output_names_are_configurable(tmp_path):
+    zip_path = _zip(tmp_path / 'p.zip', {'pom.xml': '', 'out/O.java': '', 'target/T.java': ''})
+    names, _ = _selected(zip_path, build_output_dirs=('out',))
+    assert names == ['pom.xml', 'target/T.java']
+
+
+def test_unsafe_and_unsupported_members_are_skipped(tmp_path):
+    names, extractor = _selected(_zip(tmp_path / 'p.zip', {
+        '../evil.py': '', '/abs.py': '', 'ok.py': '', 'image.png': b'\x89PNG',
+    }))
+    assert names == ['ok.py']
+    assert extractor.skipped['unsafe'] == 2
+    assert extractor.skipped['unsupported'] == 1
+
+
+def test_size_limits(tmp_path):
+    zip_path = _zip(tmp_path / 'p.zip', {'big.py': 'x' * 100, 'small.py': 'x'})
+    names, extractor = _selected(zip_path, max_member_bytes=10)
+    assert names == ['small.py'] and extractor.skipped['too_large'] == 1
+    with pytest.raises(ExtractLimitError):
+        _selected(zip_path, max_total_bytes=50)
+
+
+def test_extract_supported_reports_hash_and_encoding(tmp_path):
+    legacy = '// 한글 주석\nclass A {}'.encode('cp949')
+    zip_path = _zip(tmp_path / 'p.zip', {'src/A.java': legacy, 'src/b.py': '﻿print(1)', '.git/c.py': ''})
+    out = tmp_path / 'out'
+    files = FileExtractor(zip_path, extract_dir=str(out)).extract_supported()
+    by_name = {os.path.relpath(f['path'], out).replace(os.sep, '/'): f for f in files}
+    assert list(by_name) == ['src/A.java', 'src/b.py']
+    assert by_name['src/A.java']['sha256'] == hashlib.sha256(legacy).hexdigest()
+    assert by_name['src/A.java']['encoding'] == 'cp949'
+    assert by_name['src/b.py']['encoding'] == 'utf-8-sig'
+    assert by_name['src/b.py']['size'] == len('﻿print(1)'.encode('utf-8'))
@@ -0,0 +1,74 @@
+# tests/test_hint_matcher.py
+# 역할: HintMatcher — 그룹별 any(패턴 in text)와 같은 결과 (substring/ahocorasick), 백엔드 선택, StructureMapper 테이블
+
+import random
+
+import pytest
+
+from translate.app.analyzer import hint_matcher
+from translate.app.analyzer.hint_matcher import HintMatcher, resolve_backend
+from translate.app.analyzer.structure_mapper import StructureMapper
+
+TABLE = {
+    'dao': ('repository', 'dao', 'session.query'),
+    'service': ('service', 'usecase'),
+    'views': ('views', 'view'),        # 'view'는 'views'의 부분 문자열
+    'overlap': ('dao', 'mapper'),      # 같은 패턴이 여러 그룹에
+    'empty': (),
+}
+
+
+def _expected(table, text):
+    return {group for group, hints in table.items() if any(h in text for h in hints)}
+
+
+def _backends():
+    return ['substring'] + (['ahocorasick'] if hint_matcher.ahocorasick is not None else [])
+
+
+@pytest.fixture(params=_backends())
+def backend(request):
+    return request.param
+
+
+@pytest.mark.parametrize('text', ['', 'user_dao.py', 'app/views/board_view.py', 'session.query(User)',
+                                  'mapper service repository views', 'nothing here'])
+def test_match_equals_naive_any(backend, text):
+    assert HintMatcher(TABLE, backend).match(text) == _expected(TABLE, text)
+
+
+def test_random_texts_agree_with_naive(backend):
+    rng = random.Random(7)
+    alphabet = ['dao', 'view', 'service', 'map', 'per', 'session', '.query', 'x', '/', '_']
+    matcher = HintMatcher(TABLE, backend)
+    for _ in range(300):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        assert matcher.match(text) == _expected(TABLE, text), text
+
+
+def test_match_any_unions_texts(backend):
+    matcher = HintMatcher(TABLE, backend)
+    assert matcher.match_any(['@app.route', 'x.dao', 'usecase']) == {'dao', 'overlap', 'service'}
+    assert matcher.match_any([]) == set()
+
+
+def test_resolve_backend(monkeypatch):
+    assert resolve_backend('substring') == 'substring'
+    assert resolve_backend('bogus') == 'substring'
+    assert resolve_backend('auto') == ('ahocorasick' if hint_matcher.ahocorasick is not None else 'substring')
+    monkeypatch.setattr(hint_matcher, 'ahocorasick', None)
+    assert resolve_backend('auto') == 'substring'
+    assert resolve_backend('ahocorasick') == 'substring'   # 미설치면 substring
+    assert HintMatcher(TABLE, 'ahocorasick').match('dao') == {'dao', 'overlap'}
+
+
+def test_structure_mapper_tables_agree_across_backends():
+    if len(_backends()) < 2:
+        pytest.skip('pyahocorasick not installed')
+    texts = ['src/main/java/board/web/boardcontroller.java', 'app/models.py', 'tests/test_views.py',
+             'class x(basemodel): pass', 'router = apirouter()', 'session.query(user)']
+    for name in ('_PATH_MATCHER', '_CLASS_BODY_MATCHER', '_FUNCTION_BODY_MATCHER', '_DECORATOR_MATCHER'):
+        table = getattr(StructureMapper, name).table
+        substring, automaton = HintMatcher(table, 'substring'), HintMatcher(table, 'ahocorasick')
+        for text in texts:
+            assert substring.match(text) == automaton.match(text) == _expected(table, text), (name, text)
@@ -0,0 +1,141 @@
+# tests/test_ledger.py
+# 역할: JobLedger (멱등성 원장) + run_conversion의 원장 기록/재전달 처리
+
+import importlib
+import os
+import types
+
+import pytest
+
+from translate.app import worker
+from translate.app.domain import ToTranslator
+
+
+@pytest.fixture(params=('translate', 'security'))
+def ledger_module(request):
+    return importlib.import_module(f"{request.param}.app.ledger")
+
+
+def test_input_digest_hashes_local_content_and_remote_uri(ledger_module, tmp_path):
+    a, b = tmp_path / 'a.zip', tmp_path / 'b.zip'
+    a.write_bytes(b'same')
+    b.write_bytes(b'same')
+    assert ledger_module.input_digest(str(a)) == ledger_module.input_digest(str(b))
+    b.write_bytes(b'changed')
+    assert ledger_module.input_digest(str(a)) != ledger_module.input_digest(str(b))
+    assert ledger_module.input_digest('s3://bucket/a.zip') != ledger_module.input_digest('s3://bucket/b.zip')
+
+
+def test_ledger_lifecycle(ledger_module, tmp_path):
+    ledger = ledger_module.JobLedger(tmp_path)
+    assert ledger.lookup(7, 'h') is None
+    assert ledger.completed_result(7, 'h') == (False, None)
+
+    ledger.start(7, 'h')
+    assert ledger.lookup('7', 'h')['status'] == ledger_module.STATUS_RUNNING
+    assert ledger.completed_result(7, 'h') == (False, None)
+
+    ledger.fail(7, 'h', 'boom')
+    assert ledger.lookup(7, 'h')['error'] == 'boom'
+    assert ledger.completed_result(7, 'h') == (False, None)
+
+    ledger.complete(7, 'h', {'status': 'SUCCESS', '한글': 1})
+    assert ledger.completed_result(7, 'h') == (True, {'status': 'SUCCESS', '한글': 1})
+    assert ledger.completed_result(7, 'other') == (False, None)  # 입력이 바뀌면 다시 실행
+
+
+def test_done_without_result_file_runs_again(ledger_module, tmp_path):
+    ledger = ledger_module.JobLedger(tmp_path)
+    location = ledger.complete(1, 'h', {'ok': True})
+    os.remove(location)
+    assert ledger.completed_result(1, 'h') == (False, None)
+
+
+class FakeAgent:
+    def __init__(self, events, error=None):
+        self.events, self.error, self.runs = events, error, 0
+
+    def run(self, user_id, job_id, input_path):
+        self.runs += 1
+        if self.error:
+            raise self.error
+        return {'output': 'done'}
+
+    def finished(self):
+        return list(self.events)
+
+
+def _event(agent, status):
+    return {'agent': agent, 'message': {'jobId': 3, 'status': status}}
+
+
+@pytest.fixture
+def conversion(monkeypatch, tmp_path):
+    from translate.app.ledger import JobLedger
+    sent = []
+    monkeypatch.setattr(worker, '_ledger', JobLedger(tmp_path / 'ledger'))
+    monkeypatch.setattr(worker, 'ProgressStream',
+                        lambda: types.SimpleNamespace(finish=lambda message, agent: sent.append((agent, message))))
+    source = tmp_path / 'input.zip'
+    source.write_bytes(b'zip')
+    return types.SimpleNamespace(request=ToTranslator(job_id=3, user_id=1, file_path=str(source), input_egov_frame_ver='3.10',
+                           output_egov_frame_ver='4.3', is_test_code=False, conversion_type='PYTHON_TO_EGOV'), sent=sent)
+
+
+def test_successful_job_is_replayed_with_stored_final_event(monkeypatch, conversion):
+    agent = FakeAgent([_event('ANALYSIS', 'SUCCESS'), _event('EGOV', 'SUCCESS')])
+    monkeypatch.setattr(worker, '_agent', agent)
+
+    assert worker.run_conversion(conversion.request) == {'output': 'done'}
+    assert conversion.sent == []  # 처음 실행 시 이벤트는 도구들이 직접 보낸다
+
+    assert worker.run_conversion(conversion.request) == {'output': 'done'}
+    assert agent.runs == 1
+    assert conversion.sent == [('EGOV', {'jobId': 3, 'status': 'SUCCESS'})]
+
+
+@pytest.mark.parametrize('events', [
+    [_event('ANALYSIS', 'SUCCESS'), _event('EGOV', 'FAIL')],
+    [_event('ANALYSIS', 'FAIL'), _event('EGOV', 'SUCCESS')],
+    [_event('ANALYSIS', 'SUCCESS')],  # EGOV 단계까지 가지 못함
+    [],
+])
+def test_failed_outcome_is_not_marked_done(monkeypatch, conversion, events):
+    agent = FakeAgent(events)
+    monkeypatch.setattr(worker, '_agent', agent)
+
+    worker.run_conversion(conversion.request)
+    entry = worker._ledger.lookup(3, worker.input_digest(conversion.request.file_path))
+    assert entry['status'] == 'FAILED'
+
+    worker.run_conversion(conversion.request)
+    assert agent.runs == 2  # 재전달되면 다시 실행
+    assert conversion.sent == []
+
+
+def test_job_outcome():
+    assert worker.job_outcome([_event('ANALYSIS', 'SUCCESS'), _event('PYTHON', 'SUCCESS'), _event('EGOV', 'SUCCESS')]) \
+        == ('SUCCESS', _event('EGOV', 'SUCCESS'))
+    assert worker.job_outcome([_event('EGOV', 'FAIL')]) == ('FAIL', _event('EGOV', 'FAIL'))
+    assert worker.job_outcome([]) == ('FAIL', None)
+
+
+def test_exception_marks_failed_and_propagates(monkeypatch, conversion):
+    monkeypatch.setattr(worker, '_agent', FakeAgent([], error=RuntimeError('llm down')))
+    with pytest.raises(RuntimeError):
+        worker.run_conversion(conversion.request)
+    entry = worker._ledger.lookup(3, worker.input_digest(conversion.request.file_path))
+    assert entry['status'] == 'FAILED' and 'llm down' in entry['error']
+
+
+def test_null_job_id_bypasses_the_ledger(monkeypatch, conversion):
+    agent = FakeAgent([_event('ANALYSIS', 'SUCCESS'), _event('EGOV', 'SUCCESS')])
+    monkeypatch.setattr(worker, '_agent', agent)
+    request = conversion.request
+    request.job_id = None
+
+    assert worker.run_conversion(request) == {'output': 'done'}
+    assert worker.run_conversion(request) == {'output': 'done'}
+    assert agent.runs == 2  # 멱등 key가 없으니 매번 실행, 저장된 다른 요청의 이벤트를 보내지 않는다
+    assert conversion.sent == []
+    assert worker._ledger.lookup(None, worker.input_digest(request.file_path)) is None
@@ -0,0 +1,213 @@
+# tests/test_orchestrate_consumer.py
+# 역할: orchestrate MessageConsumer — java-message lane 큐잉 후 dispatch(eventType 핸들러), agent-res 원본 relay(key/헤더 유지, 파싱 없음), 잘못된 메시지 DLQ,
+#       in-flight 상한/종료 이벤트 반납, dispatch된 연속 구간까지만 오프셋 저장, revoke 시 대기 요청 폐기, 대기 한도 pause (InMemoryBroker)
+
+import json
+
+import pytest
+
+from orchestrate.app import transport
+from orchestrate.app.scheduler import LaneScheduler
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setenv('MESSAGE_TRANSPORT', 'memory')
+    monkeypatch.setenv('CONS_TOPIC', 'java-message,agent-res')
+    monkeypatch.setenv('GROUP_ID', 'test-orchestrate')
+    monkeypatch.setenv('AUTO_OFFSET_RESET', 'earliest')
+    broker = transport.InMemoryBroker(num_partitions=1)
+    transport.use_memory_broker(broker)
+    from orchestrate.app import agent
+    from orchestrate.app.producer import MessageProducer
+    # 모듈 import 시점에 만들어진 공용 producer도 이 broker로 보내도록
+    monkeypatch.setattr(MessageProducer(), 'producer', transport.InMemoryProducer(broker))
+    monkeypatch.setattr(agent.producer, 'producer', MessageProducer().producer)
+    from orchestrate.app.consumer import MessageConsumer
+    consumer = MessageConsumer()
+    yield broker, consumer
+    consumer.consumer.close()
+
+
+def _messages(broker, topic):
+    return [m for partition in broker.topics.get(topic, []) for m in partition]
+
+
+def _deliver(broker, consumer, topic, value, headers=None):
+    message = broker.append(topic, value, headers=headers, partition=0)
+    consumer.handle_message(message)
+    consumer.dispatch()
+    return message
+
+
+def _request(event_type, job_id, user_id):
+    return json.dumps({'eventType': event_type, 'jobId': job_id, 'userId': user_id, 'filePath': f's3://b/{job_id}.zip',
+                       'inputeGovFrameVer': '3.8', 'outputeGovFrameVer': '3.10', 'isTestCode': True,
+                       'conversionType': 'CODE'}).encode()
+
+
+def _stored(consumer, topic='java-message'):
+    return consumer.consumer._stored.get((topic, 0))
+
+
+def test_request_is_dispatched_when_lane_has_capacity(orchestrator):
+    broker, consumer = orchestrator
+    _deliver(broker, consumer, 'java-message', json.dumps({
+        'eventType': 'SecurityRequested', 'jobId': 9, 'userId': 4, 'filePath': 's3://b/p.zip'}).encode())
+    (sent,) = _messages(broker, 'security')
+    assert sent.key() == b'4'
+    assert json.loads(sent.value()) == {'job_id': 9, 'user_id': 4, 'filePath': 's3://b/p.zip'}
+
+
+def test_agent_response_is_relayed_unchanged(orchestrator):
+    broker, consumer = orchestrator
+    value = '{"jobId": 1, "status": "SUCCESS", "description": "완료"}'.encode('utf-8')
+    _deliver(broker, consumer, 'agent-res', value, headers=[('AGENT', b'EGOV')])
+    (relayed,) = _messages(broker, 'python-message')
+    assert relayed.value() == value
+    assert relayed.headers() == [('AGENT', b'EGOV')]
+
+
+def test_malformed_request_goes_to_dlq(orchestrator):
+    broker, consumer = orchestrator
+    _deliver(broker, consumer, 'java-message', b'{"eventType": ')
+    assert _messages(broker, 'conversion') == []
+    (dead,) = _messages(broker, 'java-message.dlq')
+    assert dict(dead.headers())['x-retry-error-type'] == b'DecodeError'
+
+
+def test_relay_keeps_key_and_does_not_decode_payload(orchestrator):
+    broker, consumer = orchestrator
+    value = b'\x00not json\xff'   # 파싱하지 않으므로 JSON이 아니어도 그대로 전달 (DLQ로 가지 않음)
+    message = broker.append('agent-res', value, key=b'job-7', partition=0)
+    consumer.handle_message(message)
+    (relayed,) = _messages(broker, 'python-message')
+    assert (relayed.key(), relayed.value()) == (b'job-7', value)
+    assert _messages(broker, 'agent-res.dlq') == []
+
+
+@pytest.mark.parametrize('event_type, topic, expected', [
+    ('ConversionRequested', 'conversion',
+     {'job_id': 3, 'user_id': 4, 'file_path': 's3://b/p.zip', 'input_egov_frame_ver': '3.8',
+      'output_egov_frame_ver': '3.10', 'is_test_code': True, 'conversion_type': 'CODE'}),
+    ('ChatbotRequested', 'chatbot', {'user_id': 4, 'job_id': 3}),
+])
+def test_handlers_dispatch_by_event_type(orchestrator, event_type, topic, expected):
+    broker, consumer = orchestrator
+    _deliver(broker, consumer, 'java-message', json.dumps({
+        'eventType': event_type, 'jobId': 3, 'userId': 4, 'filePath': 's3://b/p.zip',
+        'inputeGovFrameVer': '3.8', 'outputeGovFrameVer': '3.10', 'isTestCode': True, 'conversionType': 'CODE'}).encode())
+    (sent,) = _messages(broker, topic)
+    assert json.loads(sent.value()) == expected
+
+
+def test_unknown_event_type_is_ignored(orchestrator):
+    broker, consumer = orchestrator
+    _deliver(broker, consumer, 'java-message', json.dumps({'eventType': 'Unknown', 'userId': 1}).encode())
+    assert all(not _messages(broker, t) for t in ('conversion', 'security', 'chatbot', 'java-message.dlq'))
+
+
+def test_relay_waits_for_queue_space_on_buffer_error():
+    from types import SimpleNamespace
+    from orchestrate.app.producer import MessageProducer
+
+    class FullOnce:
+        def __init__(self):
+            self.produced, self.polls, self.full = [], 0, True
+
+        def produce(self, topic, value, key=None, headers=None, callback=None):
+            if self.full:
+                self.full = False
+                raise BufferError('queue full')
+            self.produced.append((topic, value, key, headers))
+
+        def poll(self, timeout):
+            self.polls += 1
+
+    fake = SimpleNamespace(producer=FullOnce(), delivery_callback=None)
+    MessageProducer.relay(SimpleNamespace(_produce=lambda *a, **kw: MessageProducer._produce(fake, *a, **kw)),
+                          'python-message', b'raw', key=b'k', headers=[('AGENT', b'EGOV')])
+    assert fake.producer.polls == 1
+    assert fake.producer.produced == [('python-message', b'raw', b'k', [('AGENT', b'EGOV')])]
+
+
+def test_offsets_are_stored_only_after_dispatch(orchestrator):
+    broker, consumer = orchestrator
+    consumer.scheduler = LaneScheduler(limits={'bulk': 1})
+    for job_id in (1, 2):
+        broker.append('java-message', _request('ConversionRequested', job_id, 4), partition=0)
+    consumer.step(timeout=0.1)
+    assert [json.loads(m.value())['job_id'] for m in _messages(broker, 'conversion')] == [1]
+    assert _stored(consumer) == 1          # 2번 요청은 아직 큐에 있으므로 커밋 대상이 아니다
+
+    # 진행 이벤트(status 없음)는 in-flight를 반납하지 않는다
+    broker.append('agent-res', json.dumps({'jobId': 1, 'userId': 4, 'description': '진행 중'}).encode(),
+                  headers=[('AGENT', b'EGOV')], partition=0)
+    consumer.step(timeout=0.1)
+    assert len(_messages(broker, 'conversion')) == 1 and _stored(consumer) == 1
+
+    broker.append('agent-res', json.dumps({'jobId': 1, 'userId': 4, 'status': 'SUCCESS'}).encode(),
+                  headers=[('AGENT', b'EGOV')], partition=0)
+    consumer.step(timeout=0.1)
+    assert [json.loads(m.value())['job_id'] for m in _messages(broker, 'conversion')] == [1, 2]
+    assert _stored(consumer) == 2
+    assert len(_messages(broker, 'python-message')) == 2   # 종료 판단과 별개로 relay는 그대로
+
+
+def test_interactive_request_overtakes_full_bulk_lane(orchestrator):
+    broker, consumer = orchestrator
+    consumer.scheduler = LaneScheduler(limits={'bulk': 1})
+    for job_id in (1, 2, 3):
+        broker.append('java-message', _request('ConversionRequested', job_id, 4), partition=0)
+    broker.append('java-message', _request('ChatbotRequested', 9, 5), partition=0)
+    consumer.step(timeout=0.1)
+    assert len(_messages(broker, 'chatbot')) == 1 and len(_messages(broker, 'conversion')) == 1
+    assert _stored(consumer) == 1   # 챗봇 요청(offset 3)은 나갔지만 앞의 2, 3번이 대기 중
+    metrics = consumer.scheduler.metrics()
+    assert (metrics['bulk']['depth'], metrics['bulk']['inflight']) == (2, 1)
+    assert metrics['interactive']['dispatched'] == 1
+
+
+def test_failed_dispatch_is_routed_and_committed(orchestrator, monkeypatch):
+    broker, consumer = orchestrator
+    from orchestrate.app import consumer as consumer_module
+
+    def broken(request, lane=None):
+        raise RuntimeError('producer down')
+
+    monkeypatch.setattr(consumer_module, 'call_agent', broken)
+    broker.append('java-message', _request('SecurityRequested', 1, 4), partition=0)
+    consumer.step(timeout=0.1)
+    (retried,) = _messages(broker, 'java-message.retry.1')
+    assert dict(retried.headers())['x-retry-error-type'] == b'RuntimeError'
+    assert _stored(consumer) == 1 and consumer.scheduler.metrics()['standard']['inflight'] == 0
+
+
+def test_revoke_drops_queued_requests(orchestrator):
+    broker, consumer = orchestrator
+    consumer.scheduler = LaneScheduler(limits={'bulk': 1})
+    for job_id in (1, 2):
+        broker.append('java-message', _request('ConversionRequested', job_id, 4), partition=0)
+    consumer.step(timeout=0.1)
+    consumer._on_revoke(consumer.consumer, [transport.TopicPartition('java-message', 0)])
+    assert len(consumer.scheduler) == 0 and consumer.offsets.committable() == {}
+
+
+def test_request_partitions_pause_when_queue_is_full(orchestrator):
+    broker, consumer = orchestrator
+    consumer.scheduler = LaneScheduler(limits={'bulk': 1})
+    consumer.max_queued = 1
+    for job_id in (1, 2, 3):
+        broker.append('java-message', _request('ConversionRequested', job_id, 4), partition=0)
+    consumer.step(timeout=0.1)
+    paused = {(tp.topic, tp.partition) for tp in consumer.paused}
+    assert ('java-message', 0) in paused and ('agent-res', 0) not in paused
+
+    broker.append('agent-res', json.dumps({'jobId': 1, 'userId': 4, 'status': 'SUCCESS'}).encode(),
+                  headers=[('AGENT', b'EGOV')], partition=0)
+    consumer.step(timeout=0.1)   # agent-res는 계속 받아 1번 반납 → 2번 dispatch → 대기 1건(한도) 유지
+    assert len(_messages(broker, 'conversion')) == 2
+    broker.append('agent-res', json.dumps({'jobId': 2, 'userId': 4, 'status': 'FAIL'}).encode(),
+                  headers=[('AGENT', b'EGOV')], partition=0)
+    consumer.step(timeout=0.1)
+    assert len(_messages(broker, 'conversion')) == 3 and consumer.paused == []
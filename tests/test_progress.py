@@ -0,0 +1,79 @@
+# tests/test_progress.py
+# 역할: ProgressStream — (jobId, userId, AGENT)별 window 묶음 전송, 같은 description 버림, finish 즉시 전송 (translate/security 공통)
+
+import importlib
+import time
+
+import pytest
+
+WINDOW = 0.2
+
+
+class RecordingProducer:
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, topic, message, headers=None, key=None):
+        self.sent.append((topic, dict(message), headers))
+
+
+@pytest.fixture(params=['translate', 'security'])
+def stream(request, monkeypatch):
+    module = importlib.import_module(f'{request.param}.app.progress')
+    monkeypatch.setattr(module, 'MessageProducer', RecordingProducer)
+    monkeypatch.setenv('PROGRESS_WINDOW_SEC', str(WINDOW))
+    instance = object.__new__(module.ProgressStream)  # 싱글턴을 건드리지 않고 테스트용 인스턴스
+    instance._init_stream()
+    return instance
+
+
+def _descriptions(stream):
+    return [(message['description'], dict(headers)['AGENT']) for _, message, headers in stream.producer.sent]
+
+
+def _event(description, job_id=1, status='RUNNING', user_id=7):
+    return {'userId': user_id, 'jobId': job_id, 'status': status, 'description': description}
+
+
+def test_first_update_is_sent_immediately_and_burst_is_coalesced(stream):
+    for step in ('parse 1', 'parse 2', 'parse 3'):
+        stream.update(_event(step), agent='ANALYZE')
+    assert _descriptions(stream) == [('parse 1', 'ANALYZE')]
+    time.sleep(WINDOW * 2)
+    assert _descriptions(stream) == [('parse 1', 'ANALYZE'), ('parse 3', 'ANALYZE')]  # window 안에서는 마지막 것만
+
+
+def test_repeated_description_is_dropped(stream):
+    stream.update(_event('same'), agent='ANALYZE')
+    stream.update(_event('same'), agent='ANALYZE')
+    time.sleep(WINDOW * 2)
+    stream.update(_event('same'), agent='ANALYZE')
+    assert _descriptions(stream) == [('same', 'ANALYZE')]
+
+
+def test_keys_are_independent_per_job_and_agent(stream):
+    stream.update(_event('a', job_id=1), agent='ANALYZE')
+    stream.update(_event('b', job_id=2), agent='ANALYZE')
+    stream.update(_event('c', job_id=1), agent='EGOV')
+    assert _descriptions(stream) == [('a', 'ANALYZE'), ('b', 'ANALYZE'), ('c', 'EGOV')]
+
+
+def test_null_job_ids_are_kept_apart_per_user(stream):
+    stream.update(_event('a', job_id=None, user_id=1), agent='ANALYZE')
+    stream.update(_event('b', job_id=None, user_id=2), agent='ANALYZE')
+    stream.update(_event('a', job_id=None, user_id=2), agent='ANALYZE')
+    assert _descriptions(stream) == [('a', 'ANALYZE'), ('b', 'ANALYZE')]   # user 2의 'a'는 window 안이라 대기
+    time.sleep(WINDOW * 2)
+    assert _descriptions(stream)[-1] == ('a', 'ANALYZE')
+
+
+def test_finish_drops_pending_update_and_sends_immediately(stream):
+    stream.update(_event('step 1'), agent='EGOV')
+    stream.update(_event('step 2'), agent='EGOV')
+    stream.finish(_event('done', status='SUCCESS'), agent='EGOV')
+    time.sleep(WINDOW * 2)
+    assert _descriptions(stream) == [('step 1', 'EGOV'), ('done', 'EGOV')]
+    assert stream.producer.sent[-1][0] == 'agent-res'
+    # 종료 뒤 같은 key의 새 작업(재시도 등)은 다시 즉시 전송
+    stream.update(_event('step 1'), agent='EGOV')
+    assert _descriptions(stream)[-1] == ('step 1', 'EGOV')
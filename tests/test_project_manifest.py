@@ -0,0 +1,91 @@
+# tests/test_project_manifest.py
+# 역할: project_manifest — pom.xml/build.gradle 프레임워크·전자정부 버전 판정, 빌드 파일 우선순위, manifest 구성
+
+import hashlib
+
+from translate.app.analyzer.project_manifest import (parse_pom, parse_gradle, parse_build_file, resolve_framework,
+                                                     build_manifest, digests)
+
+
+def _pom(body: str) -> bytes:
+    return f'<project xmlns="http://maven.apache.org/POM/4.0.0">{body}</project>'.encode('utf-8')
+
+
+def test_pom_egov_version_literal():
+    data = _pom('<dependencies><dependency><groupId>egovframework.rte</groupId>'
+                '<artifactId>egovframework.rte.ptl.mvc</artifactId><version>3.10.0</version></dependency></dependencies>')
+    assert parse_pom(data) == ('eGovFrame', '3.10.0')
+
+
+def test_pom_egov_version_from_property():
+    data = _pom('<properties><egovframework.rte.version>4.2.0</egovframework.rte.version></properties>'
+                '<dependencies><dependency><groupId>org.egovframe.rte</groupId><artifactId>org.egovframe.rte.fdl.cmmn</artifactId>'
+                '<version>${egovframework.rte.version}</version></dependency></dependencies>')
+    assert parse_pom(data) == ('eGovFrame', '4.2.0')
+
+
+def test_pom_spring_boot_and_unknown():
+    boot = _pom('<parent><groupId>org.springframework.boot</groupId><artifactId>spring-boot-starter-parent</artifactId></parent>')
+    assert parse_pom(boot) == ('Spring Boot', None)
+    assert parse_pom(_pom('<dependencies/>')) == ('unknown', None)
+
+
+def test_gradle_coordinates():
+    groovy = "dependencies {\n  implementation 'org.egovframe.rte:org.egovframe.rte.ptl.mvc:4.1.0'\n}"
+    kts = 'plugins { id("org.springframework.boot") version "3.2.0" }\n' \
+          'dependencies { implementation("egovframework.rte:egovframework.rte.fdl.cmmn:3.9.0") }'
+    assert parse_gradle(groovy) == ('eGovFrame', '4.1.0')
+    assert parse_gradle(kts) == ('eGovFrame', '3.9.0')
+    assert parse_gradle("plugins { id 'org.springframework.boot' version '3.2.0' }") == ('Spring Boot', None)
+    # 버전 변수의 값이 같은 파일에 없으면 프레임워크만
+    assert parse_gradle('implementation "org.egovframe.rte:org.egovframe.rte.fdl.cmmn:$egovVersion"') == ('eGovFrame', None)
+    assert parse_gradle("implementation 'com.google.guava:guava:33.0'") == ('unknown', None)
+
+
+def test_parse_build_file_records_errors(tmp_path):
+    broken = tmp_path / 'pom.xml'
+    broken.write_text('<project>')
+    info = parse_build_file(str(broken), 'pom.xml')
+    assert info['type'] == 'maven' and info['framework'] == 'unknown' and 'error' in info
+
+
+def test_resolve_framework_stops_at_first_detected():
+    build_files = [{'framework': 'unknown', 'egov_version': None},
+                   {'framework': 'eGovFrame', 'egov_version': '3.10.0'},
+                   {'framework': 'Spring Boot', 'egov_version': None}]
+    assert resolve_framework(build_files) == ('eGovFrame', '3.10.0')
+    assert resolve_framework([]) == ('unknown', 'unknown')
+
+
+def test_build_manifest_orders_build_files_by_depth(tmp_path):
+    files = {
+        'proj/module/pom.xml': _pom('<parent><artifactId>spring-boot-starter-parent</artifactId></parent>'),
+        'proj/build.gradle': b"implementation 'egovframework.rte:egovframework.rte.ptl.mvc:3.8.0'",
+        'proj/src/A.java': b'class A {}',
+    }
+    entries = []
+    for rel, data in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        language = 'java' if rel.endswith('.java') else ('xml' if rel.endswith('.xml') else 'gradle')
+        entries.append({'path': str(path), 'language': language, 'size': len(data),
+                        'sha256': hashlib.sha256(data).hexdigest(), 'encoding': 'utf-8'})
+    manifest = build_manifest(str(tmp_path), entries, source='p.zip')
+    assert [b['rel_path'] for b in manifest['build_files']] == ['proj/build.gradle', 'proj/module/pom.xml']
+    assert (manifest['framework'], manifest['egov_version']) == ('eGovFrame', '3.8.0')
+    assert manifest['languages'] == {'xml': 1, 'gradle': 1, 'java': 1}
+    assert digests(manifest)[str(tmp_path / 'proj/src/A.java')] == hashlib.sha256(b'class A {}').hexdigest()
+    assert digests(None) == {}
+
+
+def test_gradle_version_variable_is_resolved_in_same_file():
+    groovy = "ext { egovVersion = '4.2.0' }\n" \
+             'dependencies { implementation "org.egovframe.rte:org.egovframe.rte.fdl.cmmn:$egovVersion" }'
+    kts = 'val egovVersion = "3.10.0"\n' \
+          'dependencies { implementation("egovframework.rte:egovframework.rte.ptl.mvc:${egovVersion}") }'
+    ext = "ext.egovVersion = '4.1.0'\n" \
+          'implementation "org.egovframe.rte:org.egovframe.rte.ptl.mvc:${rootProject.ext.egovVersion}"'
+    assert parse_gradle(groovy) == ('eGovFrame', '4.2.0')
+    assert parse_gradle(kts) == ('eGovFrame', '3.10.0')
+    assert parse_gradle(ext) == ('eGovFrame', '4.1.0')
@@ -0,0 +1,51 @@
+# tests/test_python_agent.py
+# 역할: Python→Java 변환 입력 — classes.jsonl 순회(JsonlQueue, limit 없음=전체), py_to_java가 모든 클래스를 변환하는지
+
+import importlib
+
+import pytest
+
+from translate.app.analyzer.jsonl_store import JsonlQueue, iter_jsonl, write_jsonl
+
+CLASSES = [{'name': f'C{i}', 'role': {'type': 'SERVICE'}, 'body': f'class C{i}: pass'} for i in range(5)]
+
+
+def _classes_jsonl(directory):
+    path = directory / 'output' / 'classes.jsonl'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_jsonl(str(path), CLASSES)
+    return str(path)
+
+
+def test_jsonl_queue_limit(tmp_path):
+    path = _classes_jsonl(tmp_path)
+    assert [c['name'] for c in JsonlQueue(iter_jsonl(path))] == ['C0', 'C1', 'C2', 'C3', 'C4']
+    assert [c['name'] for c in JsonlQueue(iter_jsonl(path), None)] == ['C0', 'C1', 'C2', 'C3', 'C4']
+    assert [c['name'] for c in JsonlQueue(iter_jsonl(path), 2)] == ['C0', 'C1']
+
+
+def test_py_to_java_converts_every_class(tmp_path, monkeypatch):
+    pytest.importorskip('langchain')
+    monkeypatch.setenv('OPENAI_API_KEY', 'test')
+    python_agent = importlib.import_module('translate.app.python_agent')
+    orchestrator = importlib.import_module('translate.app.orchestrator')
+    _classes_jsonl(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    converted = []
+
+    class Graph:
+        # PopClass → GenerateJava → CheckRemaining 루프만 흉내 (LLM 호출 없음)
+        def invoke(self, state):
+            while not state['end']:
+                state = python_agent.pop_next_class_node(state)
+                converted.append(state['input']['name'])
+                state = python_agent.check_class_remaining_node(state)
+            return state
+
+    monkeypatch.setattr(python_agent, 'graph_executor', Graph())
+    monkeypatch.setattr(orchestrator, 'run_python_agent', python_agent.run_python_agent)
+    monkeypatch.setattr(orchestrator.progress, 'update', lambda message, agent: None)
+    monkeypatch.setattr(orchestrator.progress, 'finish', lambda message, agent: None)
+    orchestrator.py_to_java(1, 2)
+    assert converted == ['C0', 'C1', 'C2', 'C3', 'C4']
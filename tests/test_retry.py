@@ -0,0 +1,133 @@
+# tests/test_retry.py
+# 역할: RetryRouter (retry tier/DLQ 라우팅, 재처리 시각 전 파티션 hold/release) — 서비스별 사본 4개 모두
+
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import types
+
+import pytest
+
+from orchestrate.app.transport import InMemoryBroker, InMemoryConsumer
+
+SERVICES = ('chatbot', 'orchestrate', 'security', 'translate')
+CHATBOT_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'chatbot', 'app')
+
+
+class RecordingProducer:
+    def __init__(self):
+        self.sent = []
+
+    def relay(self, topic, value, key=None, headers=None):
+        self.sent.append((topic, value, key, dict(headers or [])))
+
+
+def _load_chatbot_retry(monkeypatch):
+    # chatbot은 chatbot/app을 작업 디렉터리로 실행되는 스크립트 구조 (from transport import ...)
+    monkeypatch.syspath_prepend(CHATBOT_APP)
+    spec = importlib.util.spec_from_file_location('chatbot_retry', os.path.join(CHATBOT_APP, 'retry.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=SERVICES)
+def retry(request, monkeypatch):
+    if request.param == 'chatbot':
+        module = _load_chatbot_retry(monkeypatch)
+    else:
+        module = importlib.import_module(f"{request.param}.app.retry")
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(module, 'time', types.SimpleNamespace(time=lambda: clock.now))
+    module.clock = clock
+    return module
+
+
+def _router(retry):
+    return retry.RetryRouter(RecordingProducer(), logging.getLogger('test-retry'))
+
+
+def _consumer(broker, topic):
+    consumer = InMemoryConsumer(broker, {'group.id': 'g', 'auto.offset.reset': 'earliest',
+                                         'enable.auto.offset.store': False})
+    consumer.subscribe([topic])
+    return consumer
+
+
+def _offsets(messages):
+    return [m.offset() for m in messages]
+
+
+def test_hold_keeps_earliest_offset_of_partition(retry):
+    broker, topic = InMemoryBroker(num_partitions=1), 'java-message.retry.1'
+    for i in range(3):
+        broker.append(topic, f"m{i}".encode(), headers=[(retry.H_NOT_BEFORE, b'1005.0')], partition=0)
+    consumer, router = _consumer(broker, topic), _router(retry)
+
+    batch = consumer.consume(num_messages=10)
+    assert _offsets(batch) == [0, 1, 2]
+    assert all(router.hold(consumer, m) for m in batch)
+    assert router.held == {(topic, 0): 1005.0}
+    assert consumer.consume(num_messages=10) == []  # pause 중
+
+    retry.clock.now = 1005.0
+    router.release(consumer)
+    assert router.held == {}
+    assert _offsets(consumer.consume(num_messages=10)) == [0, 1, 2]  # 하나도 건너뛰지 않는다
+
+
+def test_due_message_behind_held_one_is_not_processed(retry):
+    broker, topic = InMemoryBroker(num_partitions=1), 'java-message.retry.1'
+    broker.append(topic, b'late', headers=[(retry.H_NOT_BEFORE, b'1005.0')], partition=0)
+    broker.append(topic, b'due', headers=[(retry.H_NOT_BEFORE, b'999.0')], partition=0)
+    consumer, router = _consumer(broker, topic), _router(retry)
+
+    late, due = consumer.consume(num_messages=10)
+    assert router.hold(consumer, late)
+    assert router.hold(consumer, due)  # 앞 오프셋이 hold 중이면 뒤 메시지도 처리하지 않는다
+
+
+def test_message_without_delay_is_not_held(retry):
+    broker, topic = InMemoryBroker(num_partitions=1), 'java-message'
+    broker.append(topic, b'now', partition=0)
+    consumer, router = _consumer(broker, topic), _router(retry)
+    (message,) = consumer.consume(num_messages=10)
+    assert not router.hold(consumer, message)
+    assert router.held == {}
+
+
+def test_route_walks_tiers_then_dlq(retry):
+    router = _router(retry)
+    headers = [('traceId', b'abc')]
+    for attempt in range(1, retry.RETRY_TIERS + 1):
+        target = router.route_value('java-message', b'{}', key=b'k', headers=headers, error=RuntimeError('boom'))
+        assert target == retry.retry_topic('java-message', attempt)
+        headers = list(router.producer.sent[-1][3].items())
+    sent = router.producer.sent[-1][3]
+    assert sent['traceId'] == b'abc'
+    assert sent[retry.H_ORIGINAL_TOPIC] == 'java-message'
+    assert float(sent[retry.H_NOT_BEFORE]) == 1000.0 + retry.retry_delay(retry.RETRY_TIERS)
+
+    target = router.route_value(retry.retry_topic('java-message', retry.RETRY_TIERS), b'{}', headers=headers,
+                                error=RuntimeError('boom'))
+    assert target == 'java-message.dlq'
+    assert retry.H_NOT_BEFORE not in router.producer.sent[-1][3]
+
+
+@pytest.mark.parametrize('error', [ValueError('bug'), KeyError('bug'), TypeError('bug')])
+def test_handler_errors_are_retried(retry, error):
+    assert _router(retry).route_value('java-message', b'{}', error=error) == 'java-message.retry.1'
+
+
+def test_malformed_messages_go_straight_to_dlq(retry):
+    router = _router(retry)
+    if retry.__name__ != 'chatbot_retry':   # chatbot에는 codec이 없다 (JSON 파싱 실패만)
+        codec = importlib.import_module(retry.__name__.replace('.retry', '.codec'))
+        assert router.route_value('java-message', b'{', error=codec.DecodeError('invalid JSON')) == 'java-message.dlq'
+    try:
+        json.loads('{')
+    except json.JSONDecodeError as e:
+        assert router.route_value('java-message', b'{', error=e) == 'java-message.dlq'
+    assert router.producer.sent[-1][3][retry.H_ERROR_TYPE] == 'JSONDecodeError'
@@ -0,0 +1,95 @@
+# tests/test_scheduler.py
+# 역할: LaneScheduler — lane 가중치 순서, lane 내부 tenant round-robin, in-flight 상한/종료 이벤트 반납(null jobId 포함)/timeout,
+#       revoke 파티션 폐기, OffsetTracker 연속 구간 계산
+
+from types import SimpleNamespace
+
+from orchestrate.app.scheduler import LaneScheduler, OffsetTracker, lane_of, lane_weights
+
+
+def _req(event_type, user_id, job_id=None):
+    return {'eventType': event_type, 'userId': user_id, 'jobId': job_id}
+
+
+def _drain(scheduler):
+    order = []
+    for lane, request, source, waited in scheduler.drain():
+        scheduler.started(lane, request)
+        order.append((lane, request['userId'], request['jobId']))
+    return order
+
+
+def test_lane_of_and_weight_override(monkeypatch):
+    assert lane_of(_req('ChatbotRequested', 1)) == 'interactive'
+    assert lane_of(_req('Unknown', 1)) is None
+    monkeypatch.setenv('LANE_WEIGHTS', 'bulk:3,interactive:0')
+    assert lane_weights() == {'interactive': 1, 'standard': 4, 'bulk': 3}
+
+
+def test_weighted_fair_order_across_lanes():
+    scheduler = LaneScheduler(weights={'interactive': 2, 'bulk': 1}, limits={})
+    for i in range(3):
+        scheduler.push('bulk', _req('ConversionRequested', 1, i))
+        scheduler.push('interactive', _req('ChatbotRequested', 1, 10 + i))
+    lanes = [lane for lane, _, _ in _drain(scheduler)]
+    assert lanes == ['interactive', 'bulk', 'interactive', 'interactive', 'bulk', 'bulk']
+
+
+def test_tenants_take_turns_within_a_lane():
+    scheduler = LaneScheduler(limits={})
+    for job_id in (1, 2, 3):
+        scheduler.push('bulk', _req('ConversionRequested', 'a', job_id))
+    scheduler.push('bulk', _req('ConversionRequested', 'b', 9))
+    assert [(user, job) for _, user, job in _drain(scheduler)] == [('a', 1), ('b', 9), ('a', 2), ('a', 3)]
+
+
+def test_inflight_limit_and_completion():
+    scheduler = LaneScheduler(limits={'bulk': 1})
+    scheduler.push('bulk', _req('ConversionRequested', 4, 1))
+    scheduler.push('bulk', _req('ConversionRequested', 4, None))
+    scheduler.push('bulk', _req('ConversionRequested', 4, 3))
+    assert _drain(scheduler) == [('bulk', 4, 1)]
+
+    assert not scheduler.complete('EGOV', {'userId': 4, 'jobId': 1})                       # 진행 이벤트
+    assert not scheduler.complete('ANALYSIS', {'userId': 4, 'jobId': 1, 'status': 'SUCCESS'})  # 중간 단계
+    assert not scheduler.complete('EGOV', {'userId': 5, 'jobId': 1, 'status': 'SUCCESS'})  # 다른 사용자
+    assert scheduler.complete('EGOV', {'userId': '4', 'jobId': '1', 'status': 'SUCCESS'})
+    assert _drain(scheduler) == [('bulk', 4, None)]
+
+    # jobId가 null인 요청은 같은 사용자의 null jobId 종료 이벤트와 맞춘다
+    assert scheduler.complete('EGOV', {'userId': 4, 'jobId': None, 'status': 'FAIL'})
+    assert _drain(scheduler) == [('bulk', 4, 3)]
+    assert scheduler.metrics()['bulk']['completed'] == 2
+
+
+def test_inflight_expires_after_timeout():
+    scheduler = LaneScheduler(limits={'standard': 1}, inflight_timeout=0)
+    scheduler.push('standard', _req('SecurityRequested', 1, 1))
+    scheduler.push('standard', _req('SecurityRequested', 1, 2))
+    assert len(_drain(scheduler)) == 1
+    scheduler.expire()
+    assert len(_drain(scheduler)) == 1
+    assert scheduler.metrics()['standard']['expired'] == 1
+
+
+def test_drop_revoked_partitions():
+    def source(topic, partition):
+        return SimpleNamespace(topic=lambda: topic, partition=lambda: partition)
+
+    scheduler = LaneScheduler(limits={})
+    scheduler.push('bulk', _req('ConversionRequested', 1, 1), source('java-message', 0))
+    scheduler.push('bulk', _req('ConversionRequested', 1, 2), source('java-message', 1))
+    assert scheduler.drop({('java-message', 0)}) == 1
+    assert [job for _, _, job in _drain(scheduler)] == [2]
+
+
+def test_offset_tracker_commits_contiguous_prefix():
+    tracker = OffsetTracker()
+    for offset in (5, 6, 7):
+        tracker.track('java-message', 0, offset)
+    tracker.done('java-message', 0, 6)
+    assert tracker.committable() == {}
+    tracker.done('java-message', 0, 5)
+    assert tracker.committable() == {('java-message', 0): 7}
+    tracker.done('java-message', 0, 7)
+    assert tracker.committable() == {('java-message', 0): 8}
@@ -0,0 +1,67 @@
+# tests/test_security_consumer.py
+# 역할: security MessageConsumer.handle_message — 필수 값(userId/jobId/filePath) 누락 시 FAIL_BAD_REQUEST, 원장 재전달
+
+import json
+import logging
+import types
+
+import pytest
+
+from security.app import consumer as security_consumer
+from security.app.ledger import JobLedger
+
+
+class Message:
+    def __init__(self, value):
+        self._value = json.dumps(value).encode('utf-8')
+
+    def value(self):
+        return self._value
+
+    def topic(self):
+        return 'security'
+
+    def key(self):
+        return None
+
+
+@pytest.fixture
+def handler(monkeypatch, tmp_path):
+    sent, runs = [], []
+    consumer = object.__new__(security_consumer.MessageConsumer)  # Kafka 연결 없이 handle_message만
+    consumer.logger = logging.getLogger('test-security')
+    consumer.ledger = JobLedger(tmp_path / 'ledger')
+    consumer.progress = types.SimpleNamespace(finish=lambda message, agent: sent.append((agent, message)))
+    consumer.retry = types.SimpleNamespace(route=lambda message, error: pytest.fail(f'routed: {error!r}'))
+
+    def pipeline(user_id, job_id, file_path):
+        runs.append((user_id, job_id, file_path))
+        return {'status': 'SUCCESS', 'exitCode': 0}
+
+    monkeypatch.setattr(security_consumer, 'run_security_pipeline', pipeline)
+    source = tmp_path / 'p.zip'
+    source.write_bytes(b'zip')
+    return types.SimpleNamespace(consumer=consumer, sent=sent, runs=runs, file_path=str(source))
+
+
+@pytest.mark.parametrize('request_value, missing', [
+    ({'userId': 1, 'jobId': None, 'filePath': 'x.zip'}, 'jobId'),
+    ({'userId': 1, 'jobId': 2, 'filePath': None}, 'filePath'),
+    ({'userId': 1, 'jobId': None, 'filePath': ''}, 'jobId, filePath'),
+    ({'jobId': 2, 'filePath': 'x.zip'}, 'user_id'),
+])
+def test_missing_fields_are_rejected_without_running(handler, request_value, missing):
+    handler.consumer.handle_message(Message(request_value))
+    (agent, payload), = handler.sent
+    assert agent == 'SECU' and payload['status'] == 'FAIL_BAD_REQUEST' and payload['exitCode'] == 1
+    assert payload['reason'].endswith(f"missing fields: {missing}")
+    assert handler.runs == []
+
+
+def test_completed_job_is_replayed_from_ledger(handler):
+    request = {'userId': 1, 'jobId': 2, 'filePath': handler.file_path}
+    handler.consumer.handle_message(Message(request))
+    handler.consumer.handle_message(Message(request))
+    assert len(handler.runs) == 1
+    assert handler.sent[0] == handler.sent[1] == ('SECU', {'eventType': 'SecurityFinished', 'userId': 1, 'jobId': 2,
+                                                          'status': 'SUCCESS', 'exitCode': 0})
@@ -0,0 +1,86 @@
+# tests/test_snapshot.py
+# 역할: 증분 재분석 스냅샷 — 파일 diff, 작업별 위치(userId + 업로드 이름), staging → current 교체/폐기, changeset.json 정리
+
+import importlib
+import os
+
+import pytest
+
+from translate.app.analyzer import snapshot
+from translate.app.nodes import analyze
+
+
+def _manifest(files):
+    return {'source': 'p.zip', 'files': [{'rel_path': rel, 'sha256': digest} for rel, digest in files.items()]}
+
+
+def test_diff_files():
+    previous = _manifest({'a.java': '1', 'b.java': '2', 'gone.java': '3'})
+    current = _manifest({'a.java': '1', 'b.java': 'x', 'new.java': '4'})
+    assert snapshot.diff_files(previous, current) == {'added': ['new.java'], 'modified': ['b.java'],
+                                                      'removed': ['gone.java'], 'unchanged': ['a.java']}
+    assert snapshot.diff_files(None, current)['added'] == ['a.java', 'b.java', 'new.java']
+
+
+def test_project_snapshot_dir(tmp_path):
+    root = str(tmp_path)
+    assert snapshot.project_snapshot_dir(3, '/uploads/board.zip', root) == os.path.join(root, '3', 'board')
+    assert snapshot.project_snapshot_dir(3, 's3://bucket/u/my board.zip?v=2', root) == os.path.join(root, '3', 'my_board')
+    assert snapshot.project_snapshot_dir(None, 'board.zip', root) is None
+    assert snapshot.project_snapshot_dir(3, 'board.zip', '') is None   # ANALYSIS_SNAPSHOT_DIR='' → 끔
+
+
+def test_snapshot_is_promoted_only_when_written(tmp_path):
+    project = snapshot.project_snapshot_dir(1, 'board.zip', str(tmp_path))
+    previous, staging = snapshot.begin_snapshot(project)
+    assert snapshot.load_snapshot(previous) is None
+    snapshot.save_snapshot(staging, _manifest({'a.java': '1'}), java_classes=[{'name': 'A'}])
+    snapshot.promote_snapshot(staging, project)
+    assert snapshot.load_snapshot(previous)['java_classes'] == [{'name': 'A'}]
+
+    # 다음 작업: 실패하면 staging을 버리고 current는 그대로
+    previous, staging = snapshot.begin_snapshot(project)
+    snapshot.save_snapshot(staging, _manifest({'a.java': '2'}), java_classes=[{'name': 'B'}])
+    snapshot.discard_snapshot(staging)
+    assert snapshot.load_snapshot(previous)['java_classes'] == [{'name': 'A'}]
+
+    # 성공했지만 분석이 스냅샷을 쓰지 않았으면(예: 분석 실패) 기존 current 유지
+    previous, staging = snapshot.begin_snapshot(project)
+    snapshot.promote_snapshot(staging, project)
+    assert snapshot.load_snapshot(previous)['java_classes'] == [{'name': 'A'}]
+
+    previous, staging = snapshot.begin_snapshot(project)
+    snapshot.save_snapshot(staging, _manifest({'a.java': '3'}), java_classes=[{'name': 'C'}])
+    snapshot.promote_snapshot(staging, project)
+    assert snapshot.load_snapshot(previous)['java_classes'] == [{'name': 'C'}]
+    assert sorted(os.listdir(project)) == ['current']
+
+
+def test_stale_changeset_is_removed(tmp_path):
+    output = str(tmp_path)
+    path = analyze._write_changeset({'changeset': {'files': {}}}, output)
+    assert path and os.path.exists(path)
+    assert analyze._write_changeset({}, output) is None   # 스냅샷 없는 다음 작업이 이전 changeset을 읽지 않도록
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize('final_status, promoted', [('SUCCESS', True), ('FAIL', False)])
+def test_conversion_run_promotes_snapshot_only_on_success(monkeypatch, tmp_path, final_status, promoted):
+    pytest.importorskip('langchain')
+    orchestrator = importlib.import_module('translate.app.orchestrator')
+    monkeypatch.setattr(snapshot, 'ANALYSIS_SNAPSHOT_DIR', str(tmp_path))
+    agent = object.__new__(orchestrator.ConversionAgent)  # LLM/도구 없이 run()의 스냅샷 처리만
+
+    def fake_run(user_id, job_id, input_path, outdir):
+        # run_analysis 도구가 받을 값: 이전 스냅샷(current) + 이번 staging
+        assert agent._snapshot['previous_snapshot'] == os.path.join(str(tmp_path), '1', 'board', 'current')
+        snapshot.save_snapshot(agent._snapshot['snapshot_dir'], _manifest({'a.java': '1'}), java_classes=[{'name': 'A'}])
+        orchestrator._finished.append({'agent': 'EGOV', 'message': {'status': final_status}})
+        return {'output': 'done'}
+
+    monkeypatch.setattr(agent, '_run', fake_run, raising=False)
+    assert agent.run(1, 2, '/uploads/board.zip') == {'output': 'done'}
+    assert agent._snapshot == {}
+    current = os.path.join(str(tmp_path), '1', 'board', 'current')
+    assert (snapshot.load_snapshot(current) is not None) == promoted
+    assert [n for n in os.listdir(os.path.join(str(tmp_path), '1', 'board')) if n.startswith('staging-')] == []
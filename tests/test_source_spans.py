@@ -0,0 +1,99 @@
+# tests/test_source_spans.py
+# 역할: Java 클래스 본문 spans — 단일/복수 최상위 타입, 중첩 타입, javadoc/어노테이션 포함 범위, 폴백, SourceTable 복원 (백엔드 공통)
+
+import pytest
+
+from translate.app.analyzer.java_backends import available_backends, create_java_analyzer
+from translate.app.analyzer.java_lenient_fallback import extract_classes_lenient_from_text
+from translate.app.analyzer.source_table import SourceTable, span_key
+
+SINGLE = """package a.b;
+
+import java.util.List;
+
+/** 게시판 서비스 */
+@Service
+public class BoardService {
+    static class Page { int no; }
+    public List<String> list() { return null; }
+}
+"""
+
+MULTI = """package a.b;
+import java.util.Map;
+
+@Controller
+public class BoardController {
+    void go() { }
+}
+
+class BoardHelper implements Runnable {
+    public void run() { if (true) { } }
+}
+"""
+
+
+def _write(tmp_path, name, code):
+    (tmp_path / name).write_text(code, encoding='utf-8')
+    return str(tmp_path / name)
+
+
+def _bodies(tmp_path, name, classes):
+    sources = SourceTable(str(tmp_path))
+    return {c['name']: sources.body({**c, 'source_info': {'rel_path': name}}) for c in classes}
+
+
+@pytest.fixture(params=available_backends())
+def backend(request):
+    return request.param
+
+
+def test_single_top_level_type_spans_whole_file(tmp_path, backend):
+    classes = create_java_analyzer(_write(tmp_path, 'BoardService.java', SINGLE), backend=backend).extract_classes()
+    by_name = {c['name']: c for c in classes}
+    assert by_name['BoardService']['spans'] == [[0, len(SINGLE)]]
+    bodies = _bodies(tmp_path, 'BoardService.java', classes)
+    assert bodies['BoardService'] == SINGLE
+    # 중첩 타입: package/import 구간 + 자기 선언
+    assert bodies['Page'] == "package a.b;\n\nimport java.util.List;\n\nstatic class Page { int no; }"
+
+
+def test_multiple_top_level_types_get_prelude_and_own_range(tmp_path, backend):
+    classes = create_java_analyzer(_write(tmp_path, 'BoardController.java', MULTI), backend=backend).extract_classes()
+    bodies = _bodies(tmp_path, 'BoardController.java', classes)
+    prelude = "package a.b;\nimport java.util.Map;"
+    assert bodies['BoardController'] == prelude + "\n\n@Controller\npublic class BoardController {\n    void go() { }\n}"
+    assert bodies['BoardHelper'] == prelude + "\n\nclass BoardHelper implements Runnable {\n    public void run() { if (true) { } }\n}"
+    assert len({span_key(c) for c in classes}) == 2
+
+
+def test_backends_agree_on_spans(tmp_path):
+    if len(available_backends()) < 2:
+        pytest.skip('tree-sitter-java not installed')
+    results = []
+    for name in available_backends():
+        for file_name, code in (('BoardService.java', SINGLE), ('BoardController.java', MULTI)):
+            classes = create_java_analyzer(_write(tmp_path, file_name, code), backend=name).extract_classes()
+            results.append(sorted((c['name'], span_key(c)) for c in classes))
+    half = len(results) // 2
+    assert results[:half] == results[half:]
+
+
+def test_lenient_fallback_spans_whole_normalized_file(tmp_path):
+    code = "public record Point(int x, int y) { }\r\nclass Util { }\r\n"
+    classes = extract_classes_lenient_from_text(code)
+    assert [c['name'] for c in classes] == ['Util']
+    (tmp_path / 'Point.java').write_bytes(code.encode('utf-8'))
+    # SourceTable은 universal newline으로 읽으므로 폴백의 CRLF 정규화와 offset이 맞는다
+    assert _bodies(tmp_path, 'Point.java', classes)['Util'] == code.replace('\r\n', '\n')
+
+
+def test_source_table_reads_each_file_once_and_handles_legacy_records(tmp_path):
+    _write(tmp_path, 'A.java', 'class A { }')
+    sources = SourceTable(str(tmp_path))
+    record = {'spans': [[0, 5], [6, 11]], 'source_info': {'rel_path': 'A.java'}}
+    assert sources.body(record) == 'class\n\nA { }'
+    (tmp_path / 'A.java').unlink()
+    assert sources.body(record) == 'class\n\nA { }'   # 캐시
+    assert sources.body({'body': 'legacy'}) == 'legacy'
+    assert SourceTable(str(tmp_path)).body(record) == '\n\n'   # 없는 파일은 빈 원문
@@ -0,0 +1,131 @@
+# tests/test_worker.py
+# 역할: translate worker — OffsetTracker 커밋 위치, KeyedJobExecutor(key별 순차 실행/pending/제출 실패), 입력 경로 고정, 분석 프로세스 몫
+
+import os
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from translate.app.worker import KeyedJobExecutor, OffsetTracker, absolute_input, analyze_share, _init_worker
+
+
+def test_offset_tracker_commits_contiguous_prefix_only():
+    offsets = OffsetTracker()
+    for offset in (10, 11, 12):
+        offsets.track('conversion', 0, offset)
+    offsets.track('conversion', 1, 5)
+    offsets.done('conversion', 0, 11)
+    assert offsets.committable() == {}
+    offsets.done('conversion', 0, 10)
+    offsets.done('conversion', 1, 5)
+    assert offsets.committable() == {('conversion', 0): 12, ('conversion', 1): 6}
+    offsets.done('conversion', 0, 12)
+    assert offsets.committable() == {('conversion', 0): 13}
+    assert offsets.committable() == {}
+
+
+def test_offset_tracker_forget_and_unknown_offsets():
+    offsets = OffsetTracker()
+    offsets.track('conversion', 0, 1)
+    offsets.done('conversion', 0, 99)    # 추적하지 않은 오프셋은 무시
+    offsets.done('conversion', 3, 1)
+    offsets.forget('conversion', 0)
+    offsets.done('conversion', 0, 1)
+    assert offsets.committable() == {}
+
+
+def test_absolute_input_resolves_local_paths_only(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert absolute_input('uploads/a.zip') == os.path.join(str(tmp_path), 'uploads', 'a.zip')
+    assert absolute_input('/data/a.zip') == '/data/a.zip'
+    assert absolute_input('s3://bucket/a.zip') == 's3://bucket/a.zip'
+    assert absolute_input('https://host/a.zip?sig=1') == 'https://host/a.zip?sig=1'
+
+
+class _ManualPool:
+    """submit만 기록하고 완료는 테스트가 정하는 풀 (fail이 True면 제출 자체가 실패)"""
+    def __init__(self):
+        self.futures, self.fail = [], False
+
+    def submit(self, fn, request):
+        if self.fail:
+            raise RuntimeError('pool broken')
+        future = Future()
+        self.futures.append((request, future))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+@pytest.fixture
+def executor(tmp_path):
+    ex = KeyedJobExecutor(abs, max_workers=1, max_pending=2, workdir=str(tmp_path))
+    ex.pool.shutdown()
+    ex.pool = _ManualPool()
+    return ex
+
+
+def test_same_key_runs_one_at_a_time(executor):
+    executor.submit('u1', 'job-a', 1)
+    executor.submit('u1', 'job-b', 2)
+    executor.submit('u2', 'job-c', 3)
+    assert [r for r, _ in executor.pool.futures] == [1, 3]
+    assert executor.pending == 3 and executor.saturated
+
+    executor.pool.futures[0][1].set_result('A')
+    assert executor.drain() == [('job-a', 'A', None)]
+    assert [r for r, _ in executor.pool.futures] == [1, 3, 2]   # 같은 key의 다음 작업 시작
+    assert executor.pending == 2 and 'u1' not in executor.waiting
+
+
+def test_submit_failure_does_not_leak_pending(executor):
+    executor.pool.fail = True
+    with pytest.raises(RuntimeError):
+        executor.submit('u1', 'job-a', 1)
+    assert executor.pending == 0
+    assert executor.running == set()
+    assert not executor.saturated
+
+
+def test_backlog_start_failure_is_reported_as_finished(executor):
+    executor.submit('u1', 'job-a', 1)
+    executor.submit('u1', 'job-b', 2)
+    executor.pool.fail = True
+    executor.pool.futures[0][1].set_result('A')
+    finished = executor.drain()
+    assert [(job, result) for job, result, _ in finished] == [('job-a', 'A'), ('job-b', None)]
+    assert isinstance(finished[1][2], RuntimeError)
+    assert executor.pending == 0 and executor.running == set() and executor.waiting == {}
+
+
+def test_process_pool_runs_in_worker_directory(tmp_path):
+    ex = KeyedJobExecutor(abs, max_workers=1, max_pending=1, workdir=str(tmp_path / 'workers'))
+    try:
+        ex.submit('k', 'job', -3)
+        deadline, finished = time.time() + 60, []
+        while not finished and time.time() < deadline:
+            finished = ex.drain(timeout=1.0)
+        assert finished == [('job', 3, None)]
+        assert [p.name for p in (tmp_path / 'workers').iterdir()][0].startswith('worker-')
+    finally:
+        ex.shutdown()
+
+
+def test_analyze_share_divides_analysis_workers(monkeypatch):
+    monkeypatch.setenv('ANALYZE_WORKERS', '8')
+    assert analyze_share(2) == 4
+    assert analyze_share(3) == 2
+    assert analyze_share(16) == 1
+    monkeypatch.delenv('ANALYZE_WORKERS')
+    monkeypatch.setattr(os, 'cpu_count', lambda: 6)
+    assert analyze_share(2) == 3
+
+
+def test_init_worker_sets_analysis_share(tmp_path, monkeypatch):
+    monkeypatch.setenv('ANALYZE_WORKERS', '8')
+    monkeypatch.chdir(tmp_path)
+    _init_worker(str(tmp_path / 'workers'), 4)
+    assert os.environ['ANALYZE_WORKERS'] == '4'
+    assert os.getcwd() == str(tmp_path / 'workers' / f'worker-{os.getpid()}')
@@ -0,0 +1,111 @@
+# tests/test_xml_mapper.py
+# 역할: XML 매퍼 — 구문/조각 수집, <include> 펼치기(같은 파일/다른 매퍼/중첩/순환/없는 조각), 동적 태그, sql_bindings
+
+from translate.app.analyzer.xml_mapper_analyzer import XmlMapperAnalyzer, parse_mapper, bind_queries, sql_bindings
+
+BOARD = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE mapper PUBLIC "-//mybatis.org//DTD Mapper 3.0//EN" "http://mybatis.org/dtd/mybatis-3-mapper.dtd">
+<mapper namespace="egov.board.BoardMapper">
+  <sql id="columns">ID, TITLE</sql>
+  <sql id="where">WHERE USE_AT = 'Y' <include refid="egov.common.CommonMapper.paging"/></sql>
+  <select id="selectBoardList" resultType="map">
+    SELECT <include refid="columns"/>
+      FROM BOARD
+    <include refid="where"/>
+    <if test="title != null">AND TITLE LIKE #{title}</if>
+  </select>
+  <insert id="insertBoard">
+    <selectKey keyProperty="id" resultType="int">SELECT NEXTVAL</selectKey>
+    INSERT INTO BOARD (<include refid="columns"/>) VALUES (#{id}, #{title})
+  </insert>
+  <select id="selectMissing">SELECT 1 <include refid="nowhere"/> FROM DUAL</select>
+  <sql id="a">A <include refid="b"/></sql>
+  <sql id="b">B <include refid="a"/></sql>
+  <select id="selectCycle">SELECT <include refid="a"/></select>
+</mapper>
+"""
+
+COMMON = """<?xml version="1.0" encoding="UTF-8"?>
+<mapper namespace="egov.common.CommonMapper">
+  <sql id="paging">LIMIT #{size} OFFSET #{offset}</sql>
+</mapper>
+"""
+
+IBATIS = """<?xml version="1.0" encoding="UTF-8"?>
+<sqlMap namespace="boardDAO">
+  <select id="selectBoard">SELECT * FROM BOARD <dynamic prepend="WHERE"><isNotEmpty property="id">ID = #id#</isNotEmpty></dynamic></select>
+</sqlMap>
+"""
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def _mapper(tmp_path, name, text):
+    return parse_mapper(_write(tmp_path, name, text))
+
+
+def test_parse_mapper_keeps_includes_unexpanded(tmp_path):
+    mapper = _mapper(tmp_path, 'board.xml', BOARD)
+    assert mapper['namespace'] == 'egov.board.BoardMapper'
+    assert set(mapper['fragments']) == {f'egov.board.BoardMapper.{i}' for i in ('columns', 'where', 'a', 'b')}
+    assert mapper['statements']['egov.board.BoardMapper.selectBoardList'][:2] == [
+        'SELECT', {'include': 'columns', 'namespace': 'egov.board.BoardMapper'}]
+
+
+def test_bind_queries_expands_local_nested_and_cross_file_includes(tmp_path):
+    bank = bind_queries([_mapper(tmp_path, 'board.xml', BOARD), _mapper(tmp_path, 'common.xml', COMMON)])
+    assert bank['egov.board.BoardMapper.selectBoardList'] == (
+        "SELECT ID, TITLE FROM BOARD WHERE USE_AT = 'Y' LIMIT #{size} OFFSET #{offset} AND TITLE LIKE #{title}")
+    assert bank['egov.board.BoardMapper.insertBoard'] == 'INSERT INTO BOARD ( ID, TITLE ) VALUES (#{id}, #{title})'
+    assert 'egov.board.BoardMapper.columns' not in bank   # <sql> 조각은 구문이 아님
+
+
+def test_bind_queries_drops_missing_and_cyclic_fragments(tmp_path):
+    bank = bind_queries([_mapper(tmp_path, 'board.xml', BOARD), None])   # None = 파싱 실패한 매퍼
+    assert bank['egov.board.BoardMapper.selectMissing'] == 'SELECT 1 FROM DUAL'
+    assert bank['egov.board.BoardMapper.selectCycle'] == 'SELECT A B'
+    # 다른 매퍼의 조각이 없으면 그 부분만 빠진다
+    assert bank['egov.board.BoardMapper.selectBoardList'].startswith("SELECT ID, TITLE FROM BOARD WHERE USE_AT = 'Y' AND")
+
+
+def test_later_mapper_overrides_same_id(tmp_path):
+    first = _mapper(tmp_path, 'a.xml', '<mapper namespace="n"><select id="q">SELECT 1</select></mapper>')
+    second = _mapper(tmp_path, 'b.xml', '<mapper namespace="n"><select id="q">SELECT 2</select></mapper>')
+    assert bind_queries([first, second]) == {'n.q': 'SELECT 2'}
+
+
+def test_ibatis_dynamic_tags_and_analyzer_wrapper(tmp_path):
+    analyzer = XmlMapperAnalyzer(_write(tmp_path, 'board_sql.xml', IBATIS))
+    assert analyzer.get_queries() == {'boardDAO.selectBoard': 'SELECT * FROM BOARD ID = #id#'}
+    broken = XmlMapperAnalyzer(_write(tmp_path, 'broken.xml', '<mapper namespace="x"><select id="q">'))
+    assert broken.mapper is None and broken.get_queries() == {}
+
+
+def test_mapper_without_namespace_has_no_statements(tmp_path):
+    mapper = _mapper(tmp_path, 'nons.xml', '<mapper><select id="q">SELECT 1</select></mapper>')
+    assert mapper['statements'] == {} and bind_queries([mapper]) == {}
+
+
+def test_sql_bindings_by_namespace_and_literal():
+    bank = {'egov.board.BoardMapper.selectBoardList': 'SELECT 1', 'boardDAO.selectBoard': 'SELECT 2',
+            'userDAO.selectUser': 'SELECT 3'}
+    classes = [
+        {'name': 'BoardMapper', 'role': {'type': 'DAO'}, 'source_info': {'rel_path': 'a/BoardMapper.java'}},
+        {'name': 'BoardDAO', 'role': {'type': 'DAO'}, 'source_info': {'rel_path': 'a/BoardDAO.java'}},
+        {'name': 'BoardService', 'role': {'type': 'SERVICE'}, 'source_info': {'rel_path': 'a/BoardService.java'}},
+        {'name': 'UserController', 'role': {'type': 'CONTROLLER'}, 'source_info': {'rel_path': 'a/UserController.java'}},
+    ]
+    bodies = {'BoardDAO': 'return select("boardDAO.selectBoard", vo);',
+              'BoardService': 'dao.call("userDAO.selectUser"); log("not.a.query");',
+              'UserController': 'String s = "UserController";'}
+    bindings = sql_bindings(classes, bank, lambda cls: bodies.get(cls['name'], ''))
+    assert bindings == [
+        {'class': 'BoardMapper', 'rel_path': 'a/BoardMapper.java',
+         'queries': {'egov.board.BoardMapper.selectBoardList': 'SELECT 1'}},
+        {'class': 'BoardDAO', 'rel_path': 'a/BoardDAO.java', 'queries': {'boardDAO.selectBoard': 'SELECT 2'}},
+        {'class': 'BoardService', 'rel_path': 'a/BoardService.java', 'queries': {'userDAO.selectUser': 'SELECT 3'}},
+    ]
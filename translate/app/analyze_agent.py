@@ -7,6 +7,7 @@ from langgraph.graph import StateGraph, START, END
 
 from translate.app.states import State
 from translate.app.nodes.preprocess import preprocessing
+from translate.app.nodes.changeset import compute_changeset
 from translate.app.nodes.detect import detect_language, select_lang
 from translate.app.nodes.analyze import analyze_python, analyze_java
 
@@ -19,12 +20,14 @@ class AnalysisAgent:
     def build_graph(self):
         builder = StateGraph(State)
         builder.add_node('preprocessing', preprocessing)
+        builder.add_node('changeset', compute_changeset)
         builder.add_node('detect', detect_language)
         builder.add_node('analyze_python', analyze_python)
         builder.add_node('analyze_java', analyze_java)
         
         builder.add_edge(START, 'preprocessing')
-        builder.add_edge('preprocessing', 'detect')
+        builder.add_edge('preprocessing', 'changeset')
+        builder.add_edge('changeset', 'detect')
         builder.add_conditional_edges(
             'detect', select_lang,
             {'python': 'analyze_python', 'java': 'analyze_java', 'unknown': END}
@@ -56,8 +59,8 @@ if __name__ == '__main__':
                     "extract_dir": temp_dir_path,
                     "report_files": final_state.get("report_files", []),
                     "counts": {
-                        "classes": len(final_state.get("classes", [])) if isinstance(final_state.get("classes"), list) else None,
-                        "functions": len(final_state.get("functions", [])) if isinstance(final_state.get("functions"), list) else None,
+                        "classes": len(final_state["classes"]) if isinstance(final_state.get("classes"), list) else final_state.get("class_count"),
+                        "functions": len(final_state["functions"]) if isinstance(final_state.get("functions"), list) else final_state.get("function_count"),
                     },
                     "language": final_state.get("language"),
                     "framework": final_state.get("framework"),
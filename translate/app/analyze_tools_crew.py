@@ -8,7 +8,7 @@ import os, re, json, hashlib
 from analyzer.file_extractor import FileExtractor
 from analyzer.python_analyzer import PythonAnalyzer
 from analyzer.java_analyzer import JavaAnalyzer
-from analyzer.xml_mapper_analyzer import XmlMapperAnalyzer
+from analyzer.xml_mapper_analyzer import XmlMapperAnalyzer, bind_queries
 from analyzer.structure_mapper import StructureMapper
 from analyzer.external_usage_detector import ExternalUsageDetector
 from log import Logger
@@ -57,8 +57,7 @@ def preprocessing(state: dict) -> dict:
     try:
         # FileExtractor가 주어진 경로를 사용하도록 수정합니다.
         extractor = FileExtractor(state['input_path'], state['extract_dir'])
-        extractor.extract_zip()
-        code_files = extractor.find_supported_code_files()
+        code_files = extractor.extract_supported()
         logger.info(f"Extracted to '{state['extract_dir']}' and found {len(code_files)} supported files.")
         state['code_files'] = code_files
         return state
@@ -176,10 +175,13 @@ def analyze_python(state: dict) -> dict:
             cls['source_info'] = source_info
             all_classes.append(cls)
 
-    # 역할 추론
+    # 역할 추론 ((rel_path, 클래스) → 메서드 색인을 한 번 만들어 클래스마다 전체 함수를 훑지 않는다)
+    methods_by_class = {}
+    for f in all_functions:
+        if f.get('class'):
+            methods_by_class.setdefault(((f.get('source_info') or {}).get('rel_path'), f['class']), []).append(f)
     for cls in all_classes:
-        class_methods = [f for f in all_functions if f.get('class') == cls.get('name') and
-                         (f.get('source_info') or {}).get('rel_path') == (cls.get('source_info') or {}).get('rel_path')]
+        class_methods = methods_by_class.get(((cls.get('source_info') or {}).get('rel_path'), cls.get('name')), [])
         cls['role'] = mapper.infer_class_role({**cls, "functions": class_methods})
     for func in all_functions:
         if not func.get('class'):
@@ -242,10 +244,9 @@ def analyze_java(state: dict) -> dict:
     base_zip_name = os.path.basename(state.get('input_path', ''))
     extract_dir = state.get('extract_dir')
 
-    # XML Mapper (MyBatis 등)
-    for file_path, lang in state.get('code_files', []):
-        if lang == 'xml' and 'src/main/resources' in file_path:
-            query_bank.update(XmlMapperAnalyzer(file_path).get_queries())
+    # XML Mapper (MyBatis 등) — <include>가 다른 매퍼의 <sql> 조각을 참조할 수 있어 전부 모은 뒤 결합
+    query_bank = bind_queries([XmlMapperAnalyzer(file['path']).mapper for file in state.get('code_files', [])
+                               if file['language'] == 'xml' and 'src/main/resources' in file['path']])
 
     # 자바 클래스
     for file in state.get('code_files', []):
@@ -0,0 +1,293 @@
+# translate/app/analyzer/call_graph.py
+# 역할: 프로젝트 단위 심볼 테이블(module → class → method) + 해석된 호출 그래프
+#   - 문자열(모듈/클래스/함수 이름)은 StringPool로 interning → 심볼 하나 = int 3개 (array('i') 컬럼)
+#     같은 (module, class, name)은 한 심볼 (Java 오버로드, 같은 이름 재정의는 호출 목록이 합쳐진다)
+#   - freeze()에서 함수 레코드의 calls.target 문자열을 심볼로 해석하고 CSR(offsets + targets 정수 배열)로 저장
+#       callees(s) = targets[offsets[s]:offsets[s+1]], callers도 역방향 CSR → 둘 다 O(차수)
+#       methods_of(module, class)는 클래스별로 모아 둔 CSR 구간 → O(1) 조회 + O(메서드 수) 반환
+#   - 호출 해석 규칙 (모호하면 해석하지 않는다 — 엣지 누락이 오연결보다 낫다)
+#       self.m / cls.m / this.m           → 같은 클래스의 m
+#       f                                 → 같은 모듈 함수 → 같은 클래스 메서드 → 클래스 f의 생성자 → 프로젝트에 하나뿐인 함수 f
+#       q.m (q = 마지막 qualifier)        → 클래스 q / q의 CamelCase(boardService → BoardService, user_repo → UserRepo)의 m
+#                                            (같은 모듈 우선, 아니면 그 이름의 클래스가 프로젝트에 하나일 때만) → 모듈 q의 함수 m
+#   - save()/load(): output/java_call_graph.json (문자열 표 + 정수 배열, 역방향 CSR은 load 시 다시 만든다)
+
+import os
+from array import array
+
+from translate.app.analyzer.jsonl_store import dumps, loads
+
+NO_ID = -1
+_SELF_QUALIFIERS = ("self", "cls", "this")
+_CONSTRUCTORS = ("__init__",)
+
+
+def module_name(rel_path: str) -> str:
+    """'pkg/sub/mod.py' → 'pkg.sub.mod' ('pkg/__init__.py' → 'pkg', .java도 같은 규칙)"""
+    path = (rel_path or "").replace("\\", "/")
+    for ext in (".py", ".java"):
+        if path.endswith(ext):
+            path = path[:-len(ext)]
+            break
+    module = path.strip("/").replace("/", ".")
+    if module.endswith(".__init__"):
+        module = module[:-len(".__init__")]
+    return module
+
+
+def _camel(name: str) -> str:
+    if "_" in name:
+        return "".join(part[:1].upper() + part[1:] for part in name.split("_") if part)
+    return name[:1].upper() + name[1:]
+
+
+class StringPool:
+    def __init__(self, strings=()):
+        self.strings = []
+        self._ids = {}
+        for s in strings:
+            self.intern(s)
+
+    def intern(self, s: str) -> int:
+        sid = self._ids.get(s)
+        if sid is None:
+            sid = self._ids[s] = len(self.strings)
+            self.strings.append(s)
+        return sid
+
+    def id(self, s: str) -> int:
+        return self._ids.get(s, NO_ID)
+
+    def __getitem__(self, sid: int):
+        return None if sid == NO_ID else self.strings[sid]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+def _csr(n: int, edges) -> tuple:
+    """[(src, dst)] → (offsets, targets). 같은 src의 dst는 입력 순서 유지 (counting sort, O(n + E))"""
+    offsets = array('l', [0]) * (n + 1)
+    for src, _ in edges:
+        offsets[src + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    fill = array('l', offsets)
+    targets = array('i', [0]) * len(edges)
+    for src, dst in edges:
+        targets[fill[src]] = dst
+        fill[src] += 1
+    return offsets, targets
+
+
+class ProjectGraph:
+    """
+    graph = ProjectGraph()
+    graph.add_functions(module_name(rel_path), functions)   # 파일마다 (함수 레코드 스키마 그대로)
+    graph.freeze()
+    graph.methods_of(module, "UserService"), graph.callers(graph.find(module, "UserService", "save"))
+    """
+    def __init__(self):
+        self.pool = StringPool()
+        self.sym_module, self.sym_class, self.sym_name = array('i'), array('i'), array('i')
+        self._index = {}    # (module, class, name) id → 심볼
+        self._pending = []  # 심볼별 호출 target id (freeze 전까지)
+        self.unresolved = 0
+        self.offsets = self.targets = self.rev_offsets = self.rev_targets = None
+        self._class_ranges, self._class_members = {}, array('i')
+
+    # ---------------- 구성 ----------------
+    def add_function(self, module: str, class_name, name: str, call_targets=()) -> int:
+        intern = self.pool.intern
+        key = (intern(module), intern(class_name) if class_name else NO_ID, intern(name))
+        sym = self._index.get(key)
+        if sym is None:
+            sym = self._index[key] = len(self.sym_name)
+            self.sym_module.append(key[0]); self.sym_class.append(key[1]); self.sym_name.append(key[2])
+            self._pending.append(array('i'))
+        self._pending[sym].extend(intern(t) for t in call_targets)
+        return sym
+
+    def add_functions(self, module: str, functions) -> None:
+        for f in functions:
+            if f.get("name"):
+                targets = [c["target"] for c in (f.get("calls") or []) if c.get("target")]
+                self.add_function(module, f.get("class"), f["name"], targets)
+
+    def freeze(self) -> "ProjectGraph":
+        n = len(self.sym_name)
+        self._build_class_index()
+        resolver = _Resolver(self)
+        edges, self.unresolved = [], 0
+        for sym in range(n):
+            seen = set()
+            for target in self._pending[sym]:
+                callee = resolver.resolve(sym, target)
+                if callee == NO_ID:
+                    self.unresolved += 1
+                elif callee not in seen:
+                    seen.add(callee)
+                    edges.append((sym, callee))
+        self._pending = []
+        self._compact()
+        self.offsets, self.targets = _csr(n, edges)
+        self._build_reverse()
+        return self
+
+    def _compact(self):
+        """호출 target 문자열은 해석이 끝나면 필요 없으므로 심볼이 쓰는 문자열만 남긴다"""
+        pool, old = StringPool(), self.pool
+        remap = lambda column: array('i', (NO_ID if i == NO_ID else pool.intern(old[i]) for i in column))
+        self.sym_module, self.sym_class, self.sym_name = (remap(c) for c in (self.sym_module, self.sym_class, self.sym_name))
+        self.pool = pool
+        self._index = {key: sym for sym, key in enumerate(zip(self.sym_module, self.sym_class, self.sym_name))}
+        self._build_class_index()
+
+    def _build_class_index(self):
+        by_class = {}
+        for sym in range(len(self.sym_name)):
+            if self.sym_class[sym] != NO_ID:
+                by_class.setdefault((self.sym_module[sym], self.sym_class[sym]), []).append(sym)
+        self._class_ranges, self._class_members = {}, array('i')
+        for key, members in by_class.items():
+            self._class_ranges[key] = (len(self._class_members), len(self._class_members) + len(members))
+            self._class_members.extend(members)
+
+    def _build_reverse(self):
+        n = len(self.sym_name)
+        self.rev_offsets, self.rev_targets = _csr(n, [(self.targets[i], src) for src in range(n)
+                                                      for i in range(self.offsets[src], self.offsets[src + 1])])
+
+    # ---------------- 조회 ----------------
+    def __len__(self):
+        return len(self.sym_name)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets) if self.targets is not None else 0
+
+    def find(self, module: str, class_name, name: str) -> int:
+        pid = self.pool.id
+        return self._index.get((pid(module), pid(class_name) if class_name else NO_ID, pid(name)), NO_ID)
+
+    def symbol(self, sym: int) -> tuple:
+        """(module, class, name) — 모듈 함수는 class가 None"""
+        return self.pool[self.sym_module[sym]], self.pool[self.sym_class[sym]], self.pool[self.sym_name[sym]]
+
+    def methods_of(self, module: str, class_name: str):
+        start, end = self._class_ranges.get((self.pool.id(module), self.pool.id(class_name)), (0, 0))
+        return self._class_members[start:end]
+
+    def callees(self, sym: int):
+        return self.targets[self.offsets[sym]:self.offsets[sym + 1]]
+
+    def callers(self, sym: int):
+        return self.rev_targets[self.rev_offsets[sym]:self.rev_offsets[sym + 1]]
+
+    def stats(self) -> dict:
+        return {"symbols": len(self), "classes": len(self._class_ranges), "edges": self.edge_count,
+                "unresolved_calls": self.unresolved, "strings": len(self.pool)}
+
+    # ---------------- 저장 ----------------
+    def save(self, path: str) -> None:
+        data = {"strings": self.pool.strings, "module": self.sym_module.tolist(), "class": self.sym_class.tolist(),
+                "name": self.sym_name.tolist(), "offsets": self.offsets.tolist(), "targets": self.targets.tolist(),
+                "unresolved": self.unresolved}
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(dumps(data))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectGraph":
+        with open(path, "rb") as f:
+            data = loads(f.read())
+        graph = cls()
+        graph.pool = StringPool(data["strings"])
+        graph.sym_module, graph.sym_class, graph.sym_name = (array('i', data[k]) for k in ("module", "class", "name"))
+        graph._index = {key: sym for sym, key in enumerate(zip(graph.sym_module, graph.sym_class, graph.sym_name))}
+        graph.offsets, graph.targets = array('l', data["offsets"]), array('i', data["targets"])
+        graph.unresolved = data.get("unresolved", 0)
+        graph._build_class_index()
+        graph._build_reverse()
+        return graph
+
+
+class _Resolver:
+    """freeze() 동안만 쓰는 이름 → 심볼 색인 (호출 target 문자열 id별 분해 결과는 캐시)"""
+    def __init__(self, graph: ProjectGraph):
+        self.graph, pool = graph, graph.pool
+        self.classes = {}       # class id → [module id, ...]
+        self.module_funcs = {}  # name id → [심볼, ...] (클래스 밖 함수)
+        self.module_tails = {}  # 모듈 마지막 이름 → [module id, ...]
+        for (module, class_id, name), sym in graph._index.items():
+            if class_id == NO_ID:
+                self.module_funcs.setdefault(name, []).append(sym)
+        for module, class_id in graph._class_ranges:
+            modules = self.classes.setdefault(class_id, [])
+            if module not in modules:
+                modules.append(module)
+        for module in {m for m, _, _ in graph._index}:
+            self.module_tails.setdefault(pool[module].rsplit(".", 1)[-1], []).append(module)
+        self._split = {}
+
+    def _parts(self, target: int) -> tuple:
+        """target id → (qualifier, 클래스 이름 id 후보들, member id). 이름만이면 qualifier '', self.m이면 후보 None
+        (문자열 표에 없는 이름은 어떤 심볼과도 맞지 않으므로 새로 intern하지 않고 NO_ID)"""
+        parts = self._split.get(target)
+        if parts is None:
+            pool = self.graph.pool
+            head, _, member = pool[target].rpartition(".")
+            qualifier = head.rsplit(".", 1)[-1]
+            if not head:
+                candidates = ()
+            elif qualifier in _SELF_QUALIFIERS:
+                candidates = None
+            else:
+                candidates = tuple(dict.fromkeys(pool.id(q) for q in (qualifier, _camel(qualifier))))
+            parts = self._split[target] = (qualifier, candidates, pool.id(member))
+        return parts
+
+    def _method(self, module: int, class_id: int, name: int) -> int:
+        return self.graph._index.get((module, class_id, name), NO_ID)
+
+    def _class_method(self, module: int, class_id: int, name: int) -> int:
+        """class_id 클래스의 name — 같은 모듈 우선, 아니면 그 이름의 클래스가 하나뿐일 때"""
+        sym = self._method(module, class_id, name)
+        if sym != NO_ID:
+            return sym
+        modules = self.classes.get(class_id)
+        if modules and len(modules) == 1:
+            return self._method(modules[0], class_id, name)
+        return NO_ID
+
+    def resolve(self, caller: int, target: int) -> int:
+        graph = self.graph
+        module, class_id = graph.sym_module[caller], graph.sym_class[caller]
+        qualifier, candidates, member = self._parts(target)
+        if member == NO_ID:
+            return NO_ID
+        if candidates is None:  # self.m / this.m
+            return self._method(module, class_id, member) if class_id != NO_ID else NO_ID
+        if not candidates:      # 이름만
+            for sym in (self._method(module, NO_ID, member),
+                        self._method(module, class_id, member) if class_id != NO_ID else NO_ID):
+                if sym != NO_ID:
+                    return sym
+            if member in self.classes:
+                for ctor in (*_CONSTRUCTORS, graph.pool[member]):
+                    ctor_id = graph.pool.id(ctor)
+                    sym = self._class_method(module, member, ctor_id) if ctor_id != NO_ID else NO_ID
+                    if sym != NO_ID:
+                        return sym
+            funcs = self.module_funcs.get(member)
+            return funcs[0] if funcs and len(funcs) == 1 else NO_ID
+        for class_name in candidates:
+            if class_name in self.classes:
+                sym = self._class_method(module, class_name, member)
+                if sym != NO_ID:
+                    return sym
+        modules = self.module_tails.get(qualifier)
+        if modules and len(modules) == 1:
+            return self._method(modules[0], NO_ID, member)
+        return NO_ID
@@ -0,0 +1,83 @@
+# translate/app/analyzer/columnar_store.py
+# 역할: Java 분석 결과의 컬럼형 산출물 (output/java_analysis_results.arrow) — 분석 → 변환 단계 handoff용
+#   - Arrow IPC 파일(비압축) 한 개: 컬럼 feature / role / rel_path / name / spans / body, 한 행 = 한 코드 조각
+#     행 순서는 java_analysis_results.json과 같다 (feature → role → 본문 정렬 순) → feature/role별로 연속된 구간
+#   - 스키마 metadata "index": {feature: {role: [시작 행, 행 수]}} → 읽는 쪽은 파일을 memory-map하고
+#     필요한 feature/role 구간만 slice해서 body를 꺼낸다 (JSON 전체 파싱 없음, 나머지 본문은 페이지에 올라오지도 않음)
+#   - 기본은 쓰지 않는다 (JSON과 같은 본문을 한 번 더 쓰게 되므로). ANALYSIS_ARROW=1이고 pyarrow가 설치돼 있을 때만 쓰고,
+#     읽는 쪽은 .arrow가 없으면 JSON으로 폴백
+#   - Parquet은 압축/인코딩 때문에 memory-map 후에도 디코딩이 필요해서 IPC 파일을 쓴다
+
+import os
+import json
+import logging
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+AVAILABLE = pa is not None
+ANALYSIS_ARROW = os.environ.get('ANALYSIS_ARROW', '0').lower()
+
+_INDEX_KEY = b"index"
+
+
+def enabled() -> bool:
+    return AVAILABLE and ANALYSIS_ARROW in ('1', 'true', 'on')
+
+
+def _schema():
+    return pa.schema([
+        ("feature", pa.dictionary(pa.int32(), pa.string())),
+        ("role", pa.dictionary(pa.int32(), pa.string())),
+        ("rel_path", pa.string()),
+        ("name", pa.string()),
+        ("spans", pa.list_(pa.list_(pa.int64(), 2))),
+        ("body", pa.large_string()),
+    ])
+
+
+def write_features(path: str, rows) -> int:
+    """
+    rows: (feature, role, rel_path, name, spans, body) iterable — feature/role별로 연속된 순서여야 한다
+    (rel_path/name/spans는 모르면 None). 쓴 행 수
+    """
+    columns = {name: [] for name in ("feature", "role", "rel_path", "name", "spans", "body")}
+    index = {}
+    for i, (feature, role, rel_path, name, spans, body) in enumerate(rows):
+        ranges = index.setdefault(feature, {})
+        if role in ranges:
+            ranges[role][1] += 1
+        else:
+            ranges[role] = [i, 1]
+        for key, value in zip(columns, (feature, role, rel_path, name, spans, body)):
+            columns[key].append(value)
+
+    schema = _schema().with_metadata({_INDEX_KEY: json.dumps(index, ensure_ascii=False).encode("utf-8")})
+    table = pa.Table.from_pydict(columns, schema=schema)
+    tmp = path + ".tmp"
+    with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+    return table.num_rows
+
+
+def read_features(path: str, only=None):
+    """
+    memory-map으로 열어 [(feature, {role: [body, ...]})]를 파일 순서대로. only(set)가 있으면 그 feature만 slice한다
+    """
+    with pa.memory_map(path, "r") as source:
+        reader = pa.ipc.open_file(source)
+        index = json.loads(reader.schema.metadata[_INDEX_KEY])
+        table = reader.read_all()  # 비압축 IPC라 memory-map 위의 zero-copy 뷰 (본문은 slice한 구간만 읽힘)
+        bodies = table.column("body")
+        features = []
+        for feature, ranges in index.items():
+            if only is not None and feature not in only:
+                continue
+            features.append((feature, {role: bodies.slice(offset, length).to_pylist()
+                                       for role, (offset, length) in ranges.items()}))
+        return features
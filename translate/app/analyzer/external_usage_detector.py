@@ -53,27 +53,23 @@ class ExternalUsageDetector(ast.NodeVisitor):
             return self._full_name(node.func)
         return None
 
-    @staticmethod
-    def _split_root(token: str):
-        if not token:
-            return None, None
-        root = token.split(".", 1)[0]
-        return root, token
+    @classmethod
+    def is_external(cls, full: str) -> bool:
+        """호출 토큰(예: "session.query")이 외부 호출로 볼 만한지"""
+        root = full.split(".", 1)[0]
+        if root in cls.EXTERNAL_ROOTS:
+            return True
+        method_name = full.split(".")[-1]
+        qualifier = ".".join(full.split(".")[:-1])
+        return (method_name in cls.METHOD_HINTS and (
+            any(q in qualifier.split(".") for q in cls.QUALIFIER_HINTS)
+            or "http" in qualifier or "socket" in qualifier
+        ))
 
     def visit_Call(self, node):
         fn_token = self._full_name(node.func)
-        if fn_token:
-            root, full = self._split_root(fn_token)
-            if root in self.EXTERNAL_ROOTS:
-                self.external_calls.add(full)
-            else:
-                method_name = full.split(".")[-1]
-                qualifier = ".".join(full.split(".")[:-1])
-                if (method_name in self.METHOD_HINTS and (
-                    any(q in qualifier.split(".") for q in self.QUALIFIER_HINTS)
-                    or "http" in qualifier or "socket" in qualifier
-                )):
-                    self.external_calls.add(full)
+        if fn_token and self.is_external(fn_token):
+            self.external_calls.add(fn_token)
         self.generic_visit(node)
 
     def detect(self):
@@ -0,0 +1,190 @@
+# translate/app/analyzer/feature_clusters.py
+# 역할: Java 클래스 → feature 묶음 (의존 관계 기반 clustering)
+#   - 간선: 클래스 본문에 나오는 프로젝트 클래스 이름 (주입 필드 타입, 호출 qualifier의 선언 타입, new, VO 파라미터/반환 등)
+#       type_references()가 원문에서 대문자로 시작하는 식별자를 뽑아 프로젝트 클래스 이름과 교집합 → 레코드 "references"
+#       파서 백엔드/폴백과 무관하게 같은 결과, 스냅샷 레코드에 남아 이전 분석 결과도 같은 방식으로 다시 묶을 수 있다
+#     + 해석된 메서드 호출: 레코드의 "methods"(parse_java_file)로 만든 call_graph.ProjectGraph에서
+#       methods_of(클래스) → callees → 호출되는 메서드의 클래스 (boardService.list() → BoardService 등, 폴백 레코드는 메서드 없음)
+#   - 같은 이름의 클래스가 여러 개면(버전별 디렉토리 등) 참조하는 쪽에서 가장 가까운 조상 디렉토리 아래의 한 개로 해석, 못 고르면 버림
+#   - 허브 제외: 참조하는 클래스가 FEATURE_CLUSTER_MAX_DEGREE개를 넘는 클래스(공통 VO/Util)와
+#     그만큼을 넘게 참조하는 클래스(메인 컨트롤러 등)의 간선, 예외/설정 클래스 간선은 쓰지 않는다 (전부 한 덩어리가 되지 않도록)
+#   - 구체적인 간선(양끝 차수 합이 작은 것)부터 union하고, 묶음이 FEATURE_CLUSTER_MAX_SIZE를 넘게 되는 union은 건너뛴다
+#     (참조가 촘촘한 프로젝트에서도 사슬처럼 이어져 거대한 묶음 하나가 되지 않도록)
+#   - 같은 디렉토리에서 이름 접미사(Controller/Service/VO...)를 뗀 이름이 같은 클래스도 묶는다 (기존 이름 규칙)
+#   - union-find(경로 절반 압축 + 크기 기준 union) → 클래스 수 + 간선 수에 거의 선형
+#   - feature 이름: 묶음 안에서 가장 많은 이름 접두사 (같으면 먼저 나온 것)
+#       겹치면 첫 멤버((rel_path, 이름) 사전순 최소)가 가장 앞선 묶음이 그대로 쓰고, 나머지는 그 첫 멤버 "rel_path/이름"의 해시를 붙인다
+#       (_<sha1 8자리> — 묶음을 나열하는 순서와 무관하게 같은 입력 → 같은 이름)
+#   - FEATURE_CLUSTERING=name 이면 기존처럼 이름 접미사만으로 묶는다
+
+import os
+import re
+import hashlib
+from collections import Counter
+
+from translate.app.analyzer.call_graph import ProjectGraph, module_name
+
+FEATURE_CLUSTERING = os.environ.get('FEATURE_CLUSTERING', 'deps').lower()
+FEATURE_CLUSTER_MAX_DEGREE = int(os.environ.get('FEATURE_CLUSTER_MAX_DEGREE', '12'))
+FEATURE_CLUSTER_MAX_SIZE = int(os.environ.get('FEATURE_CLUSTER_MAX_SIZE', '16'))
+
+_TYPE_TOKEN_RE = re.compile(r'(?<!@)\b[A-Z][A-Za-z0-9_]*')  # 어노테이션(@Service 등)은 참조가 아님
+_NO_GLUE_ROLES = ("EXCEPTION", "CONFIGURATION")
+
+
+def enabled() -> bool:
+    return FEATURE_CLUSTERING != 'name'
+
+
+def type_references(text: str, known_names, own_name: str = None) -> list:
+    """본문에 나오는 프로젝트 클래스 이름 (정렬, 자기 자신 제외)"""
+    tokens = set(_TYPE_TOKEN_RE.findall(text or ""))
+    tokens.discard(own_name)
+    return sorted(tokens & known_names)
+
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> int:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
+
+
+def _rel_dir(cls: dict) -> str:
+    return os.path.dirname(((cls.get("source_info") or {}).get("rel_path") or "").replace("\\", "/"))
+
+
+def _member_key(cls: dict) -> tuple:
+    return (((cls.get("source_info") or {}).get("rel_path") or "").replace("\\", "/"), cls.get("name") or "")
+
+
+def _role(cls: dict) -> str:
+    return (cls.get("role") or {}).get("type") or ""
+
+
+def _ancestors(rel_dir: str):
+    """'a/b/c' → 'a/b/c', 'a/b', 'a', '' (가까운 것부터)"""
+    while rel_dir:
+        yield rel_dir
+        rel_dir = rel_dir.rpartition("/")[0]
+    yield ""
+
+
+def _dependency_edges(classes: list, dirs: list) -> list:
+    """
+    references → (참조하는 클래스, 참조되는 클래스) 간선. 같은 이름이 여러 개면 참조하는 쪽 디렉토리에서 가장 가까운
+    조상 디렉토리 아래에 있는 후보가 하나일 때만 (그 조상 아래 후보가 둘 이상이면 모호 → 버림)
+    (이름, 조상 디렉토리) → 후보 색인으로 참조 하나당 O(디렉토리 깊이)
+    """
+    under = {}
+    for i, cls in enumerate(classes):
+        name = cls.get("name")
+        for ancestor in _ancestors(dirs[i]):
+            under.setdefault((name, ancestor), []).append(i)
+    edges = set()
+    for i, cls in enumerate(classes):
+        for name in cls.get("references") or ():
+            for ancestor in _ancestors(dirs[i]):
+                candidates = under.get((name, ancestor))
+                if candidates:
+                    if len(candidates) == 1 and candidates[0] != i:
+                        edges.add((i, candidates[0]))
+                    break
+    return sorted(edges)
+
+
+def call_graph(classes: list) -> ProjectGraph:
+    """클래스 레코드의 methods → 해석된 호출 그래프 (모듈 = rel_path의 module_name, 메서드 = 클래스 심볼)"""
+    graph = ProjectGraph()
+    for cls in classes:
+        module = module_name((cls.get("source_info") or {}).get("rel_path"))
+        for method in cls.get("methods") or ():
+            if method.get("name"):
+                graph.add_function(module, cls.get("name"), method["name"], method.get("calls") or ())
+    return graph.freeze()
+
+
+def _call_edges(classes: list, graph: ProjectGraph) -> set:
+    """(호출하는 클래스, 호출되는 메서드의 클래스) 간선 — 클래스당 methods_of 구간 + 메서드당 callees 구간"""
+    modules = [module_name((cls.get("source_info") or {}).get("rel_path")) for cls in classes]
+    index = {}
+    for i, cls in enumerate(classes):
+        index.setdefault((modules[i], cls.get("name")), i)
+    edges = set()
+    for i, cls in enumerate(classes):
+        for sym in graph.methods_of(modules[i], cls.get("name")):
+            for callee in graph.callees(sym):
+                module, class_name, _ = graph.symbol(callee)
+                j = index.get((module, class_name))
+                if j is not None and j != i:
+                    edges.add((i, j))
+    return edges
+
+
+def cluster_classes(classes: list, feature_of, graph: ProjectGraph = None) -> dict:
+    """
+    classes(references/methods/role/source_info 포함) → {feature 이름: [클래스, ...]}
+    graph는 call_graph(classes) 결과 (없으면 여기서 만든다)
+    feature 순서는 묶음의 첫 클래스 순서, 묶음 안의 클래스 순서는 입력 순서 (기존 그룹핑과 같은 규칙)
+    """
+    n = len(classes)
+    dirs = [_rel_dir(cls) for cls in classes]
+    stems = [feature_of(cls.get("name", "")) for cls in classes]
+    uf = UnionFind(n)
+
+    first_by_stem = {}
+    for i in range(n):
+        key = (dirs[i], stems[i])
+        if key in first_by_stem:
+            uf.union(first_by_stem[key], i)
+        else:
+            first_by_stem[key] = i
+
+    # 구체적인 간선(양끝 차수 합이 작은 것)부터 묶고, 묶음이 FEATURE_CLUSTER_MAX_SIZE를 넘게 되는 union은 하지 않는다
+    edges = sorted(set(_dependency_edges(classes, dirs)) | _call_edges(classes, graph or call_graph(classes)))
+    fan_in, fan_out = Counter(j for _, j in edges), Counter(i for i, _ in edges)
+    edges = [(i, j) for i, j in edges
+             if fan_in[j] <= FEATURE_CLUSTER_MAX_DEGREE and fan_out[i] <= FEATURE_CLUSTER_MAX_DEGREE
+             and _role(classes[i]) not in _NO_GLUE_ROLES and _role(classes[j]) not in _NO_GLUE_ROLES]
+    edges.sort(key=lambda e: fan_out[e[0]] + fan_in[e[1]])
+    for i, j in edges:
+        a, b = uf.find(i), uf.find(j)
+        if a != b and uf.size[a] + uf.size[b] <= FEATURE_CLUSTER_MAX_SIZE:
+            uf.union(a, b)
+
+    groups = {}
+    for i in range(n):
+        groups.setdefault(uf.find(i), []).append(i)
+
+    named = []
+    for members in groups.values():
+        stem = Counter(stems[i] for i in members).most_common(1)[0][0]  # 개수가 같으면 먼저 나온 이름
+        named.append((stem, min(_member_key(classes[i]) for i in members), members))
+    owner = {}
+    for stem, first, _ in named:
+        if stem not in owner or first < owner[stem]:
+            owner[stem] = first
+
+    features = {}
+    for stem, first, members in named:
+        name = stem
+        if owner[stem] != first:
+            name = f"{stem}_{hashlib.sha1('/'.join(first).encode('utf-8')).hexdigest()[:8]}"
+        features[name] = [classes[i] for i in members]
+    return features
@@ -1,6 +1,11 @@
 import zipfile, os
+import codecs
 import shutil
-from typing import List, Tuple
+import stat
+import fnmatch
+import hashlib
+import posixpath
+from typing import List, Tuple, Iterator
 
 SUPPORTED_LANGUAGES = {
     '.py': 'python',
@@ -13,10 +18,87 @@ SUPPORTED_LANGUAGES = {
     '.sql': 'sql'
 }
 
+# 확장자로는 고를 수 없는 빌드 파일 (pom.xml은 .xml로 이미 포함) → project_manifest에서 프레임워크/버전 파싱
+BUILD_FILES = {
+    'build.gradle': 'gradle',
+    'build.gradle.kts': 'gradle',
+}
+# UTF-8로 읽히지 않는 파일은 이 순서로 판별 (국내 레거시 프로젝트는 대부분 MS949/EUC-KR)
+LEGACY_ENCODINGS = ('cp949', 'euc-kr', 'latin-1')
+
+# 스트리밍 추출 시 제외할 경로: '/'가 없는 패턴은 경로의 각 구성요소(디렉토리/파일명)에, 있는 패턴은 전체 경로에 매칭
+#   VCS/IDE/도구 캐시 디렉토리만 — 소스 패키지 이름으로 쓰일 일이 없어 어느 깊이에서든 제외
+DEFAULT_PRUNE_GLOBS = (".git", ".svn", ".hg", ".idea", ".vscode", ".gradle", "__MACOSX", "__pycache__",
+                       "node_modules", ".*.swp")
+PRUNE_GLOBS = tuple(g.strip() for g in os.environ.get('EXTRACT_PRUNE_GLOBS', ','.join(DEFAULT_PRUNE_GLOBS)).split(',') if g.strip())
+# 빌드 산출물 디렉토리: 압축 루트 또는 모듈 루트(BUILD_ROOT_MARKERS가 있는 디렉토리) 바로 아래에 있을 때만 제외
+#   (src/main/java/com/acme/build/, Python 패키지 dist/ 같은 소스 디렉토리는 그대로 분석)
+DEFAULT_BUILD_OUTPUT_DIRS = ("target", "build", "dist")
+BUILD_OUTPUT_DIRS = tuple(g.strip() for g in os.environ.get('EXTRACT_BUILD_OUTPUT_DIRS', ','.join(DEFAULT_BUILD_OUTPUT_DIRS)).split(',') if g.strip())
+BUILD_ROOT_MARKERS = {'pom.xml', 'build.gradle', 'build.gradle.kts', 'settings.gradle', 'settings.gradle.kts',
+                      'build.xml', 'setup.py', 'setup.cfg', 'pyproject.toml', 'package.json'}
+MAX_MEMBER_BYTES = int(os.environ.get('EXTRACT_MAX_MEMBER_BYTES', str(20 * 1024 * 1024)))
+MAX_TOTAL_BYTES = int(os.environ.get('EXTRACT_MAX_TOTAL_BYTES', str(1024 * 1024 * 1024)))
+_CHUNK = 1 << 20
+
+
+class ExtractLimitError(ValueError):
+    """압축 해제 총량이 MAX_TOTAL_BYTES를 넘는 경우 (zip bomb 등)"""
+
+
+class _ContentProbe:
+    """추출 중 흘러가는 chunk로 SHA-256과 UTF-8 여부를 함께 계산 (파일을 다시 읽지 않음)"""
+
+    def __init__(self, write):
+        self._write = write
+        self._sha256 = hashlib.sha256()
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._head = None
+        self.utf8 = True
+
+    def write(self, chunk: bytes):
+        self._write(chunk)
+        self._sha256.update(chunk)
+        if self._head is None:
+            self._head = chunk[:3]
+        if self.utf8:
+            try:
+                self._decoder.decode(chunk)
+            except UnicodeDecodeError:
+                self.utf8 = False
+
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def encoding(self, path: str) -> str:
+        if self.utf8:
+            try:
+                self._decoder.decode(b'', final=True)
+                return 'utf-8-sig' if self._head == codecs.BOM_UTF8 else 'utf-8'
+            except UnicodeDecodeError:
+                pass
+        # UTF-8이 아닌 드문 경우에만 다시 읽어서 판별
+        with open(path, 'rb') as f:
+            data = f.read()
+        for enc in LEGACY_ENCODINGS:
+            try:
+                data.decode(enc)
+                return enc
+            except UnicodeDecodeError:
+                continue
+        return 'binary'
+
+
 class FileExtractor:
-    def __init__(self, zip_path: str, extract_dir: str = "extracted_files"):
+    def __init__(self, zip_path: str, extract_dir: str = "extracted_files",
+                 prune_globs=PRUNE_GLOBS, build_output_dirs=BUILD_OUTPUT_DIRS, max_member_bytes: int = MAX_MEMBER_BYTES, max_total_bytes: int = MAX_TOTAL_BYTES):
         self.zip_path = zip_path
         self.extract_dir = extract_dir
+        self.prune_globs = tuple(prune_globs)
+        self.build_output_dirs = frozenset(build_output_dirs)
+        self.max_member_bytes = max_member_bytes
+        self.max_total_bytes = max_total_bytes
+        self.skipped = {'pruned': 0, 'unsupported': 0, 'too_large': 0, 'unsafe': 0}
 
     def extract_zip(self) -> str:
 
@@ -28,6 +110,107 @@ class FileExtractor:
             zip_ref.extractall(self.extract_dir)
         return self.extract_dir
 
+    # ---- 스트리밍 모드: zip 멤버를 한 번만 순회하며 필요한 파일만 골라낸다 ----
+    @staticmethod
+    def _module_roots(names) -> set:
+        """압축 루트('', 모든 멤버가 최상위 폴더 하나 아래에 있으면 그 폴더도) + 빌드 파일(pom.xml/build.gradle/setup.py ...)이 있는 디렉토리"""
+        roots, tops = {''}, set()
+        for name in names:
+            tops.add(name.partition('/')[0] if '/' in name else '')
+            if posixpath.basename(name) in BUILD_ROOT_MARKERS:
+                roots.add(posixpath.dirname(name))
+        if len(tops) == 1:
+            roots |= tops
+        return roots
+
+    def _pruned(self, rel_path: str, module_roots=frozenset({''})) -> bool:
+        parts = rel_path.split('/')
+        for pattern in self.prune_globs:
+            if '/' in pattern:
+                if fnmatch.fnmatchcase(rel_path, pattern):
+                    return True
+            elif any(fnmatch.fnmatchcase(part, pattern) for part in parts):
+                return True
+        # 빌드 산출물 이름은 디렉토리이면서 모듈 루트 바로 아래일 때만
+        for i, part in enumerate(parts[:-1]):
+            if part in self.build_output_dirs and '/'.join(parts[:i]) in module_roots:
+                return True
+        return False
+
+    @staticmethod
+    def _safe_name(name: str):
+        """zip-slip 방지: 절대경로/상위 경로/드라이브 문자가 있으면 None"""
+        name = name.replace('\\', '/')
+        if name.startswith('/') or (len(name) > 1 and name[1] == ':'):
+            return None
+        rel = posixpath.normpath(name)
+        if rel in ('', '.') or rel == '..' or rel.startswith('../'):
+            return None
+        return rel
+
+    def _select(self, zf: zipfile.ZipFile) -> Iterator[Tuple[zipfile.ZipInfo, str, str]]:
+        """(info, rel_path, language) — 지원 확장자이고 제외/크기/안전성 조건을 통과한 멤버만"""
+        members = [(info, self._safe_name(info.filename)) for info in zf.infolist() if not info.is_dir()]
+        module_roots = self._module_roots(rel for _, rel in members if rel is not None)
+        for info, rel in members:
+            if rel is None or stat.S_ISLNK(info.external_attr >> 16):
+                self.skipped['unsafe'] += 1
+                continue
+            lang = SUPPORTED_LANGUAGES.get(posixpath.splitext(rel)[1].lower()) or BUILD_FILES.get(posixpath.basename(rel))
+            if lang is None:
+                self.skipped['unsupported'] += 1
+                continue
+            if self._pruned(rel, module_roots):
+                self.skipped['pruned'] += 1
+                continue
+            if info.file_size > self.max_member_bytes:
+                self.skipped['too_large'] += 1
+                print(f"⚠️ [Extract] skip large member ({info.file_size} bytes): {rel}")
+                continue
+            yield info, rel, lang
+
+    def _copy(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, write, total: int) -> int:
+        """멤버를 chunk 단위로 write에 넘기며 실제 해제 크기를 검사 (헤더의 file_size는 신뢰하지 않음)"""
+        size = 0
+        with zf.open(info) as src:
+            for chunk in iter(lambda: src.read(_CHUNK), b''):
+                size += len(chunk)
+                if size > self.max_member_bytes:
+                    return -1
+                if total + size > self.max_total_bytes:
+                    raise ExtractLimitError(f"archive exceeds {self.max_total_bytes} bytes when extracted")
+                write(chunk)
+        return size
+
+    def extract_supported(self) -> List[dict]:
+        """
+        지원 확장자 파일(+ BUILD_FILES)만 extract_dir에 풀고 목록을 바로 반환 (전체 extractall + os.walk 대체).
+        반환 형식은 find_supported_code_files와 같고(path, language) size/sha256/encoding이 추가되며, 경로 순으로 정렬된다.
+        sha256/encoding은 추출하면서 같은 chunk로 계산하므로 이후 단계에서 파일을 다시 읽을 필요가 없다.
+        """
+        if os.path.exists(self.extract_dir):
+            shutil.rmtree(self.extract_dir)
+        os.makedirs(self.extract_dir)
+        base = os.path.abspath(self.extract_dir)
+
+        result, total = [], 0
+        with zipfile.ZipFile(self.zip_path, "r") as zf:
+            for info, rel, lang in sorted(self._select(zf), key=lambda x: x[1]):
+                dest = os.path.join(base, *rel.split('/'))
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                with open(dest, "wb") as dst:
+                    probe = _ContentProbe(dst.write)
+                    size = self._copy(zf, info, probe.write, total)
+                if size < 0:
+                    os.remove(dest)
+                    self.skipped['too_large'] += 1
+                    print(f"⚠️ [Extract] skip large member (> {self.max_member_bytes} bytes): {rel}")
+                    continue
+                total += size
+                result.append({'path': dest, 'language': lang, 'size': size,
+                               'sha256': probe.sha256(), 'encoding': probe.encoding(dest)})
+        return result
+
     def find_supported_code_files(self) -> List[Tuple[str, str]]:
         """
         Returns list of (filepath, language)
@@ -50,10 +233,9 @@ class FileExtractor:
 from file_extractor import FileExtractor
 
 extractor = FileExtractor("samples/project.zip")
-extractor.extract_zip()
-code_files = extractor.find_supported_code_files()
+code_files = extractor.extract_supported()
 
-for path, lang in code_files:
-    print(f"🧩 {lang.upper()} 파일: {path}")
+for entry in code_files:
+    print(f"🧩 {entry['language'].upper()} 파일: {entry['path']}")
 
 """
\ No newline at end of file
@@ -0,0 +1,74 @@
+# translate/app/analyzer/hint_matcher.py
+# 역할: StructureMapper 힌트 테이블({그룹: (부분 문자열, ...)})을 한 번 컴파일해 텍스트 하나의 그룹 hit을 한 번에 구한다
+#   - ahocorasick(기본): pyahocorasick 오토마톤으로 텍스트를 한 번만 순회 (패턴 수와 무관한 선형 시간, 모든 그룹이 hit되면 중단)
+#   - substring: 패턴별 C 부분 문자열 검색, 이미 hit된 그룹의 패턴은 건너뛴다 (pyahocorasick 미설치 시 폴백)
+#   - HINT_MATCHER=auto(기본)는 설치돼 있으면 ahocorasick, 아니면 substring (비교: benchmarks/bench_role_inference.py)
+#   - 결과는 "패턴 in text"를 그룹별로 any()한 것과 같다 (대소문자 처리는 호출 측에서)
+
+import os
+import logging
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+HINT_MATCHER = os.environ.get('HINT_MATCHER', 'auto').lower()
+BACKENDS = ('substring', 'ahocorasick')
+
+
+def resolve_backend(name: str = None) -> str:
+    name = (name or HINT_MATCHER).lower()
+    if name == 'auto':
+        return 'substring' if ahocorasick is None else 'ahocorasick'
+    if name not in BACKENDS:
+        logger.warning("unknown HINT_MATCHER '%s', using substring", name)
+        return 'substring'
+    if name == 'ahocorasick' and ahocorasick is None:
+        logger.warning("HINT_MATCHER=ahocorasick but pyahocorasick is not installed, using substring")
+        return 'substring'
+    return name
+
+
+class HintMatcher:
+    def __init__(self, table: dict, backend: str = None):
+        self.table = table
+        self.backend = resolve_backend(backend)
+        self.groups = frozenset(table)
+        patterns = {}
+        for group, hints in table.items():
+            for hint in hints:
+                patterns.setdefault(hint, set()).add(group)
+        self._patterns = [(hint, frozenset(groups)) for hint, groups in patterns.items()]
+        self._automaton = None
+        if self.backend == 'ahocorasick' and self._patterns:
+            self._automaton = ahocorasick.Automaton()
+            for hint, groups in self._patterns:
+                self._automaton.add_word(hint, groups)
+            self._automaton.make_automaton()
+
+    def match(self, text: str) -> set:
+        """text에 패턴이 하나라도 나오는 그룹들"""
+        hits = set()
+        if not text:
+            return hits
+        if self._automaton is not None:
+            for _, groups in self._automaton.iter(text):
+                hits |= groups
+                if len(hits) == len(self.groups):
+                    break
+            return hits
+        for hint, groups in self._patterns:
+            if not groups <= hits and hint in text:
+                hits |= groups
+        return hits
+
+    def match_any(self, texts) -> set:
+        hits = set()
+        for text in texts:
+            hits |= self.match(text)
+            if len(hits) == len(self.groups):
+                break
+        return hits
@@ -1,10 +1,50 @@
 # java_analyzer.py
 import javalang
 import re
+import bisect
 import logging
+from itertools import accumulate
 
 logger = logging.getLogger(__name__)
 
+
+def first_javadoc(lines):
+    """
+    (닫는 */가 있는 줄 index(0-base), 설명). 없으면 None.
+    "\n".join(lines[:k])에 대한 re.search(r'/\*\*(.*?)\*/')는 파일의 첫 /**가 k줄 안에서 닫힐 때만 그 블록에 매칭되므로
+    노드마다 앞부분을 이어 붙여 다시 검색할 필요 없이 이 블록 하나와 줄 번호 비교로 같은 결과를 얻는다.
+    """
+    text = "\n".join(lines)
+    start = text.find("/**")
+    end = text.find("*/", start + 3) if start >= 0 else -1
+    if end < 0:
+        return None
+    return text.count("\n", 0, end), javadoc_description(text[start + 3:end])
+
+
+def javadoc_description(javadoc_content):
+    p_tag_match = re.search(r'<p>(.*?)</p>', javadoc_content, re.DOTALL | re.IGNORECASE)
+    if p_tag_match:
+        description = ' '.join([line.strip().lstrip('*').strip() for line in p_tag_match.group(1).strip().split('\n')])
+        return description
+    lines = [line.strip().lstrip('*').strip() for line in javadoc_content.split('\n')]
+    first_meaningful_line = next((line for line in lines if line and not line.startswith('@')), None)
+    return first_meaningful_line or ""
+
+
+# 매우 보수적인 외부 SDK 힌트 (패키지명까지는 알기 어려우므로 한정)
+EXTERNAL_SDK_HINTS = ("System.", "java.", "javax.", "jakarta.", "org.springframework.", "com.fasterxml.")
+
+
+def call_record(qualifier, member):
+    """호출 레코드. target 형식 예: "System.out.println", "restTemplate.getForObject" """
+    target = f"{qualifier}.{member}" if qualifier else member
+    call_type = "internal"
+    if qualifier and any(q in qualifier for q in EXTERNAL_SDK_HINTS):
+        call_type = "external_sdk"
+    return {"target": target, "type": call_type}
+
+
 class JavaAnalyzer:
     """
     Java 소스 파일을 분석하여 클래스, 함수, 어노테이션, '메서드 호출' 등의 구조를 추출합니다.
@@ -20,7 +60,9 @@ class JavaAnalyzer:
             with open(file_path, "r", encoding="utf-8") as f:
                 self.code = f.read()
                 self.lines = self.code.splitlines()
-            self.tree = javalang.parse.parse(self.code)
+            # javalang.parse.parse와 같지만 토큰을 남겨 클래스 범위(span) 계산에 재사용
+            self.tokens = list(javalang.tokenizer.tokenize(self.code))
+            self.tree = javalang.parser.Parser(self.tokens).parse()
             self.is_parsed = True
         except Exception as e:
             logger.warning(f"[Java Parse Warning] {self.file_path} :: {e}")
@@ -29,24 +71,28 @@ class JavaAnalyzer:
     def _extract_javadoc_description(self, node):
         if not getattr(node, "position", None):
             return ""
-        # node.position 이전의 블록에서 마지막 /** ... */를 찾는다
-        doc_comment_block = "\n".join(self.lines[:node.position.line - 1])
-        javadoc_match = re.search(r'/\*\*(.*?)\*/', doc_comment_block, re.DOTALL | re.MULTILINE)
-        if not javadoc_match:
+        # node.position 이전 줄들에서 처음 나오는 /** ... */ (파일당 한 번만 찾아 둔 블록을 줄 번호로 판정)
+        javadoc = self._first_javadoc()
+        if javadoc is None or javadoc[0] > node.position.line - 2:
             return ""
-        javadoc_content = javadoc_match.group(1)
-        p_tag_match = re.search(r'<p>(.*?)</p>', javadoc_content, re.DOTALL | re.IGNORECASE)
-        if p_tag_match:
-            description = ' '.join([line.strip().lstrip('*').strip() for line in p_tag_match.group(1).strip().split('\n')])
-            return description
-        lines = [line.strip().lstrip('*').strip() for line in javadoc_content.split('\n')]
-        first_meaningful_line = next((line for line in lines if line and not line.startswith('@')), None)
-        return first_meaningful_line or ""
+        return javadoc[1]
+
+    def _first_javadoc(self):
+        if not hasattr(self, "_javadoc"):
+            self._javadoc = first_javadoc(self.lines)
+        return self._javadoc
 
     def extract_classes(self):
+        """
+        클래스/인터페이스 목록. 본문은 문자열 대신 파일 텍스트 기준 문자 offset 구간("spans")으로 담는다.
+        본문 = "\n\n".join(code[a:b] for a, b in spans) (source_table.SourceTable.body)
+          - 최상위 타입이 하나뿐인 파일의 그 타입: [[0, len(code)]] (파일 전체, 기존 body와 동일)
+          - 그 외(한 파일의 여러 타입/중첩 타입): [package/import 구간] + [javadoc/어노테이션 ~ 닫는 중괄호]
+        """
         if not self.is_parsed: return []
         classes = []
-        for _, node in self.tree.filter(javalang.tree.TypeDeclaration):
+        top_level = list(getattr(self.tree, "types", None) or [])
+        for node in self._node_index()[0]:
             if isinstance(node, (javalang.tree.ClassDeclaration, javalang.tree.InterfaceDeclaration)):
                 description = self._extract_javadoc_description(node)
                 classes.append({
@@ -54,17 +100,121 @@ class JavaAnalyzer:
                     "type": type(node).__name__,
                     "description": description,
                     "annotations": [ann.name for ann in getattr(node, "annotations", [])],
-                    "body": self.code,
+                    "spans": self._class_spans(node, top_level),
                 })
         return classes
 
+    # ---- 파일당 한 번의 트리 순회로 만드는 노드 인덱스 ----
+    def _node_index(self):
+        """
+        (TypeDeclaration 목록, {id(클래스/인터페이스): 메서드+생성자 목록})을 돌려주고
+        각 메서드/생성자 서브트리의 MethodInvocation을 self._invocations에 채운다.
+        javalang의 filter()와 같은 pre-order 순서라 클래스마다/메서드마다 트리를 다시 걷는 것과 결과가 같다.
+        """
+        if not hasattr(self, "_types"):
+            types, members, invocations = [], {}, {}
+            stack = [(self.tree, ())]
+            while stack:
+                item, owners = stack.pop()
+                if isinstance(item, javalang.tree.Node):
+                    if isinstance(item, javalang.tree.TypeDeclaration):
+                        types.append(item)
+                        if isinstance(item, (javalang.tree.ClassDeclaration, javalang.tree.InterfaceDeclaration)):
+                            nodes = list(getattr(item, "methods", [])) + list(getattr(item, "constructors", []))
+                            members[id(item)] = nodes
+                            for member in nodes:
+                                invocations.setdefault(id(member), [])
+                    elif isinstance(item, javalang.tree.MethodInvocation):
+                        for owner in owners:
+                            invocations[owner].append(item)
+                    if id(item) in invocations:
+                        owners = owners + (id(item),)
+                    children = item.children
+                else:
+                    children = item
+                for child in reversed(children):
+                    if isinstance(child, (javalang.tree.Node, list, tuple)):
+                        stack.append((child, owners))
+            self._types, self._members, self._invocations = types, members, invocations
+        return self._types, self._members
+
+    # ---- 파일당 한 번 만드는 위치 인덱스: 줄 시작 offset, 토큰 위치, 중괄호 짝 ----
+    def _build_token_index(self):
+        self._line_starts = [0, *accumulate(len(line) + 1 for line in self.code.split("\n"))]
+        self._token_keys = [(t.position.line, t.position.column) for t in self.tokens]
+        self._brace_pairs, opened = {}, []
+        for i, token in enumerate(self.tokens):
+            if token.value == "{" and isinstance(token, javalang.tokenizer.Separator):
+                opened.append(i)
+            elif token.value == "}" and isinstance(token, javalang.tokenizer.Separator) and opened:
+                self._brace_pairs[opened.pop()] = i
+
+    def _offset(self, position) -> int:
+        if not hasattr(self, "_line_starts"):
+            self._build_token_index()
+        return self._line_starts[position.line - 1] + position.column - 1
+
+    def _token_index(self, position) -> int:
+        if not hasattr(self, "_token_keys"):
+            self._build_token_index()
+        return bisect.bisect_left(self._token_keys, (position.line, position.column))
+
+    def _closing_brace(self, open_index: int) -> int:
+        return self._brace_pairs.get(open_index, len(self.tokens) - 1)
+
+    def _type_range(self, node):
+        """(시작 offset, 끝 offset): javadoc/어노테이션/제어자부터 본문 닫는 중괄호까지"""
+        keyword = self._token_index(node.position)
+        first = keyword
+        for ann in getattr(node, "annotations", []) or []:
+            if getattr(ann, "position", None):
+                first = min(first, self._token_index(ann.position))
+        while first > 0 and isinstance(self.tokens[first - 1], javalang.tokenizer.Modifier):
+            first -= 1
+        start = self._offset(self.tokens[first].position)
+        doc = getattr(node, "documentation", None)
+        if doc:
+            found = self.code.rfind(doc, 0, start)
+            if found >= 0 and not self.code[found + len(doc):start].strip():
+                start = found
+
+        brace = keyword
+        while brace < len(self.tokens) and self.tokens[brace].value != "{":
+            brace += 1
+        if brace >= len(self.tokens):
+            return start, len(self.code)
+        close = self.tokens[self._closing_brace(brace)]
+        return start, self._offset(close.position) + len(close.value)
+
+    def _class_spans(self, node, top_level):
+        if len(top_level) == 1 and top_level[0] is node:
+            return [[0, len(self.code)]]
+        start, end = self._type_range(node)
+        prelude = self._prelude_end(top_level)
+        return ([[0, prelude]] if prelude else []) + [[start, end]]
+
+    def _prelude_end(self, top_level) -> int:
+        """첫 최상위 타입 앞의 package/import 문이 끝나는 offset (없으면 0)"""
+        if not hasattr(self, "_prelude"):
+            self._prelude = 0
+            if top_level and getattr(top_level[0], "position", None):
+                first_type = self._type_range(top_level[0])[0]
+                for token in self.tokens[:self._token_index(top_level[0].position)]:
+                    offset = self._offset(token.position)
+                    if offset >= first_type:
+                        break
+                    if token.value == ";":
+                        self._prelude = offset + 1
+        return self._prelude
+
     def extract_functions(self):
         if not self.is_parsed: return []
         functions = []
-        for _, class_node in self.tree.filter(javalang.tree.TypeDeclaration):
+        type_nodes, members = self._node_index()
+        for class_node in type_nodes:
             if not isinstance(class_node, (javalang.tree.ClassDeclaration, javalang.tree.InterfaceDeclaration)):
                 continue
-            nodes_to_process = list(getattr(class_node, "methods", [])) + list(getattr(class_node, "constructors", []))
+            nodes_to_process = members[id(class_node)]
             for node in nodes_to_process:
                 start_pos = getattr(node, "position", None)
                 end_pos = self._find_last_position(node)
@@ -107,18 +257,16 @@ class JavaAnalyzer:
         """
         calls = []
         try:
-            for _, call in method_node.filter(javalang.tree.MethodInvocation):
+            indexed = self.__dict__.get("_invocations", {}).get(id(method_node))
+            invocations = indexed if indexed is not None else \
+                [call for _, call in method_node.filter(javalang.tree.MethodInvocation)]
+            for call in invocations:
                 # qualifier는 문자열(예: "System.out" / "this" / "service")일 수 있음
                 qualifier = getattr(call, "qualifier", None)
                 member = getattr(call, "member", None)
                 if not member:
                     continue
-                target = f"{qualifier}.{member}" if qualifier else member
-                call_type = "internal"
-                # 매우 보수적인 외부 SDK 힌트 (패키지명까지는 알기 어려우므로 한정)
-                if qualifier and any(q in qualifier for q in ["System.", "java.", "javax.", "jakarta.", "org.springframework.", "com.fasterxml."]):
-                    call_type = "external_sdk"
-                calls.append({"target": target, "type": call_type})
+                calls.append(call_record(qualifier, member))
         except Exception as e:
             logger.debug(f"[extract_calls] skip due to: {e}")
         return calls
@@ -134,19 +282,46 @@ class JavaAnalyzer:
         lines.append(self.lines[end_line][:end_col])
         return "\n".join(lines)
 
+    @staticmethod
+    def _position_children(node):
+        items = []
+        for child in getattr(node, "children", None) or ():
+            if isinstance(child, javalang.tree.Node):
+                items.append(child)
+            elif isinstance(child, list):
+                items.extend([x for x in child if isinstance(x, javalang.tree.Node)])
+        return items
+
     def _find_last_position(self, node):
+        """
+        서브트리에서 가장 뒤의 position (position이 없는 노드의 하위는 보지 않음).
+        노드별 결과를 한 번의 post-order 순회로 memo에 채워 두므로 full_body/body처럼 겹치는 서브트리를 다시 돌지 않는다.
+        """
         if not getattr(node, "position", None):
             return None
-        last = node.position
-        if hasattr(node, "children"):
-            for child in node.children:
-                items = []
-                if isinstance(child, javalang.tree.Node):
-                    items.append(child)
-                elif isinstance(child, list):
-                    items.extend([x for x in child if isinstance(x, javalang.tree.Node)])
+        memo = self.__dict__.setdefault("_last_positions", {})
+        if id(node) in memo:
+            return memo[id(node)]
+        stack = [(node, None)]
+        while stack:
+            cur, items = stack.pop()
+            if items is not None:
+                last = cur.position
                 for item in items:
-                    pos = self._find_last_position(item)
+                    pos = memo[id(item)]
                     if pos and (pos.line > last.line or (pos.line == last.line and pos.column > last.column)):
                         last = pos
-        return last
+                memo[id(cur)] = last
+                continue
+            if id(cur) in memo:
+                continue
+            items = self._position_children(cur)
+            stack.append((cur, items))
+            for item in items:
+                if id(item) in memo:
+                    continue
+                if getattr(item, "position", None):
+                    stack.append((item, None))
+                else:
+                    memo[id(item)] = None
+        return memo[id(node)]
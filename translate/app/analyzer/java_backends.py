@@ -0,0 +1,47 @@
+# translate/app/analyzer/java_backends.py
+# 역할: Java 파서 백엔드 선택 — 프로세스 단위 환경 변수 JAVA_PARSER_BACKEND (작업별 선택은 없음)
+#   - javalang     : JavaAnalyzer (순수 파이썬, Java 8 문법까지. records/text blocks 등은 폴백 정규식으로)
+#   - tree_sitter  : TreeSitterJavaAnalyzer (tree-sitter-java, 선택 설치)
+#   - auto         : tree_sitter가 설치돼 있으면 tree_sitter, 아니면 javalang
+#   - 백엔드 공통 인터페이스: Analyzer(file_path, query_bank=None)
+#       .code / .is_parsed / .extract_classes() / .extract_functions()  (레코드 스키마 동일)
+#     is_parsed=False면 호출 측이 java_lenient_fallback으로 넘긴다
+
+import os
+import logging
+
+from translate.app.analyzer.java_analyzer import JavaAnalyzer
+from translate.app.analyzer import tree_sitter_java_analyzer
+
+logger = logging.getLogger(__name__)
+
+JAVA_PARSER_BACKEND = os.environ.get('JAVA_PARSER_BACKEND', 'javalang')
+
+BACKENDS = {
+    'javalang': JavaAnalyzer,
+    'tree_sitter': tree_sitter_java_analyzer.TreeSitterJavaAnalyzer,
+}
+
+
+def available_backends() -> list:
+    names = ['javalang']
+    if tree_sitter_java_analyzer.AVAILABLE:
+        names.append('tree_sitter')
+    return names
+
+
+def resolve_backend(name: str = None) -> str:
+    """백엔드 이름 확정. 설치되지 않은 백엔드를 고르면 경고 후 javalang"""
+    name = (name or JAVA_PARSER_BACKEND or 'javalang').lower().replace('-', '_')
+    if name == 'auto':
+        return 'tree_sitter' if tree_sitter_java_analyzer.AVAILABLE else 'javalang'
+    if name not in BACKENDS:
+        raise ValueError(f"unknown java parser backend: {name} (choose from {', '.join(BACKENDS)}, auto)")
+    if name not in available_backends():
+        logger.warning(f"[JAVA] parser backend '{name}' is not installed, falling back to javalang")
+        return 'javalang'
+    return name
+
+
+def create_java_analyzer(file_path: str, query_bank: dict = None, backend: str = None):
+    return BACKENDS[resolve_backend(backend)](file_path, query_bank=query_bank)
@@ -19,6 +19,6 @@ def extract_classes_lenient_from_text(code: str) -> List[Dict]:
             "type": "ClassDeclaration" if kind=="class" else ("InterfaceDeclaration" if kind=="interface" else "EnumDeclaration"),
             "description": "",
             "annotations": annotations,
-            "body": code,  # 다운스트림 스키마에 맞춰 원문 보존
+            "spans": [[0, len(code)]],  # 파일 전체 (원문은 source_table에서 출력 시에만 꺼냄)
         })
     return classes
\ No newline at end of file
@@ -0,0 +1,165 @@
+# translate/app/analyzer/jsonl_store.py
+# 역할: 분석 산출물(classes.jsonl/functions.jsonl/스냅샷 레코드) 스트리밍 쓰기/읽기
+#   - JSON 코덱: orjson이 있으면 사용, 없으면 json (ensure_ascii=False와 같은 UTF-8 출력)
+#   - SortedJsonlWriter: 레코드를 한 줄씩 받아 key 순으로 정렬해 쓴다 (list.sort와 같은 안정 정렬)
+#       버퍼(인코딩된 줄)가 JSONL_SORT_BUFFER_BYTES를 넘으면 정렬된 run을 임시 파일로 내보내고, close()에서 run들을 k-way merge
+#       → 레코드 수와 무관하게 메모리에는 버퍼 1개 분량만 남는다
+#   - iter_jsonl: 한 줄씩 읽어 dict를 내주는 generator / count_lines: 파싱 없이 레코드 수만
+#   - JsonlQueue: generator 위의 peek 가능한 큐 (python_agent의 클래스 순회용)
+
+import os
+import json
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONL_SORT_BUFFER_BYTES = int(os.environ.get('JSONL_SORT_BUFFER_BYTES', str(16 * 1024 * 1024)))
+
+
+if orjson is not None:
+    def dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # orjson이 못 다루는 값(64bit 초과 정수, 문자열이 아닌 key 등)
+            return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    loads = orjson.loads
+else:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    loads = json.loads
+
+
+def iter_jsonl(path: str):
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def count_lines(path: str) -> int:
+    count = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                count += 1
+    return count
+
+
+def write_jsonl(path: str, records) -> int:
+    """records(iterable)를 순서대로 쓴다 (임시 파일 → rename). 쓴 건수"""
+    tmp = path + '.tmp'
+    count = 0
+    with open(tmp, 'wb') as f:
+        for record in records:
+            f.write(dumps(record) + b'\n')
+            count += 1
+    os.replace(tmp, path)
+    return count
+
+
+def _write_run(items) -> str:
+    fd, path = tempfile.mkstemp(prefix='jsonl-run-', suffix='.pkl')
+    with os.fdopen(fd, 'wb') as f:
+        for item in items:
+            pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+class SortedJsonlWriter:
+    """
+    with SortedJsonlWriter(path, key=...) as writer:
+        writer.add(record)
+    key(record)가 같은 레코드는 add 순서 그대로 (list.sort(key=...)와 같은 결과)
+    """
+    def __init__(self, path: str, key, buffer_bytes: int = None):
+        self.path = path
+        self.key = key
+        self.buffer_bytes = buffer_bytes or JSONL_SORT_BUFFER_BYTES
+        self.count = 0
+        self._buffer = []  # [(key, 인코딩된 줄)]
+        self._buffered = 0
+        self._runs = []
+
+    def add(self, record: dict):
+        line = dumps(record)
+        self._buffer.append((self.key(record), line))
+        self.count += 1
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_bytes:
+            self._spill()
+
+    def _spill(self):
+        self._buffer.sort(key=lambda item: item[0])
+        self._runs.append(_write_run(self._buffer))
+        self._buffer, self._buffered = [], 0
+
+    def close(self) -> int:
+        self._buffer.sort(key=lambda item: item[0])
+        # heapq.merge는 key가 같으면 앞쪽 iterable을 먼저 내므로 (먼저 내보낸 run → 버퍼) 순서가 유지된다
+        runs = [_read_run(path) for path in self._runs] + [iter(self._buffer)]
+        tmp = self.path + '.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                for _, line in heapq.merge(*runs, key=lambda item: item[0]):
+                    f.write(line + b'\n')
+            os.replace(tmp, self.path)
+        finally:
+            for path in self._runs:
+                os.remove(path)
+            self._runs, self._buffer, self._buffered = [], [], 0
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            for path in self._runs:
+                os.remove(path)
+
+
+class JsonlQueue:
+    """iter_jsonl 위의 큐: bool()은 남은 레코드 여부(다음 줄을 미리 읽어 둠), pop()은 다음 레코드"""
+    _EMPTY = object()
+
+    def __init__(self, records=(), limit: int = None):
+        self._records = iter(records) if not limit else islice(records, limit)
+        self._next = self._EMPTY
+
+    def _peek(self):
+        if self._next is self._EMPTY:
+            self._next = next(self._records, self._EMPTY)
+        return self._next
+
+    def __bool__(self):
+        return self._peek() is not self._EMPTY
+
+    def pop(self) -> dict:
+        record = self._peek()
+        if record is self._EMPTY:
+            raise IndexError('pop from empty JsonlQueue')
+        self._next = self._EMPTY
+        return record
+
+    def __iter__(self):
+        while self:
+            yield self.pop()
@@ -0,0 +1,162 @@
+# translate/app/analyzer/parallel_analyzer.py
+# 역할: 파일 단위 파싱(JavaAnalyzer/PythonAnalyzer/XmlMapperAnalyzer + 폴백)을 프로세스 풀로 분산
+#   - javalang 파싱은 순수 파이썬이라 GIL 때문에 스레드로는 빨라지지 않으므로 프로세스를 사용
+#   - 큰 파일부터 chunk 단위로 제출하고(긴 꼬리 방지), 결과는 입력 순서 그대로 재조립 → 순차 실행과 동일한 출력
+#   - 파일 수가 ANALYZE_PARALLEL_MIN_FILES 미만이거나 워커가 1개면 현재 프로세스에서 순차 실행
+#   - Java 파서 백엔드(java_backends: javalang|tree_sitter)는 작업마다 보내지 않고 워커 초기화 때 한 번만 전달
+#   - Java 결과에는 SQL을 넣지 않는다: XML 매퍼는 Java와 함께 파싱하고 SQL은 분석 후 sql_bindings로 따로 묶음
+#   - parse_* 함수는 파일 내용에만 의존(경로/source_info/role 없음) → ParseCache로 내용이 같은 파일은 다시 파싱하지 않음
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from translate.app.analyzer.python_analyzer import PythonAnalyzer
+from translate.app.analyzer.java_backends import create_java_analyzer
+from translate.app.analyzer.xml_mapper_analyzer import XmlMapperAnalyzer
+from translate.app.analyzer.java_lenient_fallback import extract_classes_lenient_from_text
+from translate.app.analyzer.python_lenient_fallback import extract_outline_from_text
+
+ANALYZE_WORKERS = int(os.environ.get('ANALYZE_WORKERS', '0')) or (os.cpu_count() or 1)
+ANALYZE_PARALLEL_MIN_FILES = int(os.environ.get('ANALYZE_PARALLEL_MIN_FILES', '16'))
+ANALYZE_CHUNK_FILES = int(os.environ.get('ANALYZE_CHUNK_FILES', '8'))
+
+_java_parser = None
+
+
+def _init_worker(java_parser=None):
+    global _java_parser
+    _java_parser = java_parser
+
+
+def _read_text(file_path):
+    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def parse_python_file(file_path: str):
+    """파일 1개 → (classes, functions). 함수의 external_calls까지 채운다 (source_info/역할은 호출 측)"""
+    analyzer = PythonAnalyzer(file_path)
+    if not analyzer.is_parsed:
+        # 파싱이 안 되는 파일은 함수의 calls가 비어 있으므로 외부 호출도 없음
+        py_classes, py_funcs = extract_outline_from_text(_read_text(file_path))
+        for func in py_funcs:
+            func['external_calls'] = []
+        return py_classes, py_funcs
+
+    # 한 번의 파싱/순회로 클래스·함수·호출·외부 호출 토큰을 함께 수집
+    outline = analyzer.outline()
+    ext_tokens = outline["external_calls"]
+    for func in outline["functions"]:
+        call_targets = {c.get("target") for c in (func.get("calls") or []) if c.get("target")}
+        func['external_calls'] = sorted(call_targets & ext_tokens)
+    return outline["classes"], outline["functions"]
+
+
+def parse_java_file(file_path: str):
+    """파일 1개 → 클래스 목록 (source_info/역할은 호출 측). 파싱된 클래스에는 메서드별 호출 target("methods")을 붙인다"""
+    analyzer = create_java_analyzer(file_path, backend=_java_parser)
+    if analyzer.is_parsed:
+        return _with_methods(analyzer.extract_classes(), analyzer.extract_functions())
+    return extract_classes_lenient_from_text(_read_text(file_path))
+
+
+def _with_methods(classes, functions):
+    """클래스 레코드에 "methods": [{"name", "calls": [target, ...]}] (feature_clusters.call_graph의 입력, 본문은 담지 않음)"""
+    methods = {}
+    for func in functions:
+        methods.setdefault(func.get("class"), []).append(
+            {"name": func.get("name"), "calls": [c["target"] for c in (func.get("calls") or []) if c.get("target")]})
+    for cls in classes:
+        cls["methods"] = methods.get(cls.get("name"), [])
+    return classes
+
+
+def parse_xml_mapper(file_path: str):
+    """MyBatis/iBatis 매퍼 1개 → parse_mapper 결과 (<include>는 모든 매퍼를 모은 뒤 bind_queries에서, 파싱 실패는 None)"""
+    return XmlMapperAnalyzer(file_path).mapper
+
+
+def _run_chunk(fn, chunk):
+    return [(index, fn(file_path)) for index, file_path in chunk]
+
+
+def _size(file_path):
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def _read_bytes(file_path):
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _parse(fn, file_paths, workers, java_parser=None):
+    workers = min(workers or ANALYZE_WORKERS, len(file_paths))
+    if workers <= 1 or len(file_paths) < ANALYZE_PARALLEL_MIN_FILES:
+        _init_worker(java_parser)
+        return [fn(file_path) for file_path in file_paths]
+
+    # 큰 파일부터 나눠 담되, chunk 하나가 전체의 1/(workers*4)를 넘지 않도록
+    order = sorted(range(len(file_paths)), key=lambda i: _size(file_paths[i]), reverse=True)
+    chunk_size = max(1, min(ANALYZE_CHUNK_FILES, len(file_paths) // (workers * 4)))
+    chunks = [[(i, file_paths[i]) for i in order[s:s + chunk_size]] for s in range(0, len(order), chunk_size)]
+
+    results = [None] * len(file_paths)
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker,
+                             initargs=(java_parser,)) as pool:
+        for done in pool.map(_run_chunk, [fn] * len(chunks), chunks):
+            for index, result in done:
+                results[index] = result
+    return results
+
+
+def analyze_files(fn, file_paths, workers: int = None, cache=None, digests: dict = None,
+                  java_parser: str = None) -> list:
+    """
+    file_paths: [path, ...] → [fn(path), ...] (입력 순서 그대로)
+    cache(ParseCache)가 있으면 내용이 같은 파일은 캐시에서 꺼내고, 새로 파싱한 결과는 저장한다.
+    digests({path: sha256}, manifest)에 있는 파일은 해시를 위해 다시 읽지 않는다.
+    java_parser(java_backends.resolve_backend 결과)는 parse_java_file의 백엔드이며 캐시 key에도 들어간다.
+    """
+    file_paths = list(file_paths)
+    if cache is None:
+        return _parse(fn, file_paths, workers, java_parser)
+
+    salt = fn.__name__ + (':' + java_parser if java_parser else '')
+    digests = digests or {}
+    keys = []
+    for file_path in file_paths:
+        digest = digests.get(file_path)
+        if digest:
+            keys.append(cache.key_for_digest(digest, salt))
+            continue
+        data = _read_bytes(file_path)
+        keys.append(None if data is None else cache.key(data, salt))
+
+    blobs = cache.get_many(k for k in keys if k)
+    hits = set(blobs)
+    first = {}  # 캐시에 없는 key -> 처음 나온 index (내용이 같은 파일은 한 번만 파싱)
+    for i, key in enumerate(keys):
+        if key not in hits:
+            first.setdefault(key or ('nokey', i), i)
+
+    results = [None] * len(file_paths)
+    todo = list(first.values())
+    for i, result in zip(todo, _parse(fn, [file_paths[i] for i in todo], workers, java_parser)):
+        results[i] = result
+        if keys[i]:
+            blobs[keys[i]] = cache.dumps(result)
+    cache.put_many([(keys[i], blobs[keys[i]]) for i in todo if keys[i]])
+
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            results[i] = cache.loads(blobs[key])  # 캐시 hit 또는 같은 내용의 다른 경로: 독립된 사본
+    return results
@@ -0,0 +1,144 @@
+# translate/app/analyzer/parse_cache.py
+# 역할: 파일 내용 기반(content-addressed) 파싱 결과 캐시 (SQLite, 크기 제한 LRU)
+#   - key: SHA-256(분석기 버전 + 파서 종류/추가 salt + SHA-256(소스 bytes))
+#     소스 해시는 manifest에 이미 있으면 그것을 쓴다 (key_for_digest) → 해시 계산을 위해 파일을 다시 읽지 않음
+#     분석기 버전은 파싱 관련 모듈 소스의 해시라서 분석기 코드가 바뀌면 자동으로 무효화된다 (PARSE_CACHE_VERSION으로 수동 bump 가능)
+#   - value: 파서 반환값(경로와 무관한 클래스/함수/호출/SQL 매핑) pickle + zlib
+#   - 전체 크기가 PARSE_CACHE_MAX_BYTES를 넘으면 마지막 사용 시각이 오래된 것부터 삭제
+#   - hit/miss/write/eviction 카운터는 stats()로 노출
+
+import os
+import time
+import zlib
+import pickle
+import sqlite3
+import hashlib
+from pathlib import Path
+
+PARSE_CACHE_DIR = Path(os.environ.get('PARSE_CACHE_DIR', Path(__file__).resolve().parent.parent / "parse_cache"))
+PARSE_CACHE_MAX_BYTES = int(os.environ.get('PARSE_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+PARSE_CACHE_VERSION = os.environ.get('PARSE_CACHE_VERSION', '1')
+
+# 이 모듈들의 소스가 바뀌면 캐시 key가 달라진다
+_VERSIONED_MODULES = (
+    "java_analyzer.py", "python_analyzer.py", "java_lenient_fallback.py", "python_lenient_fallback.py",
+    "external_usage_detector.py", "xml_mapper_analyzer.py", "parallel_analyzer.py",
+    "tree_sitter_java_analyzer.py", "java_backends.py",
+)
+
+_version = None
+
+
+def analyzer_version() -> str:
+    global _version
+    if _version is None:
+        h = hashlib.sha256(PARSE_CACHE_VERSION.encode('utf-8'))
+        base = Path(__file__).resolve().parent
+        for name in _VERSIONED_MODULES:
+            path = base / name
+            if path.exists():
+                h.update(name.encode('utf-8'))
+                h.update(path.read_bytes())
+        _version = h.hexdigest()[:16]
+    return _version
+
+
+def open_parse_cache():
+    """PARSE_CACHE_ENABLED=0 이면 None"""
+    if os.environ.get('PARSE_CACHE_ENABLED', '1') == '0':
+        return None
+    return ParseCache()
+
+
+class ParseCache:
+    def __init__(self, directory: Path = PARSE_CACHE_DIR, max_bytes: int = PARSE_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(str(self.directory / "parse_cache.db"), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key        TEXT PRIMARY KEY,
+                value      BLOB NOT NULL,
+                size       INTEGER NOT NULL,
+                last_used  REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)")
+        self.conn.commit()
+        self.hits = self.misses = self.writes = self.evictions = 0
+
+    def key(self, data: bytes, salt: str = '') -> str:
+        return self.key_for_digest(hashlib.sha256(data).hexdigest(), salt)
+
+    @staticmethod
+    def key_for_digest(sha256: str, salt: str = '') -> str:
+        h = hashlib.sha256(analyzer_version().encode('utf-8'))
+        h.update(b'\0' + salt.encode('utf-8') + b'\0')
+        h.update(sha256.encode('ascii'))
+        return h.hexdigest()
+
+    def get_many(self, keys) -> dict:
+        """{key: blob} (없는 key는 빠짐, loads()로 복원). 찾은 항목의 last_used를 한 트랜잭션으로 갱신"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, value FROM entries WHERE key IN ({','.join('?' * len(batch))})", batch
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = blob
+        if found:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany("UPDATE entries SET last_used=? WHERE key=?", [(now, k) for k in found])
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    @staticmethod
+    def dumps(value) -> bytes:
+        return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+    @staticmethod
+    def loads(blob: bytes):
+        return pickle.loads(zlib.decompress(blob))
+
+    def put_many(self, items):
+        """items: [(key, blob)] — blob은 dumps()로 만든 값"""
+        if not items:
+            return
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO entries(key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                [(k, blob, len(blob), now) for k, blob in items]
+            )
+        self.writes += len(items)
+        self._evict()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims, freed = [], 0
+        for key, size in self.conn.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        with self.conn:
+            self.conn.executemany("DELETE FROM entries WHERE key=?", victims)
+        self.evictions += len(victims)
+
+    def stats(self) -> dict:
+        entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes,
+                'evictions': self.evictions, 'entries': entries, 'bytes': size}
+
+    def close(self):
+        self.conn.close()
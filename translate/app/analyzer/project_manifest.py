@@ -0,0 +1,135 @@
+# translate/app/analyzer/project_manifest.py
+# 역할: preprocessing에서 한 번 만든 프로젝트 manifest (이후 노드는 파일시스템을 다시 훑지 않고 이것만 읽는다)
+#   - files      : [{path, rel_path, language, size, sha256, encoding}] (경로 순)
+#   - languages  : {language: 파일 수}
+#   - build_files: [{rel_path, type(maven|gradle), framework, egov_version}] (얕은 경로 → 이름 순)
+#   - framework/egov_version: build_files 기준 판정 결과 (detect_language가 그대로 사용)
+#   - sha256은 파싱 캐시 key에도 쓰이므로 analyze 단계는 해시를 위해 파일을 다시 읽지 않는다
+
+import os
+import re
+import logging
+import posixpath
+import xml.etree.ElementTree as ET
+from typing import List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+
+MAVEN_NS = {'m': 'http://maven.apache.org/POM/4.0.0'}
+# 전자정부 실행환경 groupId (3.x: egovframework.rte, 4.x: org.egovframe.rte)
+EGOV_GROUPS = ('egovframework.rte', 'org.egovframe.rte')
+BUILD_FILE_TYPES = {'pom.xml': 'maven', 'build.gradle': 'gradle', 'build.gradle.kts': 'gradle'}
+
+_GRADLE_EGOV = re.compile(r"""['"](?:%s)[\w.\-]*:[\w.\-]+:([^'"\s@:]+)""" % '|'.join(re.escape(g) for g in EGOV_GROUPS))
+_GRADLE_EGOV_ANY = re.compile('|'.join(re.escape(g) for g in EGOV_GROUPS))
+_GRADLE_BOOT = re.compile(r"""org\.springframework\.boot['"]|spring-boot-gradle-plugin|spring-boot-starter""")
+_PROPERTY = re.compile(r'^\$\{([^}]+)\}$')
+_GRADLE_VARIABLE = re.compile(r'^\$\{?([\w.]+?)\}?$')  # $egovVersion / ${egovVersion} / ${rootProject.ext.egovVersion}
+
+
+def parse_pom(data: bytes) -> Tuple[str, Optional[str]]:
+    """pom.xml 내용 → (framework, egov_version). 버전이 ${property}면 같은 pom의 <properties>로 치환"""
+    root = ET.fromstring(data)
+    framework, egov_version = 'unknown', None
+    if root.find('.//m:parent[m:artifactId="spring-boot-starter-parent"]', MAVEN_NS) is not None:
+        framework = 'Spring Boot'
+    for group in EGOV_GROUPS:
+        egov_dep = root.find(f'.//m:dependency[m:groupId="{group}"]', MAVEN_NS)
+        if egov_dep is None:
+            continue
+        framework = 'eGovFrame'
+        version_tag = egov_dep.find('m:version', MAVEN_NS)
+        if version_tag is not None and version_tag.text:
+            egov_version = version_tag.text.strip()
+            prop = _PROPERTY.match(egov_version)
+            if prop:
+                value = root.find(f'm:properties/m:{prop.group(1)}', MAVEN_NS)
+                if value is not None and value.text:
+                    egov_version = value.text.strip()
+        break
+    return framework, egov_version
+
+
+def parse_gradle(text: str) -> Tuple[str, Optional[str]]:
+    """build.gradle(.kts) 내용 → (framework, egov_version). 의존성 좌표 문자열만 정규식으로 보고, 버전 변수는 같은 파일에서 치환"""
+    framework, egov_version = 'unknown', None
+    if _GRADLE_BOOT.search(text):
+        framework = 'Spring Boot'
+    if _GRADLE_EGOV_ANY.search(text):
+        framework = 'eGovFrame'
+        match = _GRADLE_EGOV.search(text)
+        if match:
+            egov_version = _gradle_value(text, match.group(1))
+    return framework, egov_version
+
+
+def _gradle_value(text: str, version: str) -> Optional[str]:
+    """좌표의 버전이 변수면 같은 파일의 `[def|val|ext.]이름 = '값'` 으로 치환, 못 찾으면 None"""
+    variable = _GRADLE_VARIABLE.match(version)
+    if not variable:
+        return version
+    name = variable.group(1).rsplit('.', 1)[-1]
+    assigned = re.search(r"""(?:\b|\.)%s\s*=\s*['"]([^'"$]+)['"]""" % re.escape(name), text)
+    return assigned.group(1).strip() if assigned else None
+
+
+def parse_build_file(path: str, rel_path: str) -> dict:
+    kind = BUILD_FILE_TYPES[posixpath.basename(rel_path)]
+    info = {'rel_path': rel_path, 'type': kind, 'framework': 'unknown', 'egov_version': None}
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if kind == 'maven':
+            info['framework'], info['egov_version'] = parse_pom(data)
+        else:
+            info['framework'], info['egov_version'] = parse_gradle(data.decode('utf-8', errors='ignore'))
+    except Exception as e:
+        info['error'] = str(e)
+        logging.warning(f"Error parsing {rel_path}: {e}")
+    return info
+
+
+def resolve_framework(build_files: List[dict]) -> Tuple[str, str]:
+    """프레임워크가 처음 확인되는 빌드 파일에서 멈춤 (기존 detect_language의 pom.xml 순회와 같은 규칙)"""
+    framework, egov_version = 'unknown', 'unknown'
+    for info in build_files:
+        if info['framework'] != 'unknown':
+            framework = info['framework']
+        if info['egov_version']:
+            egov_version = info['egov_version']
+        if framework != 'unknown':
+            break
+    return framework, egov_version
+
+
+def build_manifest(extract_dir: str, entries: List[dict], source: str = '') -> dict:
+    """FileExtractor.extract_supported() 결과 → manifest. 빌드 파일만 추가로 읽는다 (작은 파일 몇 개)"""
+    base = os.path.abspath(extract_dir)
+    files, languages, build_files = [], {}, []
+    for entry in entries:
+        path = os.path.abspath(entry['path'])
+        rel_path = os.path.relpath(path, base).replace(os.sep, '/')
+        language = entry['language']
+        files.append({'path': path, 'rel_path': rel_path, 'language': language,
+                      'size': entry.get('size'), 'sha256': entry.get('sha256'), 'encoding': entry.get('encoding')})
+        languages[language] = languages.get(language, 0) + 1
+        if posixpath.basename(rel_path) in BUILD_FILE_TYPES:
+            build_files.append(parse_build_file(path, rel_path))
+
+    build_files.sort(key=lambda b: (b['rel_path'].count('/'), b['rel_path']))
+    framework, egov_version = resolve_framework(build_files)
+    return {
+        'version': MANIFEST_VERSION,
+        'source': source,
+        'root': base,
+        'files': files,
+        'languages': languages,
+        'build_files': build_files,
+        'framework': framework,
+        'egov_version': egov_version,
+    }
+
+
+def digests(manifest: Optional[dict]) -> dict:
+    """{abs_path: sha256} (manifest가 없으면 빈 dict)"""
+    return {f['path']: f['sha256'] for f in (manifest or {}).get('files', []) if f.get('sha256')}
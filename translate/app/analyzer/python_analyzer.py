@@ -1,4 +1,8 @@
 import ast
+import re
+from collections import deque
+
+from translate.app.analyzer.external_usage_detector import ExternalUsageDetector
 
 def _name_from_base(node):
     # models.Model / rest_framework.views.APIView / Generic[T] 등 폭넓게 커버
@@ -33,6 +37,21 @@ def _decorator_name(d):
         return _decorator_name(d.func)
     return None
 
+_FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+# ast._splitlines_no_ff와 같은 줄 나눔 (\r\n, \n, \r만 줄 끝, 줄 끝 문자 유지)
+_LINE_RE = re.compile(r"[^\r\n]*(?:\r\n|\n|\r|$)")
+
+
+def _import_aliases(node, aliases):
+    if isinstance(node, ast.Import):
+        for a in node.names:
+            aliases[a.asname or a.name.split(".")[0]] = a.name if a.asname else a.name.split(".")[0]
+    else:
+        module = "." * (node.level or 0) + (node.module or "")
+        for a in node.names:
+            aliases[a.asname or a.name] = f"{module}.{a.name}" if module else a.name
+
+
 class PythonAnalyzer:
     def __init__(self, file_path):
         self.file_path = file_path
@@ -46,54 +65,117 @@ class PythonAnalyzer:
             self.is_parsed = True
         except Exception as e:
             print(f"⚠️ [Python Parse Warning] Failed to parse file: {self.file_path}\n    Reason: {e}")
+        self._outline = None
+        self._lines = None
+
+    # ---- 단일 순회: 한 번의 ast.parse + 한 번의 BFS(ast.walk와 같은 순서)로 전부 수집 ----
+    def outline(self) -> dict:
+        """
+        {classes, functions, imports, external_calls, comments}
+          - classes/functions: extract_classes()/extract_functions()와 같은 레코드·순서
+          - imports: {별칭: 모듈 경로} (import x as y, from a import b)
+          - external_calls: ExternalUsageDetector(code).detect()와 같은 set
+          - comments: CommentAnalyzer(code).detect()와 같은 [{function, comment}]
+        """
+        if self._outline is None:
+            self._outline = self._single_pass() if self.is_parsed else {
+                "classes": [], "functions": [], "imports": {}, "external_calls": set(), "comments": []}
+        return self._outline
+
+    def _segment(self, node):
+        """ast.get_source_segment(self.code, node)와 같은 결과 (줄 분리는 파일당 한 번)"""
+        if getattr(node, "end_lineno", None) is None or getattr(node, "end_col_offset", None) is None:
+            return None
+        if self._lines is None:
+            self._lines = _LINE_RE.findall(self.code)
+        lineno, end_lineno = node.lineno - 1, node.end_lineno - 1
+        if lineno == end_lineno:
+            return self._lines[lineno].encode()[node.col_offset:node.end_col_offset].decode()
+        first = self._lines[lineno].encode()[node.col_offset:].decode()
+        last = self._lines[end_lineno].encode()[:node.end_col_offset].decode()
+        return "".join([first, *self._lines[lineno + 1:end_lineno], last])
+
+    def _function_record(self, fn, class_name=None):
+        decos = list(filter(None, [_decorator_name(d) for d in fn.decorator_list]))
+        return {
+            "name": fn.name,
+            "class": class_name,
+            "decorators": [f"@{d}" for d in decos],  # 함수 데코레이터는 기존처럼 '@' 프리픽스 유지
+            "calls": [],                              # 순회하며 채움 (extract_calls(fn)과 같은 순서)
+            "body": self._segment(fn),
+            "line_range": f"L{fn.lineno}-L{fn.end_lineno}"
+        }
+
+    def _function_comments(self, fn, source_lines, comments):
+        start_line = fn.lineno - 2
+        while start_line >= 0 and source_lines[start_line].strip().startswith("#"):
+            comments.append({"function": fn.name, "comment": source_lines[start_line].strip("# ").strip()})
+            start_line -= 1
+        docstring = ast.get_docstring(fn)
+        if docstring:
+            comments.append({"function": fn.name, "comment": docstring.strip()})
+
+    def _single_pass(self):
+        classes, methods, imports, external = [], [], {}, set()
+        functions = [self._function_record(node) for node in self.tree.body if isinstance(node, _FUNCTION_DEFS)]
+        owners_of = {id(node): rec for node, rec in zip(
+            [n for n in self.tree.body if isinstance(n, _FUNCTION_DEFS)], functions)}
+        comment_defs = []  # CommentAnalyzer가 방문하는 FunctionDef (다른 FunctionDef 안이 아닌 것)
+
+        # (node, 이 노드를 감싸는 수집 대상 함수 레코드들, FunctionDef 내부 여부)
+        todo = deque([(self.tree, (), False)])
+        while todo:
+            node, owners, in_def = todo.popleft()
+            kind = type(node)
+            if kind is ast.Call:
+                func = node.func
+                if isinstance(func, (ast.Name, ast.Attribute)):
+                    target = _decorator_name(func)
+                    if target:
+                        for rec in owners:
+                            rec["calls"].append({"target": target, "type": "internal"})
+                token = _decorator_name(func)
+                if token and ExternalUsageDetector.is_external(token):
+                    external.add(token)
+            elif kind is ast.ClassDef:
+                if node.name != "Meta":
+                    bases = [(_name_from_base(b) or "") for b in node.bases]
+                    classes.append({
+                        "name": node.name,
+                        "type": "ClassDef",
+                        "bases": [b.split(".")[-1] if b else "" for b in bases],  # (스키마 유지) 끝 토큰만 사용
+                        "decorators": list(filter(None, [_decorator_name(d) for d in node.decorator_list])),
+                        "body": self._segment(node)
+                    })
+                    for child in node.body:
+                        if isinstance(child, _FUNCTION_DEFS):
+                            rec = self._function_record(child, class_name=node.name)
+                            methods.append(rec)
+                            owners_of[id(child)] = rec
+            elif kind is ast.Import or kind is ast.ImportFrom:
+                _import_aliases(node, imports)
+            elif kind is ast.FunctionDef and not in_def:
+                comment_defs.append(node)
+
+            rec = owners_of.get(id(node))
+            child_owners = owners + (rec,) if rec is not None else owners
+            child_in_def = in_def or kind is ast.FunctionDef
+            for child in ast.iter_child_nodes(node):
+                todo.append((child, child_owners, child_in_def))
+
+        comments, source_lines = [], self.code.splitlines() if comment_defs else []
+        for fn in sorted(comment_defs, key=lambda n: (n.lineno, n.col_offset)):  # NodeVisitor(DFS) 방문 순서 = 소스 순서
+            self._function_comments(fn, source_lines, comments)
+        return {"classes": classes, "functions": functions + methods, "imports": imports,
+                "external_calls": external, "comments": comments}
 
     def extract_classes(self):
         if not self.is_parsed: return []
-        classes = []
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.ClassDef):
-                if node.name == "Meta":
-                    continue
-                bases = [(_name_from_base(b) or "") for b in node.bases]
-                bases_tail = [b.split(".")[-1] if b else "" for b in bases]
-                decos = list(filter(None, [_decorator_name(d) for d in node.decorator_list]))
-                classes.append({
-                    "name": node.name,
-                    "type": "ClassDef",
-                    "bases": bases_tail,                  # (스키마 유지) 끝 토큰만 사용
-                    "decorators": decos,                  # 클래스 데코레이터는 '@' 없이
-                    "body": ast.get_source_segment(self.code, node)
-                })
-        return classes
+        return [dict(c) for c in self.outline()["classes"]]
 
     def extract_functions(self):
         if not self.is_parsed: return []
-        functions = []
-
-        def _collect(fn, class_name=None):
-            decos = list(filter(None, [_decorator_name(d) for d in fn.decorator_list]))
-            # 함수 데코레이터는 기존처럼 '@' 프리픽스 유지
-            decorators_list = [f"@{d}" for d in decos]
-            functions.append({
-                "name": fn.name,
-                "class": class_name,
-                "decorators": decorators_list,
-                "calls": self.extract_calls(fn),
-                "body": ast.get_source_segment(self.code, fn),
-                "line_range": f"L{fn.lineno}-L{fn.end_lineno}"
-            })
-
-        for node in self.tree.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                _collect(node)
-
-        for class_node in ast.walk(self.tree):
-            if isinstance(class_node, ast.ClassDef):
-                if class_node.name == "Meta": continue
-                for node in class_node.body:
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        _collect(node, class_name=class_node.name)
-        return functions
+        return [{**f, "calls": [dict(c) for c in f["calls"]]} for f in self.outline()["functions"]]
 
     def extract_calls(self, node=None):
         if node is None:
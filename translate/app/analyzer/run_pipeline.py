@@ -8,7 +8,7 @@ from dataclasses import dataclass, asdict
 from .java_analyzer import JavaAnalyzer
 from .python_analyzer import PythonAnalyzer
 from .structure_mapper import StructureMapper
-from .xml_mapper_analyzer import XmlMapperAnalyzer
+from .xml_mapper_analyzer import XmlMapperAnalyzer, bind_queries
 from .file_extractor import FileExtractor
 
 
@@ -27,8 +27,8 @@ def run_pipeline(zip_file_path: str, output_dir: str = "output"):
 
     print("--- 1단계: 소스 코드 파일 추출 ---")
     file_extractor = FileExtractor(zip_file_path)
-    extract_dir = file_extractor.extract_zip()
-    all_files = file_extractor.find_supported_code_files()
+    all_files = [(f['path'], f['language']) for f in file_extractor.extract_supported()]
+    extract_dir = file_extractor.extract_dir
     print(f"'{zip_file_path}'에서 총 {len(all_files)}개의 지원 파일을 찾았습니다.\n")
 
     detected_langs = {lang for _, lang in all_files if lang in ['java', 'python']}
@@ -37,9 +37,7 @@ def run_pipeline(zip_file_path: str, output_dir: str = "output"):
     query_bank = {}
     if 'java' in detected_langs:
         xml_files = [path for path, lang in all_files if lang == 'xml' and 'src/main/resources' in path]
-        for xml_file in xml_files:
-            analyzer = XmlMapperAnalyzer(xml_file)
-            query_bank.update(analyzer.get_queries())
+        query_bank = bind_queries([XmlMapperAnalyzer(xml_file).mapper for xml_file in xml_files])
         print(f"→ 총 {len(query_bank)}개의 SQL 쿼리를 쿼리 뱅크에 로드했습니다.\n")
 
     print("--- 3단계: 소스 코드 정보 추출 ---")
@@ -68,10 +66,14 @@ def run_pipeline(zip_file_path: str, output_dir: str = "output"):
 
     print("--- 4단계: 아키텍처 역할 추론 ---")
     mapper = StructureMapper()
+    functions_by_class = {}
+    for func_info in all_functions:
+        if func_info.get("class"):
+            functions_by_class.setdefault(func_info["class"], []).append(func_info)
     for class_info in all_classes:
         py_class_functions = []
         if class_info.get("source_info", {}).get("language") == 'python':
-            py_class_functions = [f for f in all_functions if f.get("class") == class_info.get("name")]
+            py_class_functions = functions_by_class.get(class_info.get("name"), [])
         class_info_with_functions = {**class_info, "functions": py_class_functions}
         role_info = mapper.infer_class_role(class_info_with_functions)
         class_info['role'] = role_info
@@ -0,0 +1,179 @@
+# translate/app/analyzer/snapshot.py
+# 역할: 증분 재분석용 분석 스냅샷 (같은 프로젝트의 v1 → v2 → v3 업로드)
+#   - 스냅샷 디렉토리: manifest.json(파일별 sha256) + 파일별 분석 레코드
+#       java_classes.jsonl         : Java 클래스 레코드(role/spans 포함, 본문 없음)
+#       java_analysis_results.json : feature별 결과 (영향 없는 feature는 그대로 재사용)
+#       classes.jsonl/functions.jsonl : Python 결과 (role 포함)
+#       snapshot.json              : 버전/분석기 버전/원본 zip 이름
+#   - 새 업로드의 manifest와 내용 해시로 비교해 added/modified/removed/unchanged 파일을 나누고
+#     unchanged 파일의 레코드는 다시 파싱/역할 추론하지 않고 재사용한다
+#   - 분석기 버전(parse_cache.analyzer_version)이 다르면 레코드를 믿을 수 없으므로 전부 modified로 취급
+#   - 작업별 위치: ANALYSIS_SNAPSHOT_DIR/<userId>/<업로드 이름>/current 가 이전 스냅샷,
+#     이번 분석은 같은 디렉토리의 staging-*에 쓰고 작업 전체가 성공했을 때만 current로 교체 (promote_snapshot)
+#     → 변환이 실패한 작업의 결과가 다음 작업의 "변경 없음" 기준이 되지 않는다
+
+import os
+import re
+import json
+import shutil
+import logging
+import tempfile
+import posixpath
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from translate.app.analyzer.parse_cache import analyzer_version
+from translate.app.analyzer.jsonl_store import iter_jsonl, write_jsonl
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+# 비우면('') 증분 재분석을 쓰지 않는다
+ANALYSIS_SNAPSHOT_DIR = os.environ.get('ANALYSIS_SNAPSHOT_DIR', str(Path(__file__).resolve().parent.parent / "snapshots"))
+
+_JSONL_PARTS = ("java_classes", "classes", "functions")
+_JSON_PARTS = ("manifest", "java_analysis_results")
+
+
+def _rel_path(record: dict) -> str:
+    return (record.get("source_info") or {}).get("rel_path") or ""
+
+
+def load_snapshot(directory: str) -> Optional[dict]:
+    """스냅샷 디렉토리 → {meta, manifest, java_classes, java_analysis_results, classes, functions}. 없거나 버전이 다르면 None"""
+    meta_path = os.path.join(directory or "", "snapshot.json")
+    if not directory or not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != SNAPSHOT_VERSION:
+        logger.warning(f"[SNAPSHOT] unsupported snapshot version {meta.get('version')} in {directory}")
+        return None
+
+    snapshot = {"meta": meta}
+    for part in _JSON_PARTS:
+        path = os.path.join(directory, f"{part}.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                snapshot[part] = json.load(f)
+    for part in _JSONL_PARTS:
+        path = os.path.join(directory, f"{part}.jsonl")
+        if os.path.exists(path):
+            snapshot[part] = list(iter_jsonl(path))
+    return snapshot
+
+
+def save_snapshot(directory: str, manifest: dict, **parts):
+    """parts: java_classes/classes/functions(레코드 iterable), java_analysis_results(json). 넘긴 것만 덮어쓴다"""
+    os.makedirs(directory, exist_ok=True)
+
+    def _write(name, write):
+        path = os.path.join(directory, name)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            write(f)
+        os.replace(tmp, path)
+
+    for part, value in parts.items():
+        if value is None:
+            continue
+        if part in _JSONL_PARTS:
+            write_jsonl(os.path.join(directory, f"{part}.jsonl"), value)
+        else:
+            _write(f"{part}.json", lambda f: json.dump(value, f, ensure_ascii=False))
+    _write("manifest.json", lambda f: json.dump(manifest, f, ensure_ascii=False))
+    _write("snapshot.json", lambda f: json.dump({"version": SNAPSHOT_VERSION,
+                                                  "analyzer_version": analyzer_version(),
+                                                  "source": manifest.get("source")}, f))
+
+
+def diff_files(previous: Optional[dict], manifest: dict) -> Dict[str, List[str]]:
+    """두 manifest의 파일을 rel_path/sha256으로 비교. previous가 없으면 전부 added"""
+    old = {f["rel_path"]: f.get("sha256") for f in (previous or {}).get("files", [])}
+    changes = {"added": [], "modified": [], "removed": [], "unchanged": []}
+    seen = set()
+    for f in manifest.get("files", []):
+        rel = f["rel_path"]
+        seen.add(rel)
+        if rel not in old:
+            changes["added"].append(rel)
+        elif not f.get("sha256") or old[rel] != f.get("sha256"):
+            changes["modified"].append(rel)
+        else:
+            changes["unchanged"].append(rel)
+    changes["removed"] = sorted(rel for rel in old if rel not in seen)
+    return changes
+
+
+def compatible(snapshot: Optional[dict]) -> bool:
+    """레코드를 만든 분석기와 지금 분석기가 같은지"""
+    return bool(snapshot) and snapshot["meta"].get("analyzer_version") == analyzer_version()
+
+
+def reusable_records(snapshot: Optional[dict], part: str, unchanged: Iterable[str], zip_file: str) -> Dict[str, List[dict]]:
+    """{rel_path: [레코드...]} — unchanged 파일의 이전 레코드 (source_info.zip_file은 새 업로드 이름으로)"""
+    unchanged = set(unchanged)
+    by_path = {}
+    for record in (snapshot or {}).get(part) or []:
+        rel = _rel_path(record)
+        if rel in unchanged:
+            record.setdefault("source_info", {})["zip_file"] = zip_file
+            by_path.setdefault(rel, []).append(record)
+    return by_path
+
+
+def feature_changes(previous: Dict[str, set], current: Dict[str, set], changed_paths: set) -> Dict[str, List[str]]:
+    """
+    previous/current: {feature: {rel_path, ...}}
+    바뀐(추가/수정/삭제) 파일의 클래스가 하나라도 속한 feature는 modified
+    """
+    changes = {"added": [], "modified": [], "removed": [], "unchanged": []}
+    for feature, paths in current.items():
+        if feature not in previous:
+            changes["added"].append(feature)
+        elif paths != previous[feature] or paths & changed_paths:
+            changes["modified"].append(feature)
+        else:
+            changes["unchanged"].append(feature)
+    changes["removed"] = [feature for feature in previous if feature not in current]
+    return changes
+
+
+def project_snapshot_dir(user_id, input_path: str, root: str = None) -> Optional[str]:
+    """사용자 + 업로드 이름(확장자 제외, s3/http URI도 마지막 경로 조각) 단위의 스냅샷 디렉토리. 끈 경우 None"""
+    root = ANALYSIS_SNAPSHOT_DIR if root is None else root
+    name = posixpath.basename((input_path or "").replace("\\", "/").split("?")[0])
+    project = re.sub(r"[^\w.-]", "_", os.path.splitext(name)[0]) or "project"
+    if not root or user_id is None:
+        return None
+    return os.path.join(root, str(user_id), project)
+
+
+def begin_snapshot(project_dir: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """(previous_snapshot, snapshot_dir) — 이전 스냅샷(current, 없을 수 있음)과 이번 분석을 쓸 staging 디렉토리"""
+    if not project_dir:
+        return None, None
+    os.makedirs(project_dir, exist_ok=True)
+    return os.path.join(project_dir, "current"), tempfile.mkdtemp(prefix="staging-", dir=project_dir)
+
+
+def promote_snapshot(staging: Optional[str], project_dir: Optional[str]):
+    """작업이 성공했을 때: staging을 current로 교체 (분석이 스냅샷을 쓰지 못했으면 기존 current 유지)"""
+    if not staging or not project_dir:
+        return
+    if not os.path.exists(os.path.join(staging, "snapshot.json")):
+        discard_snapshot(staging)
+        return
+    current = os.path.join(project_dir, "current")
+    old = None
+    if os.path.exists(current):
+        old = tempfile.mkdtemp(prefix="old-", dir=project_dir)
+        os.replace(current, os.path.join(old, "current"))
+    os.replace(staging, current)
+    if old:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def discard_snapshot(staging: Optional[str]):
+    if staging:
+        shutil.rmtree(staging, ignore_errors=True)
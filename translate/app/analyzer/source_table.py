@@ -0,0 +1,39 @@
+# translate/app/analyzer/source_table.py
+# 역할: 파일 단위 원문 테이블 — 클래스 레코드는 본문 문자열 대신 spans([[start, end], ...])만 들고 다니고
+#   출력(java_analysis_results.json 등)을 만들 때만 여기서 원문을 잘라 본문을 만든다
+#   - 원문은 분석기와 같은 방식(utf-8, errors=ignore, universal newline)으로 읽어야 offset이 맞는다
+#   - 파일당 한 번만 읽고 캐시 (여러 클래스가 같은 파일을 공유)
+
+import os
+
+
+def span_key(record: dict) -> tuple:
+    return tuple(tuple(span) for span in record.get("spans") or ())
+
+
+class SourceTable:
+    def __init__(self, root: str):
+        self.root = root
+        self._texts = {}
+
+    def text(self, rel_path: str) -> str:
+        text = self._texts.get(rel_path)
+        if text is None:
+            try:
+                with open(os.path.join(self.root, rel_path), "r", encoding="utf-8", errors="ignore") as f:
+                    text = f.read()
+            except OSError:
+                text = ""
+            self._texts[rel_path] = text
+        return text
+
+    def body(self, record: dict) -> str:
+        """spans → 본문. spans가 없는 레코드(기존 형식)는 body를 그대로"""
+        spans = record.get("spans")
+        if spans is None:
+            return record.get("body") or ""
+        text = self.text((record.get("source_info") or {}).get("rel_path") or "")
+        return "\n\n".join(text[start:end] for start, end in spans)
+
+    def clear(self):
+        self._texts.clear()
@@ -1,6 +1,8 @@
 # analyzer/structure_mapper.py
 import re
 
+from translate.app.analyzer.hint_matcher import HintMatcher
+
 class StructureMapper:
     # === 기존 상수 유지 ===
     ROLE_CONTROLLER = "CONTROLLER"
@@ -46,6 +48,32 @@ class StructureMapper:
     _MANAGER_HINTS = ("objects.", "manager", "queryset")
 
     _IGNORE_SUBSTR = ("/tests/", "/migrations/", "/migrations_test_apps/", "/docs/")
+    _CONFIG_HINTS_BODY = ("app.config", "app.register_", "db.init_app", "create_app", "include(")
+    _CONTROLLER_DECO_MARKERS = ("@app.route", "@blueprint.route") + tuple(f"@{d}" for d in sorted(_DJANGO_VIEW_DECOS))
+
+    # ---- 힌트 테이블 → 그룹별 matcher (클래스 로딩 시 한 번 컴파일, 텍스트당 한 번 순회로 모든 그룹 hit) ----
+    _PATH_MATCHER = HintMatcher({
+        "ignore": _IGNORE_SUBSTR,
+        "fastapi": _FASTAPI_PATH_HINTS,
+        "models": ("/models/",),
+        "views": ("/views/",),
+        "dao": ("/repository/", "/repositories/", "/dao/"),
+        "service": ("/service/", "/services/"),
+        "settings": ("/settings/",),
+        "util": ("/utils/", "/helpers/"),
+    })
+    _CLASS_BODY_MATCHER = HintMatcher({
+        "pydantic": ("pydantic",),
+        "fastapi": _FASTAPI_BODY_HINTS,
+        "fastapi_app": ("fastapi(", "uvicorn.run"),
+        "dao": _DAO_HINTS_BODY,
+        "manager": _MANAGER_HINTS,
+    })
+    _FUNCTION_BODY_MATCHER = HintMatcher({
+        "fastapi": _FASTAPI_BODY_HINTS,
+        "config": _CONFIG_HINTS_BODY,
+    })
+    _DECORATOR_MATCHER = HintMatcher({"controller": _CONTROLLER_DECO_MARKERS})
 
     def infer_class_role(self, class_info: dict) -> dict:
         lang = class_info.get("source_info", {}).get("language")
@@ -61,32 +89,33 @@ class StructureMapper:
         body = (func_info.get("body") or "").lower()
         rel = ((func_info.get("source_info") or {}).get("rel_path") or "").replace("\\", "/").lower()
 
+        path_hits = self._PATH_MATCHER.match(rel)
+
         # 노이즈 경로 무시
-        if any(s in rel for s in self._IGNORE_SUBSTR):
+        if "ignore" in path_hits:
             return self._get_default_role("Ignored path (tests/migrations/docs).")
 
+        body_hits = self._FUNCTION_BODY_MATCHER.match(body)
+
         # --- FastAPI 함수형 라우팅 ---
         if any(d in self._FASTAPI_ROUTER_DECOS or d in self._FASTAPI_APP_DECOS for d in decorators) \
-           or any(h in body for h in self._FASTAPI_BODY_HINTS) \
-           or any(h in rel for h in self._FASTAPI_PATH_HINTS):
+           or "fastapi" in body_hits or "fastapi" in path_hits:
             return {"type": self.ROLE_CONTROLLER_METHOD, "confidence": 0.95,
                     "evidence": ["FastAPI router/app decorator or APIRouter/Depends detected"]}
 
         # --- Django/Flask 함수형 라우팅 (기존) ---
-        controller_markers = {"@app.route", "@blueprint.route"} | {f"@{d}" for d in self._DJANGO_VIEW_DECOS}
-        if any(m in f"@{deco}" for deco in func_info.get("decorators", []) for m in controller_markers) \
-           or "/views/" in rel or rel.endswith("/views.py"):
+        if self._DECORATOR_MATCHER.match_any(f"@{deco}" for deco in func_info.get("decorators", [])) \
+           or "views" in path_hits or rel.endswith("/views.py"):
             return {"type": self.ROLE_CONTROLLER_METHOD, "confidence": 0.95,
                     "evidence": ["Function-level routing/view decorator or views.py"]}
 
         # 설정/초기화 성격
-        if rel.endswith("/urls.py") or "/settings/" in rel \
-           or any(k in body for k in ("app.config", "app.register_", "db.init_app", "create_app", "include(")):
+        if rel.endswith("/urls.py") or "settings" in path_hits or "config" in body_hits:
             return {"type": self.ROLE_CONFIG, "confidence": 0.8,
                     "evidence": ["App init/config or urls/settings path"]}
 
         # 관례적 서비스 위치
-        if "/service/" in rel or "/services/" in rel:
+        if "service" in path_hits:
             return {"type": self.ROLE_SERVICE_IMPL, "confidence": 0.7,
                     "evidence": ["Service naming/path"]}
 
@@ -107,44 +136,46 @@ class StructureMapper:
         functions = class_info.get("functions", [])
         rel = ((class_info.get("source_info") or {}).get("rel_path") or "").replace("\\", "/").lower()
 
+        path_hits = self._PATH_MATCHER.match(rel)
+
         # 무시 경로
-        if any(s in rel for s in self._IGNORE_SUBSTR):
+        if "ignore" in path_hits:
             return self._get_default_role("Ignored path (tests/migrations/docs).")
 
+        body_hits = self._CLASS_BODY_MATCHER.match(body)
+
         # === FastAPI: DTO (pydantic BaseModel) ===
-        if "basemodel" in bases or "pydantic" in body:
+        if "basemodel" in bases or "pydantic" in body_hits:
             scores[self.ROLE_DTO] += 0.95; evidence[self.ROLE_DTO].append("Pydantic BaseModel/dataclass/schema")
 
         # === FastAPI: Controller 라우팅/의존성/경로 ===
-        if any(h in body for h in self._FASTAPI_BODY_HINTS) or any(h in rel for h in self._FASTAPI_PATH_HINTS):
+        if "fastapi" in body_hits or "fastapi" in path_hits:
             scores[self.ROLE_CONTROLLER] += 0.9; evidence[self.ROLE_CONTROLLER].append("APIRouter/Depends/path hint")
 
         # === FastAPI: Config (앱 부트스트랩/실행) ===
-        if "fastapi(" in body or "uvicorn.run" in body:
+        if "fastapi_app" in body_hits:
             scores[self.ROLE_CONFIG] += 0.9; evidence[self.ROLE_CONFIG].append("FastAPI app or uvicorn.run")
 
         # === Django: Entity / Controller 등 (기존 규칙) ===
-        if "model" in bases or "/models/" in rel or rel.endswith("/models.py"):
+        if "model" in bases or "models" in path_hits or rel.endswith("/models.py"):
             scores[self.ROLE_ENTITY] += 1.0; evidence[self.ROLE_ENTITY].append("Django model path/base")
-        if any(b in self._DJANGO_VIEW_BASES for b in bases) or "/views/" in rel or rel.endswith("/views.py"):
+        if not self._DJANGO_VIEW_BASES.isdisjoint(bases) or "views" in path_hits or rel.endswith("/views.py"):
             scores[self.ROLE_CONTROLLER] += 1.0; evidence[self.ROLE_CONTROLLER].append("Django class-based view or views.py")
-        controller_decorators = {"@app.route", "@blueprint.route"} | {f"@{d}" for d in self._DJANGO_VIEW_DECOS}
         for fn in functions:
-            decos = [str(d).lower() for d in fn.get("decorators", [])]
-            if any(mark in f"@{deco}" for deco in decos for mark in controller_decorators):
+            if self._DECORATOR_MATCHER.match_any(f"@{str(d).lower()}" for d in fn.get("decorators", [])):
                 scores[self.ROLE_CONTROLLER] += 0.95; evidence[self.ROLE_CONTROLLER].append("Routing/view decorator in method")
                 break
 
         # === DAO: 공통 힌트 ===
-        if any(h in body for h in self._DAO_HINTS_BODY):
+        if "dao" in body_hits:
             scores[self.ROLE_DAO] += 0.7; evidence[self.ROLE_DAO].append("DB/ORM call in body")
-        if any(s in name for s in ("repository", "dao")) or "/repository/" in rel or "/repositories/" in rel or "/dao/" in rel:
+        if "repository" in name or "dao" in name or "dao" in path_hits:
             scores[self.ROLE_DAO] += 0.8; evidence[self.ROLE_DAO].append("Repository/DAO naming or path")
-        if any(h in body for h in self._MANAGER_HINTS):
+        if "manager" in body_hits:
             scores[self.ROLE_DAO] += 0.4; evidence[self.ROLE_DAO].append("Manager/QuerySet hint")
 
         # === SERVICE: 관례적 서비스 디렉토리/이름 ===
-        if "/service/" in rel or "/services/" in rel or name.endswith("service"):
+        if "service" in path_hits or name.endswith("service"):
             scores[self.ROLE_SERVICE_IMPL] += 0.7; evidence[self.ROLE_SERVICE_IMPL].append("Service naming/path")
 
         # === EXCEPTION/UTIL 보조 규칙 ===
@@ -152,7 +183,7 @@ class StructureMapper:
             scores[self.ROLE_EXCEPTION] += 0.8; evidence[self.ROLE_EXCEPTION].append("Exception naming/base")
         if name.endswith("config"):
             scores[self.ROLE_CONFIG] += 0.5; evidence[self.ROLE_CONFIG].append("Name ends with 'Config'")
-        if name.endswith("util") or "/utils/" in rel or "/helpers/" in rel:
+        if name.endswith("util") or "util" in path_hits:
             scores[self.ROLE_UTIL] += 0.5; evidence[self.ROLE_UTIL].append("Utility naming/path")
 
         if not any(s > 0 for s in scores.values()):
@@ -170,7 +201,7 @@ class StructureMapper:
         }
         evidence = {role: [] for role in scores}
 
-        annotations = [ann.lower() for ann in class_info.get("annotations", [])]
+        annotations = {ann.lower() for ann in class_info.get("annotations", [])}
         name = (class_info.get("name") or "").lower()
         declaration_type = class_info.get("type", "")
         is_interface = (declaration_type == "InterfaceDeclaration")
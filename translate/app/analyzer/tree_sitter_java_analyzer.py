@@ -0,0 +1,309 @@
+# translate/app/analyzer/tree_sitter_java_analyzer.py
+# 역할: tree-sitter-java 기반 Java 파서 백엔드 (JavaAnalyzer와 같은 인터페이스/레코드 스키마)
+#   - C 파서라 javalang보다 빠르고 records / text blocks / var 람다 / switch 식 등 최신 문법도 파싱한다
+#   - tree-sitter는 오류가 있어도 트리를 만들지만, 오류 노드가 있으면 javalang과 같이 is_parsed=False로 두고
+#     호출 측(parse_java_file)이 java_lenient_fallback으로 넘긴다 → 두 백엔드의 폴백 기준이 같다
+#   - 클래스 레코드(name/type/description/annotations/spans)는 javalang 백엔드와 같은 규칙으로 만든다
+#   - 함수 레코드의 calls는 javalang MethodInvocation과 같은 qualifier/순서 규칙
+#     (이름 체인 수신자만 qualifier, super.x()/생성자 호출 제외, 체인은 앞 호출 → 뒤 호출 → 인자 순)
+#     full_body/body/line_range는 선언 전체/메서드 블록 기준 (javalang은 마지막 position 토큰에서 잘림)
+#   - tree-sitter, tree-sitter-java는 선택 설치 (없으면 AVAILABLE=False, java_backends가 javalang으로 대체)
+
+import re
+import logging
+
+from translate.app.analyzer.java_analyzer import first_javadoc, call_record
+
+try:
+    import tree_sitter
+    import tree_sitter_java
+except ImportError:
+    tree_sitter = tree_sitter_java = None
+
+logger = logging.getLogger(__name__)
+
+AVAILABLE = tree_sitter is not None
+_language = None
+
+CLASS_TYPES = {
+    "class_declaration": "ClassDeclaration",
+    "interface_declaration": "InterfaceDeclaration",
+    "record_declaration": "RecordDeclaration",
+}
+TYPE_DECLARATIONS = set(CLASS_TYPES) | {"enum_declaration", "annotation_type_declaration"}
+MEMBER_TYPES = ("method_declaration",)
+CONSTRUCTOR_TYPES = ("constructor_declaration", "compact_constructor_declaration")
+_CHAIN_TYPES = ("method_invocation", "field_access", "array_access")
+_KEYWORDS = ("class", "interface", "record")
+_WS_RE = re.compile(r"\s+")
+
+
+def _parser():
+    global _language
+    if _language is None:
+        _language = tree_sitter.Language(tree_sitter_java.language())
+    return tree_sitter.Parser(_language)
+
+
+def _is_name_chain(node) -> bool:
+    """identifier 또는 identifier.identifier... (javalang이 qualifier 문자열로 합치는 수신자)"""
+    while node.type == "field_access":
+        if node.child_by_field_name("field").type != "identifier":
+            return False
+        node = node.child_by_field_name("object")
+    return node.type == "identifier"
+
+
+def _unroll(node):
+    """a.b().c[0].d() → (head 호출 a.b, [c 접근, [0], d 호출]) — javalang의 Primary + selectors 구조"""
+    links = []
+    while node.type in _CHAIN_TYPES or node.type == "parenthesized_expression":
+        if node.type == "parenthesized_expression":
+            # (a.b()).c(): javalang은 괄호 안 식에 selectors를 이어 붙인다 (캐스트 등 다른 식이면 괄호가 head)
+            inner = node.named_children[0] if node.named_child_count == 1 else None
+            if inner is None or inner.type not in _CHAIN_TYPES or not links:
+                break
+            node = inner
+            continue
+        if node.type == "array_access":
+            links.append(node)
+            node = node.child_by_field_name("array")
+            continue
+        obj = node.child_by_field_name("object")
+        if obj is None or obj.type == "super" or _is_name_chain(obj if node.type == "method_invocation" else node):
+            break
+        links.append(node)
+        node = obj
+    links.reverse()
+    return node, links
+
+
+class TreeSitterJavaAnalyzer:
+    def __init__(self, file_path: str, query_bank: dict = None):
+        self.file_path = file_path
+        self.query_bank = query_bank or {}
+        self.tree = None
+        self.is_parsed = False
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                self.code = f.read()
+                self.lines = self.code.splitlines()
+            self.data = self.code.encode("utf-8")
+            self.tree = _parser().parse(self.data)
+            if self.tree.root_node.has_error:
+                raise SyntaxError(f"tree-sitter error node at {self._first_error()}")
+            self.is_parsed = True
+        except Exception as e:
+            logger.warning(f"[Java Parse Warning] {self.file_path} :: {e}")
+            self.lines = []
+
+    def _first_error(self):
+        stack = [self.tree.root_node]
+        while stack:
+            node = stack.pop()
+            if node.type == "ERROR" or node.is_missing:
+                return f"line {node.start_point[0] + 1}"
+            stack.extend(reversed([c for c in node.children if c.has_error]))
+        return "?"
+
+    # ---- offset/텍스트: tree-sitter는 utf-8 byte offset, spans는 문자 offset ----
+    def _char(self, byte_offset: int) -> int:
+        if len(self.data) == len(self.code):
+            return byte_offset
+        return len(self.data[:byte_offset].decode("utf-8"))
+
+    def _text(self, start_byte: int, end_byte: int) -> str:
+        return self.data[start_byte:end_byte].decode("utf-8")
+
+    @staticmethod
+    def _name(node) -> str:
+        name = node.child_by_field_name("name")
+        return name.text.decode("utf-8") if name is not None else ""
+
+    @staticmethod
+    def _modifiers(node):
+        return next((c for c in node.children if c.type == "modifiers"), None)
+
+    def _annotations(self, node):
+        modifiers = self._modifiers(node)
+        if modifiers is None:
+            return []
+        return [c for c in modifiers.children if c.type in ("annotation", "marker_annotation")]
+
+    def _type_nodes(self):
+        """모든 타입 선언 (pre-order, 중첩/지역 클래스 포함) — javalang _node_index의 types와 같은 순서"""
+        if not hasattr(self, "_types"):
+            types, stack = [], [self.tree.root_node]
+            while stack:
+                node = stack.pop()
+                if node.type in TYPE_DECLARATIONS:
+                    types.append(node)
+                stack.extend(reversed(node.named_children))
+            self._types = types
+        return self._types
+
+    # ---- 클래스 ----
+    def _keyword_line(self, node) -> int:
+        keyword = next((c for c in node.children if c.type in _KEYWORDS), node)
+        return keyword.start_point[0] + 1
+
+    def _description(self, node) -> str:
+        if not hasattr(self, "_javadoc"):
+            self._javadoc = first_javadoc(self.lines)
+        if self._javadoc is None or self._javadoc[0] > self._keyword_line(node) - 2:
+            return ""
+        return self._javadoc[1]
+
+    def _type_start(self, node) -> int:
+        """javadoc(공백만 사이에 둔 바로 앞 /** */)/어노테이션/제어자부터"""
+        start = node.start_byte
+        prev = node.prev_sibling
+        if prev is not None and prev.type == "block_comment" and prev.text.startswith(b"/**") \
+                and not self.data[prev.end_byte:start].strip():
+            start = prev.start_byte
+        return start
+
+    def _top_level(self):
+        return [c for c in self.tree.root_node.named_children if c.type in TYPE_DECLARATIONS]
+
+    def _prelude_end(self, top_level) -> int:
+        """첫 최상위 타입 앞의 package/import 문이 끝나는 offset (없으면 0)"""
+        if not hasattr(self, "_prelude"):
+            self._prelude = 0
+            if top_level:
+                first_type = self._type_start(top_level[0])
+                for child in self.tree.root_node.children:
+                    if child.end_byte > first_type:
+                        break
+                    if child.type in ("package_declaration", "import_declaration", ";"):
+                        self._prelude = self._char(child.end_byte)
+        return self._prelude
+
+    def _class_spans(self, node, top_level):
+        if len(top_level) == 1 and top_level[0] == node:
+            return [[0, len(self.code)]]
+        prelude = self._prelude_end(top_level)
+        span = [self._char(self._type_start(node)), self._char(node.end_byte)]
+        return ([[0, prelude]] if prelude else []) + [span]
+
+    def extract_classes(self):
+        """JavaAnalyzer.extract_classes와 같은 스키마 (spans는 문자 offset)"""
+        if not self.is_parsed: return []
+        classes = []
+        top_level = self._top_level()
+        for node in self._type_nodes():
+            if node.type not in CLASS_TYPES:
+                continue
+            classes.append({
+                "name": self._name(node),
+                "type": CLASS_TYPES[node.type],
+                "description": self._description(node),
+                "annotations": [self._name(ann) for ann in self._annotations(node)],
+                "spans": self._class_spans(node, top_level),
+            })
+        return classes
+
+    # ---- 메서드 ----
+    def _members(self, class_node):
+        """메서드 → 생성자 순 (javalang의 methods + constructors)"""
+        body = class_node.child_by_field_name("body")
+        if body is None:
+            return []
+        children = body.named_children
+        return [c for c in children if c.type in MEMBER_TYPES] + [c for c in children if c.type in CONSTRUCTOR_TYPES]
+
+    def _query_annotation_sql(self, ann):
+        """@Query("...") / @Query(value = "...")의 리터럴 값"""
+        args = ann.child_by_field_name("arguments")
+        if args is None:
+            return None
+        for arg in args.named_children:
+            if arg.type == "element_value_pair":
+                key, value = arg.child_by_field_name("key"), arg.child_by_field_name("value")
+                if key is not None and key.text == b"value" and value is not None and value.type.endswith("literal"):
+                    return value.text.decode("utf-8").strip('"').strip()
+            elif arg.type.endswith("literal"):
+                return arg.text.decode("utf-8").strip('"').strip()
+        return None
+
+    def extract_calls(self, method_node):
+        """메서드 서브트리의 method_invocation → 호출 레코드 (javalang 백엔드와 같은 target 규칙/순서)"""
+        calls = []
+        stack = [("visit", method_node)]
+        while stack:
+            action, node = stack.pop()
+            if action == "emit":
+                obj = node.child_by_field_name("object")
+                qualifier = _WS_RE.sub("", obj.text.decode("utf-8")) if obj is not None and _is_name_chain(obj) else None
+                calls.append(call_record(qualifier, self._name(node)))
+                continue
+            if action == "children" or node.type not in _CHAIN_TYPES:
+                children = node.named_children
+                if node.type == "do_statement":
+                    # javalang DoStatement는 condition → body 순
+                    children = sorted(children, key=lambda c: c != node.child_by_field_name("condition"))
+                stack.extend(("visit", c) for c in reversed(children))
+                continue
+
+            head, links = _unroll(node)
+            sequence = []
+            is_call = head.type == "method_invocation"
+            if is_call and getattr(head.child_by_field_name("object"), "type", None) != "super":
+                sequence.append(("emit", head))
+            for link in links:
+                if link.type == "method_invocation":
+                    sequence.append(("emit", link))
+                    sequence.append(("visit", link.child_by_field_name("arguments")))
+                elif link.type == "array_access":
+                    sequence.append(("visit", link.child_by_field_name("index")))
+            if is_call:
+                sequence.append(("visit", head.child_by_field_name("arguments")))
+            else:
+                sequence.append(("children", head))
+            stack.extend(reversed([item for item in sequence if item[1] is not None]))
+        return calls
+
+    def _start_after_modifiers(self, node):
+        """javalang의 메서드 position: 제어자/어노테이션 다음 첫 토큰 (타입 파라미터/반환 타입/생성자 이름)"""
+        children = node.children
+        for i, child in enumerate(children):
+            if child.type == "modifiers":
+                return children[i + 1] if i + 1 < len(children) else child
+        return node
+
+    def extract_functions(self):
+        if not self.is_parsed: return []
+        functions = []
+        for class_node in self._type_nodes():
+            if class_node.type not in CLASS_TYPES:
+                continue
+            class_name = self._name(class_node)
+            for node in self._members(class_node):
+                is_constructor = node.type in CONSTRUCTOR_TYPES
+                name = class_name if is_constructor else self._name(node)
+                annotations = self._annotations(node)
+
+                # SQL 매핑 (XML or @Query)
+                sql_query = None
+                query_id_convention = f"{class_name[0].lower() + class_name[1:]}.{name}"
+                if query_id_convention in self.query_bank:
+                    sql_query = self.query_bank[query_id_convention]
+                if not sql_query:
+                    for ann in annotations:
+                        if self._name(ann) == "Query":
+                            sql_query = self._query_annotation_sql(ann) or sql_query
+
+                start = self._start_after_modifiers(node)
+                body = node.child_by_field_name("body")
+                functions.append({
+                    "name": name,
+                    "class": class_name,
+                    "calls": self.extract_calls(node),
+                    "sql_query": sql_query,
+                    "body": self._text(body.start_byte, body.end_byte) if body is not None else "",
+                    "full_body": self._text(start.start_byte, node.end_byte),
+                    "annotations": [self._name(ann) for ann in annotations],
+                    "line_range": f"L{start.start_point[0] + 1}-L{node.end_point[0] + 1}",
+                })
+        return functions
@@ -1,39 +1,155 @@
+# translate/app/analyzer/xml_mapper_analyzer.py
+# 역할: MyBatis(<mapper>)/iBatis(<sqlMap>) XML 매퍼 → 구문 ID("namespace.id")별 SQL
+#   - parse_mapper(): ET.iterparse로 한 번 훑으면서 구문(select/insert/update/delete/statement/procedure)과 <sql> 조각만 모으고
+#     끝난 최상위 요소는 바로 버린다 → 매퍼 크기와 무관하게 구문 하나 분량만 메모리에 올라온다
+#     본문은 [텍스트, {"include": refid, "namespace": ns}, ...] 조각 목록(parts, 공백 정리) — <include>는 아직 펼치지 않는다
+#   - bind_queries(): 모든 매퍼의 <sql> 조각을 모은 뒤 <include>를 펼쳐 쿼리 뱅크 {namespace.id: SQL}를 만든다
+#     (다른 매퍼의 조각 참조 포함, 없는 조각/순환 참조는 빈 문자열)
+#     → 매퍼 파싱은 파일 단위로 독립적이라 Java 파싱과 동시에 돌리고, 결합은 둘 다 끝난 뒤 한 번
+#   - 동적 SQL 태그(<if>, <where>, <foreach>, <isNotEmpty> ...) 안의 텍스트는 조건 평가 없이 이어 붙이고, <selectKey>는 뺀다
+#   - SQL 공백은 한 칸으로 정리, namespace가 없는 매퍼는 건너뛴다
+#   - sql_bindings(): 쿼리 뱅크 ↔ Java 클래스 결합 (namespace 규칙 + 본문 문자열 리터럴 "namespace.id")
+
+import re
 import xml.etree.ElementTree as ET
 
+_STATEMENT_TAGS = {'select', 'insert', 'update', 'delete', 'statement', 'procedure'}
+_SKIP_TAGS = {'selectKey'}
+_MAPPER_SUFFIXES = ('Mapper', 'DAO', 'Dao')
+_QUERY_ID_LITERAL_RE = re.compile(r'"([A-Za-z_$][\w$]*(?:\.[\w$]+)+)"')
+
+
+def _local(tag) -> str:
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _parts(elem, namespace: str, out: list) -> list:
+    if elem.text:
+        out.append(elem.text)
+    for child in elem:
+        tag = _local(child.tag)
+        if tag == 'include':
+            refid = child.get('refid')
+            if refid:
+                out.append({"include": refid, "namespace": namespace})
+        elif tag not in _SKIP_TAGS:
+            _parts(child, namespace, out)
+        if child.tail:
+            out.append(child.tail)
+    return out
+
+
+def _compact(parts: list) -> list:
+    """이어진 텍스트 조각을 하나로 합치고 공백을 정리 (결합 결과는 같고 캐시/메모리에 남는 조각 수만 줄어든다)"""
+    out, texts = [], []
+    for part in parts:
+        if isinstance(part, str):
+            texts.append(part)
+            continue
+        if texts:
+            out.append(' '.join(' '.join(texts).split()))
+            texts = []
+        out.append(part)
+    if texts:
+        out.append(' '.join(' '.join(texts).split()))
+    return [part for part in out if part]
+
+
+def parse_mapper(file_path: str) -> dict:
+    """매퍼 1개 → {namespace, statements: {id: parts}, fragments: {id: parts}} (id는 namespace.id)"""
+    namespace, statements, fragments = '', {}, {}
+    root, depth = None, 0
+    for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 1:
+                root, namespace = elem, elem.get('namespace', '')
+            continue
+        depth -= 1
+        if depth != 1:
+            continue
+        # 최상위 요소 하나가 끝날 때마다 처리하고 root에서 떼어낸다
+        tag, query_id = _local(elem.tag), elem.get('id')
+        if namespace and query_id and (tag in _STATEMENT_TAGS or tag == 'sql'):
+            target = fragments if tag == 'sql' else statements
+            target[f"{namespace}.{query_id}"] = _compact(_parts(elem, namespace, []))
+        del root[:]
+    return {"namespace": namespace, "statements": statements, "fragments": fragments}
+
+
+def bind_queries(mappers) -> dict:
+    """parse_mapper 결과들(None은 파싱 실패) → {namespace.id: SQL}. 같은 ID는 뒤에 나온 매퍼가 덮는다"""
+    mappers = [m for m in mappers if m]
+    fragments = {}
+    for mapper in mappers:
+        fragments.update(mapper["fragments"])
+
+    expanded = {}
+
+    def expand(parts, active) -> str:
+        texts = []
+        for part in parts:
+            if isinstance(part, str):
+                texts.append(part)
+                continue
+            local = f"{part['namespace']}.{part['include']}"
+            ref = local if local in fragments else part['include']
+            if ref in active or ref not in fragments:
+                continue
+            if ref not in expanded:
+                expanded[ref] = expand(fragments[ref], active | {ref})
+            texts.append(expanded[ref])
+        return ' '.join(texts)
+
+    query_bank = {}
+    for mapper in mappers:
+        for query_id, parts in mapper["statements"].items():
+            query_bank[query_id] = ' '.join(expand(parts, frozenset()).split())
+    return query_bank
+
+
+def _lower_first(name: str) -> str:
+    return name[:1].lower() + name[1:]
+
+
+def sql_bindings(classes: list, query_bank: dict, body_of) -> list:
+    """
+    클래스별로 쓰는 매퍼 구문 [{class, rel_path, queries: {namespace.id: SQL}}] (구문이 하나도 없으면 빠짐)
+      - namespace 규칙 (DAO 역할이거나 이름이 *Mapper/*DAO/*Dao인 클래스만):
+        마지막 이름이 클래스 이름(MyBatis 매퍼 인터페이스) 또는 소문자로 시작하는 클래스 이름(eGov DAO: boardDAO)
+      - 본문에 "namespace.id" 문자열 리터럴로 나오는 구문 (EgovAbstractDAO.select("boardDAO.selectBoard", vo) 등)
+    body_of(cls)는 클래스 본문 (SourceTable.body)
+    """
+    by_namespace = {}
+    for query_id in query_bank:
+        namespace = query_id.rpartition('.')[0]
+        by_namespace.setdefault(namespace.rpartition('.')[2], []).append(query_id)
+
+    bindings = []
+    for cls in classes:
+        name = cls.get('name') or ''
+        ids = []
+        if name and ((cls.get('role') or {}).get('type') == 'DAO' or name.endswith(_MAPPER_SUFFIXES)):
+            ids = by_namespace.get(name, []) + by_namespace.get(_lower_first(name), [])
+        ids += [m for m in _QUERY_ID_LITERAL_RE.findall(body_of(cls) or '') if m in query_bank]
+        if ids:
+            bindings.append({"class": name, "rel_path": (cls.get('source_info') or {}).get('rel_path'),
+                             "queries": {query_id: query_bank[query_id] for query_id in dict.fromkeys(ids)}})
+    return bindings
+
+
 class XmlMapperAnalyzer:
     """
     MyBatis/iBatis의 XML 매퍼 파일을 파싱하여
-    쿼리 ID와 SQL 구문을 추출합니다.
+    쿼리 ID와 SQL 구문을 추출합니다. (같은 파일 안의 <include>까지 펼침 — 여러 매퍼는 bind_queries)
     """
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.queries = {}
         try:
-            tree = ET.parse(self.file_path)
-            self.root = tree.getroot()
-            self._extract_queries()
+            self.mapper = parse_mapper(self.file_path)
         except Exception as e:
             print(f"⚠️ [XML Parse Warning] Failed to parse file: {self.file_path}\n    Reason: {e}")
-            self.root = None
-
-    def _extract_queries(self):
-        if self.root is None:
-            return
-
-        namespace = self.root.get('namespace', '')
-        if not namespace:
-            return
-
-        query_tags = ['select', 'insert', 'update', 'delete']
-        for tag in query_tags:
-            for query in self.root.findall(tag):
-                query_id = query.get('id')
-                if query_id:
-                    # 정규화된 쿼리 ID (e.g., "sampleDAO.selectSample")
-                    full_query_id = f"{namespace}.{query_id}"
-                    # SQL 구문에서 불필요한 공백과 줄바꿈 정리
-                    sql_text = ' '.join(query.text.strip().split()) if query.text else ""
-                    self.queries[full_query_id] = sql_text
+            self.mapper = None
 
     def get_queries(self) -> dict:
-        return self.queries
\ No newline at end of file
+        return bind_queries([self.mapper])
@@ -0,0 +1,173 @@
+# translate/app/codec.py
+# 역할: 도메인 dataclass(ToTranslator) <-> 메시지 bytes 변환
+#   - JSON 백엔드: msgspec > orjson > json 순으로 설치된 것을 사용 (MESSAGE_CODEC=msgspec|orjson|json 으로 고정 가능)
+#   - encode(): asdict(깊은 복사) 없이 dataclass를 바로 UTF-8 JSON bytes로 (ensure_ascii=False와 같은 출력)
+#   - decode()/convert(): dict를 거쳐 필드별 타입 검증 후 dataclass 인스턴스로.
+#     키 이름은 '_' 제거 + 소문자로 비교하므로 user_id/userId, file_path/filePath, input_egov_frame_ver/inputeGovFrameVer 모두 허용
+#     int 필드의 숫자 문자열("42")은 int로 변환 (백엔드가 ID를 문자열로 보내는 경우)
+#   - 필수 필드 누락/타입 불일치는 DecodeError(ValueError) → retry 없이 DLQ 대상
+
+import os
+import re
+import json
+import types
+import typing
+import dataclasses
+
+_BACKEND = os.environ.get('MESSAGE_CODEC', 'auto').lower()
+
+msgspec = orjson = None
+if _BACKEND in ('auto', 'msgspec'):
+    try:
+        import msgspec
+    except ImportError:
+        pass
+if msgspec is None and _BACKEND in ('auto', 'msgspec', 'orjson'):
+    try:
+        import orjson
+    except ImportError:
+        pass
+
+if msgspec is not None:
+    BACKEND = 'msgspec'
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+    dumps = _encoder.encode
+    _loads = _decoder.decode
+    _LOAD_ERRORS = (ValueError, msgspec.DecodeError)
+elif orjson is not None:
+    BACKEND = 'orjson'
+    dumps = orjson.dumps
+    _loads = orjson.loads
+    _LOAD_ERRORS = (ValueError,)
+else:
+    BACKEND = 'json'
+
+    def dumps(obj) -> bytes:
+        if dataclasses.is_dataclass(obj):
+            obj = {f: getattr(obj, f) for f in _plan(type(obj))[1]}
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+    _LOAD_ERRORS = (ValueError,)
+
+
+class DecodeError(ValueError):
+    def __init__(self, message, missing=()):
+        super().__init__(message)
+        self.missing = list(missing)
+
+
+def _norm(name: str) -> str:
+    return name.replace('_', '').lower()
+
+
+def _union_args(tp):
+    origin = typing.get_origin(tp)
+    if origin is typing.Union or (hasattr(types, 'UnionType') and origin is types.UnionType):
+        return typing.get_args(tp)
+    return None
+
+
+_plans = {}
+
+
+def _plan(cls):
+    """cls별 (정규화 키 -> (필드명, 허용 타입, None 허용, 필수 여부)), 필드명 순서, 실제 키 -> spec 캐시"""
+    plan = _plans.get(cls)
+    if plan is None:
+        hints = typing.get_type_hints(cls)
+        fields, order = {}, []
+        for f in dataclasses.fields(cls):
+            tp = hints.get(f.name, typing.Any)
+            args = _union_args(tp)
+            nullable = args is not None and type(None) in args
+            if args is not None:
+                args = tuple(a for a in args if a is not type(None))
+                tp = args[0] if len(args) == 1 else typing.Any
+            required = f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+            fields[_norm(f.name)] = (f.name, tp, nullable, required)
+            order.append(f.name)
+        plan = _plans[cls] = (fields, tuple(order), {})
+    return plan
+
+
+_ALIAS_CACHE_SIZE = 256
+
+
+def _resolve(fields, aliases, key):
+    try:
+        return aliases[key]
+    except KeyError:
+        spec = fields.get(_norm(key))
+        if len(aliases) < _ALIAS_CACHE_SIZE:
+            aliases[key] = spec
+        return spec
+
+
+_INT_RE = re.compile(r'\s*[-+]?\d+\s*')
+
+
+def _check(cls, name, tp, nullable, value):
+    if value is None:
+        if nullable:
+            return None
+        raise DecodeError(f"{cls.__name__}.{name}: null is not allowed")
+    if not isinstance(tp, type):
+        return value
+    if tp is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if tp is int and isinstance(value, str) and _INT_RE.fullmatch(value):
+        return int(value)
+    if tp is int and isinstance(value, bool) or not isinstance(value, tp):
+        raise DecodeError(f"{cls.__name__}.{name}: expected {tp.__name__}, got {type(value).__name__}")
+    return value
+
+
+def convert(cls, mapping: dict):
+    """dict(snake_case/camelCase 혼용 가능) → 검증된 cls 인스턴스. 정의되지 않은 키는 무시"""
+    if not isinstance(mapping, dict):
+        raise DecodeError(f"{cls.__name__}: expected object, got {type(mapping).__name__}")
+    fields, order, aliases = _plan(cls)
+    kwargs = {}
+    for key, value in mapping.items():
+        spec = aliases[key] if key in aliases else _resolve(fields, aliases, key)
+        if spec is None:
+            continue
+        name, tp, nullable, _ = spec
+        if type(value) is not tp:
+            value = _check(cls, name, tp, nullable, value)
+        kwargs.setdefault(name, value)
+    if len(kwargs) == len(order) and not hasattr(cls, '__post_init__'):
+        # 모든 필드가 채워졌으면 __init__ 인자 처리를 건너뛰고 바로 채운다
+        obj = object.__new__(cls)
+        obj.__dict__.update(kwargs)
+        return obj
+    missing = [name for name, _, _, required in fields.values() if required and name not in kwargs]
+    if missing:
+        raise DecodeError(f"{cls.__name__}: missing fields: {', '.join(missing)}", missing)
+    return cls(**kwargs)
+
+
+def loads(data):
+    try:
+        return _loads(data)
+    except _LOAD_ERRORS as e:
+        raise DecodeError(f"invalid JSON: {e}") from e
+
+
+def decode(data: bytes, cls):
+    return convert(cls, loads(data))
+
+
+def encode(obj) -> bytes:
+    return dumps(obj)
+
+
+def lookup(mapping: dict, name: str, default=None):
+    """이름 표기(snake/camel)와 무관하게 dict 값 조회 (검증 실패 응답 작성 등 부분 정보가 필요할 때)"""
+    target = _norm(name)
+    for key, value in mapping.items():
+        if _norm(key) == target:
+            return value
+    return default
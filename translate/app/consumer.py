@@ -1,10 +1,12 @@
 from dotenv import load_dotenv
 import os
-from confluent_kafka import Consumer, KafkaException
-import json
+from translate.app.transport import create_consumer, TransportError, TopicPartition
 from translate.app.log import Logger
 from translate.app.producer import MessageProducer
-from translate.app.orchestrator import ConversionAgent
+from translate.app.worker import KeyedJobExecutor, OffsetTracker, run_conversion, absolute_input
+from translate.app.retry import RetryRouter
+from translate.app.codec import decode, DecodeError
+from translate.app.domain import ToTranslator
 
 load_dotenv()
 
@@ -15,42 +17,114 @@ class MessageConsumer:
         self.topic = os.environ.get('CONS_TOPIC')
         self.group_id = os.environ.get('GROUP_ID')
         self.auto_offset_reset = os.environ.get('AUTO_OFFSET_RESET')
-        self.consumer = Consumer({
+        self.consumer = create_consumer({
                                     'bootstrap.servers': self.broker,
                                     'group.id': self.group_id, # consumer의 id
-                                    'auto.offset.reset': self.auto_offset_reset  # 처음 실행시 가장 마지막 offset부터
+                                    'auto.offset.reset': self.auto_offset_reset,  # 처음 실행시 가장 마지막 offset부터
+                                    'enable.auto.commit': False  # 작업 완료 후에만 수동 커밋
                                 })
-        self.consumer.subscribe([self.topic])
         self.producer = MessageProducer()
-        self.conversion_agent = ConversionAgent()
+        self.retry = RetryRouter(self.producer, self.logger)
+        self.consumer.subscribe(self.retry.topics(self.topic.split(',')), on_assign=self._on_assign, on_revoke=self._on_revoke)
+
+        max_workers = int(os.environ.get('TRANSLATE_MAX_WORKERS', '2'))
+        self.executor = KeyedJobExecutor(run_conversion,
+                                         max_workers=max_workers,
+                                         max_pending=int(os.environ.get('TRANSLATE_MAX_PENDING', str(max_workers))),
+                                         workdir=os.environ.get('TRANSLATE_WORKDIR', os.path.join(os.getcwd(), 'workers')))
+        self.offsets = OffsetTracker()
+        self.sources = {}  # (topic, partition, offset) -> 원본 메시지 (작업 실패 시 retry 라우팅용)
+        self.paused = False
+
+    def _on_assign(self, consumer, partitions):
+        # 새로 할당된 파티션은 pause 상태가 아니므로 다음 루프에서 다시 판단
+        self.paused = False
+
+    def _on_revoke(self, consumer, partitions):
+        self._commit()
+        self.retry.forget(partitions)
+        for p in partitions:
+            self.offsets.forget(p.topic, p.partition)
 
     def consume(self):
         try:
             print(f"start consume: {self.topic}")
 
             while True:
+                self._complete_jobs()
+                self._apply_backpressure()
+                if not self.paused:
+                    self.retry.release(self.consumer)
+
                 message = self.consumer.poll(1.0)
                 if message is None:
                     continue
                 if message.error():
                     print(f"Kafka error: {message.error()}")
-                else:
+                elif not self.retry.hold(self.consumer, message):
                     self.handle_message(message)
-        except KafkaException as e:
+        except TransportError as e:
             self.logger.error(e)
         finally:
+            self.executor.shutdown(wait=False)
             self.consumer.close()
+            self.producer.close()
+
+    def _apply_backpressure(self):
+        if self.executor.saturated and not self.paused:
+            self.consumer.pause(self.consumer.assignment())
+            self.paused = True
+            self.logger.info(f"worker pool saturated ({self.executor.pending} jobs) → pause partitions")
+        elif self.paused and not self.executor.saturated:
+            self.consumer.resume(self.retry.active(self.consumer.assignment()))
+            self.paused = False
+            self.logger.info(f"worker pool available ({self.executor.pending} jobs) → resume partitions")
+
+    def _complete_jobs(self):
+        finished = self.executor.drain()
+        for (topic, partition, offset), result, error in finished:
+            message = self.sources.pop((topic, partition, offset), None)
+            if error:
+                self.logger.error(f"{topic}[{partition}]@{offset} job failed: {error!r}")
+                if message is not None:
+                    self.retry.route(message, error)
+            else:
+                self.logger.info(f"{topic}[{partition}]@{offset} job finished")
+            self.offsets.done(topic, partition, offset)
+        if finished:
+            self._commit()
+
+    def _commit(self):
+        positions = self.offsets.committable()
+        if not positions:
+            return
+        try:
+            self.consumer.commit(offsets=[TopicPartition(t, p, o) for (t, p), o in positions.items()],
+                                 asynchronous=False)
+        except TransportError as e:
+            self.logger.error(f"offset commit failed: {e}")
 
     def handle_message(self, message):
+        job = (message.topic(), message.partition(), message.offset())
+        self.offsets.track(*job)
         try:
-            request = json.loads(message.value().decode('utf-8'))
+            request = decode(message.value(), ToTranslator)
+            if not request.file_path:  # filePath: null은 orchestrate까지는 통과하지만 변환할 입력이 없음 → DLQ
+                raise DecodeError("ToTranslator: missing fields: file_path", ['file_path'])
+            request.file_path = absolute_input(request.file_path)
 
             self.logger.info(f"{message.topic()} | key: {message.key()} | value: {request}")
-            self.conversion_agent.run(request['user_id'], request['job_id'], request['file_path'])
+            key = message.key() or request.job_id or request.user_id  # jobId: null이면 사용자 단위로 순차 실행
+            self.sources[job] = message
+            self.executor.submit(key, job, request)
 
         except Exception as e:
             self.logger.exception(e)
+            self.sources.pop(job, None)
+            self.retry.route(message, e)
+            self.offsets.done(*job)
+            self._commit()
 
 if __name__ == '__main__':
     consumer = MessageConsumer()
-    consumer.consume()
\ No newline at end of file
+    consumer.consume()
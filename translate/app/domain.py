@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# orchestrate → conversion 토픽 메시지 (orchestrate/app/domain.py의 ToTranslator와 동일해야 함)
+@dataclass
+class ToTranslator:
+    job_id: Optional[int]      # ConversionRequested 시점에는 아직 없을 수 있음 (jobId: null)
+    user_id: int
+    file_path: Optional[str]   # 업로드 전 요청은 filePath: null
+    input_egov_frame_ver: str
+    output_egov_frame_ver: str
+    is_test_code: bool
+    conversion_type: str
@@ -6,7 +6,8 @@ from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import torch
 
 from translate.app.states import ConversionEgovState
-from translate.app.producer import MessageProducer
+from translate.app.analyzer import columnar_store
+from translate.app.progress import ProgressStream
 from translate.app.prompts import controller_template, service_prompt, serviceimpl_prompt, vo_prompt
 from translate.app.utils import _advance_and_cleanup_finished_features, _is_feature_done, _cleanup_current_feature
 from translate.app.egov_evaluation import evaluation
@@ -27,10 +28,11 @@ class ConversionEgovAgent:
         self.tokenizer = AutoTokenizer.from_pretrained("BAAI/bge-reranker-large")
         self.reranker = AutoModelForSequenceClassification.from_pretrained("BAAI/bge-reranker-large")
         self.reranker.eval()
-        self.producer = MessageProducer()
+        self.progress = ProgressStream()
 
-    def init_state(self, user_id, job_id, path='output/java_analysis_results.json'):
+    def init_state(self, user_id, job_id, path='output/java_analysis_results.json', changeset_path=None):
         '''
+        changeset_path(output/changeset.json)를 주면 이전 스냅샷 대비 추가/수정된 feature만 변환 대상으로 담는다.
         [
             {
                 "board": {
@@ -72,31 +74,45 @@ class ConversionEgovAgent:
                     'current_feature_idx': 0 # 현재 처리 중인 기능 인덱스
                 }
 
-        with open(path, encoding='utf-8') as f:
-            data = json.load(f)
-
-            for feature in data:
-                for feature_name, role2code in feature.items():
-                    feature = {
-                        'name': feature_name,
-                        'codes': {'controller': [], 'service': [], 'serviceimpl': [], 'vo': []},
-                        'egov':  {'controller': [], 'service': [], 'serviceimpl': [], 'vo': []},
-                        'report':{
-                            'controller': {'conversion': [], 'generation': []},
-                            'service':    {'conversion': [], 'generation': []},
-                            'serviceimpl':{'conversion': [], 'generation': []},
-                            'vo':         {'conversion': [], 'generation': []},
-                        }
-                    }
-                    for role, codes in role2code.items():
-                        role = 'vo' if role == 'dto' else role  # 기존과 동일한 매핑
-                        feature['codes'].setdefault(role, [])
-                        feature['codes'][role].extend(codes)
-
-                        # state.setdefault(role, [])
-                        # state[role].extend(codes)
-
-                    state['features'].append(feature)
+        only = None
+        if changeset_path and os.path.exists(changeset_path):
+            with open(changeset_path, encoding='utf-8') as f:
+                features = json.load(f).get('features') or {}
+            if features:
+                only = set(features.get('added', [])) | set(features.get('modified', []))
+
+        # 같은 이름의 .arrow(columnar_store)가 있으면 memory-map으로 필요한 feature 구간만 읽고, 없으면 JSON 전체를 읽는다
+        arrow_path = os.path.splitext(path)[0] + '.arrow'
+        if columnar_store.AVAILABLE and os.path.exists(arrow_path):
+            entries = columnar_store.read_features(arrow_path, only)
+        else:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            # 이전 업로드와 같은 feature는 변환 생략
+            entries = [(feature_name, role2code) for feature in data for feature_name, role2code in feature.items()
+                       if only is None or feature_name in only]
+
+        for feature_name, role2code in entries:
+            feature = {
+                'name': feature_name,
+                'codes': {'controller': [], 'service': [], 'serviceimpl': [], 'vo': []},
+                'egov':  {'controller': [], 'service': [], 'serviceimpl': [], 'vo': []},
+                'report':{
+                    'controller': {'conversion': [], 'generation': []},
+                    'service':    {'conversion': [], 'generation': []},
+                    'serviceimpl':{'conversion': [], 'generation': []},
+                    'vo':         {'conversion': [], 'generation': []},
+                }
+            }
+            for role, codes in role2code.items():
+                role = 'vo' if role == 'dto' else role  # 기존과 동일한 매핑
+                feature['codes'].setdefault(role, [])
+                feature['codes'][role].extend(codes)
+
+                # state.setdefault(role, [])
+                # state[role].extend(codes)
+
+            state['features'].append(feature)
                                 
         return state
 
@@ -241,9 +257,8 @@ class ConversionEgovAgent:
         if current_feature_idx < len(state.get('features', [])) and _is_feature_done(state['features'][current_feature_idx]):
             _cleanup_current_feature(state) 
 
-        self.producer.send_message(topic='agent-res', 
-                                    message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
-                                    headers=[('AGENT', 'EGOV')])
+        self.progress.update(message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
+                             agent='EGOV')
         
         return state
     
@@ -288,9 +303,8 @@ class ConversionEgovAgent:
         if current_feature_idx < len(state.get('features', [])) and _is_feature_done(state['features'][current_feature_idx]):
             _cleanup_current_feature(state) 
 
-        self.producer.send_message(topic='agent-res', 
-                                    message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
-                                    headers=[('AGENT', 'EGOV')])
+        self.progress.update(message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
+                             agent='EGOV')
         
         return state
     
@@ -322,9 +336,8 @@ class ConversionEgovAgent:
         if current_feature_idx < len(state.get('features', [])) and _is_feature_done(state['features'][current_feature_idx]):
             _cleanup_current_feature(state) 
 
-        self.producer.send_message(topic='agent-res', 
-                                    message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
-                                    headers=[('AGENT', 'EGOV')])
+        self.progress.update(message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
+                             agent='EGOV')
         
         return state
     
@@ -356,16 +369,14 @@ class ConversionEgovAgent:
         if current_feature_idx < len(state.get('features', [])) and _is_feature_done(state['features'][current_feature_idx]):
             _cleanup_current_feature(state) 
 
-        self.producer.send_message(topic='agent-res', 
-                                    message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
-                                    headers=[('AGENT', 'EGOV')])
+        self.progress.update(message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크의 {role} 계층 코드 변환이 완료되었습니다."},
+                             agent='EGOV')
         
         return state
     
     def evaluate_egovcode(self, state):
-        self.producer.send_message(topic='agent-res', 
-                                    message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크 변환 결과 검증을 시작합니다."},
-                                    headers=[('AGENT', 'EGOV')])
+        self.progress.update(message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크 변환 결과 검증을 시작합니다."},
+                             agent='EGOV')
         for k in ['controller_egov', 'service_egov', 'serviceimpl_egov', 'vo_egov']:
             for i, code in enumerate(state.get(k, []) or []):
                 if code:
@@ -374,9 +385,8 @@ class ConversionEgovAgent:
                     role = k.split('_')[0]
                     state[f"{role}_report"]['evaluation'].append(result)
 
-        self.producer.send_message(topic='agent-res', 
-                                    message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크 변환 결과 검증이 완료되었습니다."},
-                                    headers=[('AGENT', 'EGOV')])
+        self.progress.update(message={'userId': state['user_id'], 'jobId': state['job_id'], 'status': 'SUCCESS', 'description': f"전자정부 표준 프레임워크 변환 결과 검증이 완료되었습니다."},
+                             agent='EGOV')
         return state
     
     def build_graph(self):
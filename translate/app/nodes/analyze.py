@@ -1,22 +1,24 @@
 # app/nodes/analyze.py
-import os, re, json, logging, hashlib
+import os, re, json, time, logging, hashlib
+from concurrent.futures import ThreadPoolExecutor
 from translate.app.states import State
-from translate.app.analyzer.python_analyzer import PythonAnalyzer
-from translate.app.analyzer.java_analyzer import JavaAnalyzer
-from translate.app.analyzer.xml_mapper_analyzer import XmlMapperAnalyzer
 from translate.app.analyzer.structure_mapper import StructureMapper
-from translate.app.analyzer.external_usage_detector import ExternalUsageDetector
-from translate.app.analyzer.java_lenient_fallback import extract_classes_lenient_from_text
-from translate.app.analyzer.python_lenient_fallback import extract_outline_from_text
+from translate.app.analyzer.parallel_analyzer import analyze_files, parse_python_file, parse_java_file, parse_xml_mapper
+from translate.app.analyzer.parse_cache import open_parse_cache
+from translate.app.analyzer.java_backends import resolve_backend
+from translate.app.analyzer.project_manifest import digests
+from translate.app.analyzer.source_table import SourceTable, span_key
+from translate.app.analyzer.snapshot import compatible, reusable_records, feature_changes, save_snapshot
+from translate.app.analyzer.jsonl_store import SortedJsonlWriter, iter_jsonl
+from translate.app.analyzer import columnar_store
+from translate.app.analyzer.call_graph import ProjectGraph
+from translate.app.analyzer import feature_clusters
+from translate.app.analyzer.xml_mapper_analyzer import bind_queries, sql_bindings
 
 
 logger = logging.getLogger(__name__)
 
-def _rel_to_module(rel_path: str) -> str:
-    p = (rel_path or "").replace("\\", "/")
-    if p.endswith(".py"): p = p[:-3]
-    if p.endswith("__init__"): p = p[:-9]
-    return ".".join([seg for seg in p.split("/") if seg])
+ANALYZE_BATCH_FILES = int(os.environ.get('ANALYZE_BATCH_FILES', '256'))  # 한 번에 파싱 결과를 들고 있는 파일 수
 
 def _body_hash(obj: dict) -> str:
     body = obj.get("body")
@@ -31,152 +33,247 @@ def _skip(path: str) -> bool:
     p = (path or "").replace("\\", "/").lower()
     return any(s in p for s in IGNORE_SUBSTR)
 
+_FEATURE_RE = re.compile(
+    r'^(.*?)(Controller|Service|ServiceImpl|Repository|DAO|VO|Dto|Entity|Config|Exception|Util|Filter|Jwt|Impl|Tests|Test)$',
+    re.IGNORECASE
+)
+
+def _feature_of(class_name: str) -> str:
+    match = _FEATURE_RE.search(class_name)
+    feature = "unknown"
+    if match and match.group(1):
+        feature_candidate = re.sub(r'^(Res|Req)', '', match.group(1), flags=re.IGNORECASE)
+        feature = feature_candidate.lower() if feature_candidate else class_name.lower()
+    elif not match:
+        feature = class_name.lower()
+    if class_name.endswith("Application"):
+        feature = "app"
+    return feature
+
+def _group_features(classes: list, graph: ProjectGraph = None) -> dict:
+    """{feature: [클래스...]} — 의존 관계 clustering(feature_clusters, graph는 그 클래스들의 호출 그래프), FEATURE_CLUSTERING=name이면 이름 접미사만"""
+    if feature_clusters.enabled():
+        return feature_clusters.cluster_classes(classes, _feature_of, graph)
+    classes_by_feature = {}
+    for cls in classes:
+        classes_by_feature.setdefault(_feature_of(cls.get("name", "")), []).append(cls)
+    return classes_by_feature
+
+def _manifest_rel(source_info: dict) -> str:
+    return (source_info.get("rel_path") or "").replace(os.sep, "/")
+
+def _reuse(state: State, part: str, base_zip_name: str) -> dict:
+    """이전 스냅샷에서 내용이 같은 파일의 레코드 {rel_path: [...]} (스냅샷이 없거나 분석기가 바뀌었으면 빈 dict)"""
+    baseline, changeset = state.get('baseline'), state.get('changeset')
+    if not changeset or not compatible(baseline):
+        return {}
+    return reusable_records(baseline, part, changeset['files']['unchanged'], base_zip_name)
+
+def _write_changeset(state: State, output_dir: str):
+    """output/changeset.json (egov 변환이 이것으로 unchanged feature를 건너뛴다). changeset이 없으면 이전 작업의 파일을 지우고 None"""
+    output_file = os.path.join(output_dir, "changeset.json")
+    if not state.get('changeset'):
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        return None
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(state['changeset'], f, ensure_ascii=False, indent=2)
+    return output_file
+
+def _class_sort_key(c: dict) -> tuple:
+    return ((c.get("source_info") or {}).get("rel_path") or "", c.get("name") or "")
+
+def _function_sort_key(f: dict) -> tuple:
+    return ((f.get("source_info") or {}).get("rel_path") or "", f.get("class") or "", f.get("name") or "", f.get("line_range") or "")
+
+def _batches(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 def analyze_python(state: State) -> State:
     logger.info("Executing node: analyze_python")
-    all_classes, all_functions = [], []
     mapper = StructureMapper()
     base_zip_name = os.path.basename(state.get('input_path', ''))
     extract_dir = state.get('extract_dir')
 
+    tasks = []
     for file_path, lang in state.get('code_files', []):
         if lang != 'python' or _skip(file_path):
             continue
 
         rel_path = os.path.relpath(file_path, extract_dir)
         source_info = {"zip_file": base_zip_name, "rel_path": rel_path, "language": lang}
+        tasks.append((file_path, source_info))
 
-        analyzer = PythonAnalyzer(file_path)
-        if analyzer.is_parsed:
-            py_classes = analyzer.extract_classes()
-            py_funcs = analyzer.extract_functions()
-            code_text = analyzer.code
-        else:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                code_text = f.read()
-            py_classes, py_funcs = extract_outline_from_text(code_text)
-
-        ext_detector = ExternalUsageDetector(code_text)
-        ext_tokens = ext_detector.detect()
-        if isinstance(ext_tokens, (list, tuple, set)):
-            ext_tokens = set(map(str, ext_tokens))
-        else:
-            ext_tokens = None
-
-
-        # 함수
-        for func in py_funcs:
-            func['source_info'] = source_info
-            if ext_tokens is not None:
-                call_targets = {c.get("target") for c in (func.get("calls") or []) if c.get("target")}
-                func['external_calls'] = sorted(call_targets & ext_tokens)
-            else:
-                body = func.get('body', '')
-                func['external_calls'] = [t for t in (ext_detector.detect() or []) if isinstance(t, str) and t in body]
-            all_functions.append(func)
-
-        # 클래스
-        for cls in py_classes:
-            cls['source_info'] = source_info
-            all_classes.append(cls)
-
-    # 역할 추론
-    for cls in all_classes:
-        class_methods = [f for f in all_functions if f.get('class') == cls.get('name') and
-                         (f.get('source_info') or {}).get('rel_path') == (cls.get('source_info') or {}).get('rel_path')]
-        cls['role'] = mapper.infer_class_role({**cls, "functions": class_methods})
-    for func in all_functions:
-        if not func.get('class'):
-            func['role'] = mapper.infer_standalone_function_role(func)
-
-    # (module, class) 인덱스 (내부용)
-    class_index = {}
-    for c in all_classes:
-        rel = (c.get("source_info") or {}).get("rel_path")
-        mod = _rel_to_module(rel or "")
-        key_rel = (rel, c.get("name")); key_mod = (mod, c.get("name"))
-        class_index[key_rel] = c; class_index[key_mod] = c
-
-    # 중복 제거 (스키마 불변)
-    seen_c, uniq_classes = set(), []
-    for c in all_classes:
-        rel = (c.get("source_info") or {}).get("rel_path")
-        key = (rel, c.get("name"), _body_hash(c))
-        if key in seen_c: continue
-        seen_c.add(key); uniq_classes.append(c)
-    all_classes = uniq_classes
-
-    seen_f, uniq_functions = set(), []
-    for f in all_functions:
-        rel = (f.get("source_info") or {}).get("rel_path")
-        key = (rel, f.get("class"), f.get("name"), f.get("line_range"))
-        if key in seen_f: continue
-        seen_f.add(key); uniq_functions.append(f)
-    all_functions = uniq_functions
-
-    # 안정 정렬 (내용 동일, 순서만 고정)
-    all_classes.sort(key=lambda c: ((c.get("source_info") or {}).get("rel_path") or "", c.get("name") or ""))
-    all_functions.sort(key=lambda f: ((f.get("source_info") or {}).get("rel_path") or "", f.get("class") or "", f.get("name") or "", f.get("line_range") or ""))
+    # 이전 스냅샷과 내용이 같은 파일은 레코드(역할 포함)를 그대로 쓰고, 나머지만 파싱
+    reused_classes = _reuse(state, 'classes', base_zip_name)
+    reused_functions = _reuse(state, 'functions', base_zip_name)
+    reused = set(reused_classes) | set(reused_functions)
+    todo = {p for p, si in tasks if _manifest_rel(si) not in reused}
 
-    state['classes'], state['functions'] = all_classes, all_functions
-    logger.info(f"[PY] 분석 완료 → Classes: {len(all_classes)}, Functions: {len(all_functions)}")
-
-    # 저장 (스키마/파일명 그대로)
     output_dir = "output"
     os.makedirs(output_dir, exist_ok=True)
-
     output_classes_file = os.path.join(output_dir, "classes.jsonl")
-    with open(output_classes_file, "w", encoding="utf-8") as f:
-        for item in all_classes:
-            item.pop('functions', None)
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
-
     output_functions_file = os.path.join(output_dir, "functions.jsonl")
-    with open(output_functions_file, "w", encoding="utf-8") as f:
-        for item in all_functions:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    # 파일 단위로 파싱 → 역할 추론 → 중복 제거 → 정렬 writer로 흘려보낸다 (전체 레코드를 메모리에 모으지 않음)
+    #   - 클래스 역할은 같은 파일의 같은 클래스 메서드만 보므로 파일 단위로 추론해도 결과가 같다
+    #   - 중복 제거는 key만 기억하고, 정렬(rel_path/name 순, 안정 정렬)은 SortedJsonlWriter가 외부 정렬로
+    cache = open_parse_cache()
+    file_digests = digests(state.get('manifest'))
+    seen_c, seen_f = set(), set()
+    with SortedJsonlWriter(output_classes_file, key=_class_sort_key) as class_writer, \
+            SortedJsonlWriter(output_functions_file, key=_function_sort_key) as function_writer:
+        for batch in _batches(tasks, ANALYZE_BATCH_FILES):
+            # 파일별 파싱/추출은 (캐시에 없는 것만) 프로세스 풀에서, 결과는 파일 순서대로
+            parsed = analyze_files(parse_python_file, [p for p, _ in batch if p in todo], cache=cache,
+                                   digests=file_digests)
+            parsed.reverse()  # 앞에서부터 pop → 처리한 파일의 결과는 writer로 넘어간 뒤 바로 해제
+            for file_path, source_info in batch:
+                rel = _manifest_rel(source_info)
+                if rel in reused:
+                    py_classes, py_funcs = reused_classes.get(rel, []), reused_functions.get(rel, [])
+                else:
+                    py_classes, py_funcs = parsed.pop()
+                    methods_by_class = {}  # 클래스 이름 → 이 파일의 메서드 (클래스마다 전체 함수를 훑지 않도록)
+                    for func in py_funcs:
+                        func['source_info'] = source_info
+                        func['external_calls'] = func.pop('external_calls')  # 기존 출력과 같은 key 순서 유지
+                        if not func.get('class'):
+                            func['role'] = mapper.infer_standalone_function_role(func)
+                        else:
+                            methods_by_class.setdefault(func['class'], []).append(func)
+                    for cls in py_classes:
+                        cls['source_info'] = source_info
+                        class_methods = methods_by_class.get(cls.get('name'), [])
+                        cls['role'] = mapper.infer_class_role({**cls, "functions": class_methods})
+
+                # 중복 제거 (스키마 불변)
+                for f in py_funcs:
+                    key = (f["source_info"].get("rel_path"), f.get("class"), f.get("name"), f.get("line_range"))
+                    if key in seen_f: continue
+                    seen_f.add(key); function_writer.add(f)
+                for c in py_classes:
+                    key = (c["source_info"].get("rel_path"), c.get("name"), _body_hash(c))
+                    if key in seen_c: continue
+                    c.pop('functions', None)
+                    seen_c.add(key); class_writer.add(c)
+    if cache is not None:
+        logger.info(f"[PY] parse cache: {cache.stats()}")
+        cache.close()
+    if reused:
+        logger.info(f"[PY] reused {len(reused)} unchanged files from snapshot, parsed {len(todo)}")
+
+    state['class_count'], state['function_count'] = class_writer.count, function_writer.count
+    logger.info(f"[PY] 분석 완료 → Classes: {class_writer.count}, Functions: {function_writer.count}")
 
     state['report_files'] = [output_classes_file, output_functions_file]
+    changeset_file = _write_changeset(state, output_dir)
+    if changeset_file:
+        state['report_files'].append(changeset_file)
+    if state.get('snapshot_dir'):
+        save_snapshot(state['snapshot_dir'], state.get('manifest') or {},
+                      classes=iter_jsonl(output_classes_file), functions=iter_jsonl(output_functions_file))
     return state
 
+def _feature_bodies(classes: list, sources: SourceTable, rel_digests: dict) -> dict:
+    """{role: {본문: 처음 그 본문을 만든 클래스}} — 같은 내용(파일 digest + span)은 한 번만 꺼내고 본문 단위로 dedup"""
+    feature_set = {}
+    for cls in classes:
+        role = (cls.get('role', {}) or {}).get('type', 'unknown').lower()
+        if role == 'serviceimpl':
+            role = 'service'  # 요약 관점에선 SERVICE로 통합
+        path = (cls.get('source_info') or {}).get('rel_path')
+        keys = feature_set.setdefault(role, {})
+        keys.setdefault((rel_digests.get(path) or path, span_key(cls)), cls)
+
+    result = {}
+    for r, keyed in feature_set.items():
+        bodies = {}
+        for cls in keyed.values():
+            code = sources.body(cls)
+            if code:
+                bodies.setdefault(code, cls)  # <-- 내용 단위 dedup
+        if bodies:
+            result[r] = bodies
+    return result
+
+def _origin(cls) -> tuple:
+    """(rel_path, name, spans) — 출처를 모르는 본문은 None"""
+    if cls is None:
+        return None, None, None
+    return _manifest_rel(cls.get('source_info') or {}), cls.get('name'), cls.get('spans')
+
+def _parse_mappers(mapper_files: list, file_digests: dict) -> list:
+    """XML 매퍼 파싱 (analyze_java의 별도 스레드) — sqlite 연결은 스레드 간에 공유할 수 없어 캐시를 따로 연다"""
+    start = time.perf_counter()
+    cache = open_parse_cache()
+    try:
+        return analyze_files(parse_xml_mapper, mapper_files, workers=1, cache=cache, digests=file_digests)
+    finally:
+        if cache is not None:
+            cache.close()
+        logger.info(f"[JAVA] parsed {len(mapper_files)} XML mappers in {time.perf_counter() - start:.2f}s")
 
 def analyze_java(state: State) -> State:
     logger.info("Executing node: analyze_java")
-    all_classes, query_bank = [], {}
+    all_classes = []
     mapper = StructureMapper()
     base_zip_name = os.path.basename(state.get('input_path', ''))
     extract_dir = state.get('extract_dir')
 
-    # XML Mapper (MyBatis 등)
-    for file_path, lang in state.get('code_files', []):
-        if lang == 'xml' and 'src/main/resources' in file_path:
-            query_bank.update(XmlMapperAnalyzer(file_path).get_queries())
+    cache = open_parse_cache()
+    file_digests = digests(state.get('manifest'))
+
+    # XML Mapper (MyBatis 등)는 Java 파싱과 동시에 별도 스레드에서 — 클래스 추출에는 쿼리 뱅크가 필요 없으므로
+    # (Java 파싱 캐시 key에도 쿼리 뱅크가 들어가지 않아 매퍼만 바뀌면 Java 캐시는 그대로 hit)
+    # <include> 펼치기와 클래스 ↔ 구문 결합은 둘 다 끝난 뒤 (output/sql_bindings.json)
+    mapper_files = [file_path for file_path, lang in state.get('code_files', [])
+                    if lang == 'xml' and 'src/main/resources' in file_path]
+    xml_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='xml-mapper')
+    xml_future = xml_pool.submit(_parse_mappers, mapper_files, file_digests)
 
     # 자바 클래스
+    tasks = []
     for file_path, lang in state.get('code_files', []):
         if lang != 'java':
             continue
         rel_path = os.path.relpath(file_path, extract_dir)
         source_info = {"zip_file": base_zip_name, "rel_path": rel_path, "language": lang}
-
-        analyzer = JavaAnalyzer(file_path, query_bank=query_bank)
-        if analyzer.is_parsed:
-            classes = analyzer.extract_classes()
-        else:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                code_text = f.read()
-            classes = extract_classes_lenient_from_text(code_text)
-
-        for cls in classes:                      # 폴백/정상 공통 처리
+        tasks.append((file_path, source_info))
+
+    # 이전 스냅샷과 내용이 같은 파일은 클래스 레코드(역할/span 포함)를 그대로 쓰고, 나머지만 파싱
+    reused = _reuse(state, 'java_classes', base_zip_name)
+    todo = [(p, si) for p, si in tasks if _manifest_rel(si) not in reused]
+
+    # 파일별 파싱은 (캐시에 없는 것만) 프로세스 풀에서, 결과는 파일 순서대로 합친다
+    java_parser = resolve_backend()
+    logger.info(f"[JAVA] parser backend: {java_parser}")
+    parsed = iter(analyze_files(parse_java_file, [p for p, _ in todo], cache=cache,
+                                digests=file_digests, java_parser=java_parser))
+    for _, source_info in tasks:
+        rel = _manifest_rel(source_info)
+        if rel in reused:
+            all_classes.extend(reused[rel])
+            continue
+        for cls in next(parsed):                 # 폴백/정상 공통 처리
             cls['source_info'] = source_info
             cls['role'] = mapper.infer_class_role(cls)
             all_classes.append(cls)
+    if cache is not None:
+        logger.info(f"[JAVA] parse cache: {cache.stats()}")
+        cache.close()
+    if reused:
+        logger.info(f"[JAVA] reused {len(reused)} unchanged files from snapshot, parsed {len(todo)}")
+    query_bank = bind_queries(xml_future.result())
+    xml_pool.shutdown()
 
     # 클래스 객체 자체 dedup (같은 파일/이름/본문은 1개로)
     seen_keys = set()
     uniq_classes = []
     for c in all_classes:
         rel = (c.get("source_info") or {}).get("rel_path")
-        key = (rel, c.get("name"), _body_hash(c))  # _body_hash는 파일 상단에 이미 정의됨
+        key = (rel, c.get("name"), span_key(c))  # 본문 대신 span으로 비교 (같은 파일 → 같은 span이면 같은 본문)
         if key in seen_keys:
             continue
         seen_keys.add(key)
@@ -184,38 +281,62 @@ def analyze_java(state: State) -> State:
     all_classes = uniq_classes
 
 
-    # feature 그룹핑 → 요약
-    classes_by_feature = {}
-    for cls in all_classes:
-        class_name = cls.get("name", "")
-        match = re.search(
-            r'^(.*?)(Controller|Service|ServiceImpl|Repository|DAO|VO|Dto|Entity|Config|Exception|Util|Filter|Jwt|Impl|Tests|Test)$',
-            class_name, re.IGNORECASE
-        )
-        feature = "unknown"
-        if match and match.group(1):
-            feature_candidate = re.sub(r'^(Res|Req)', '', match.group(1), flags=re.IGNORECASE)
-            feature = feature_candidate.lower() if feature_candidate else class_name.lower()
-        elif not match:
-            feature = class_name.lower()
-        if class_name.endswith("Application"):
-            feature = "app"
-        classes_by_feature.setdefault(feature, []).append(cls)
-
+    # 본문은 원문 테이블에서 잘라낸다 (파일당 한 번 읽음)
+    sources = SourceTable(extract_dir)
+
+    # 메서드 호출 그래프 (레코드의 methods → 파일 간 호출 해석, output/java_call_graph.json)
+    graph = feature_clusters.call_graph(all_classes)
+    logger.info(f"[JAVA] call graph: {graph.stats()}")
+
+    # feature 그룹핑 → 요약. 클래스가 본문에서 참조하는 프로젝트 클래스 이름을 레코드에 남겨 두고 (재사용 레코드는 이미 있음)
+    # 주입/호출/VO 사용과 해석된 메서드 호출로 이어진 클래스를 한 feature로 묶는다
+    if feature_clusters.enabled():
+        class_names = {cls.get("name") for cls in all_classes}
+        for cls in all_classes:
+            if "references" not in cls:
+                cls["references"] = feature_clusters.type_references(sources.body(cls), class_names, cls.get("name"))
+    classes_by_feature = _group_features(all_classes, graph)
+    logger.info(f"[JAVA] {len(all_classes)} classes → {len(classes_by_feature)} features")
+
+    # 매퍼 SQL ↔ 클래스 결합 (namespace 규칙 + 본문의 "namespace.id" 리터럴)
+    bindings = sql_bindings(all_classes, query_bank, sources.body) if query_bank else []
+
+    # 이전 스냅샷 대비 바뀐 feature만 다시 만든다 (바뀐 파일의 클래스가 없는 feature는 이전 결과 그대로)
+    previous_results = {}
+    changeset = state.get('changeset')
+    if changeset:
+        files = changeset['files']
+        changed_paths = set(files['added']) | set(files['modified']) | set(files['removed'])
+        previous_features = {feature: {_manifest_rel(c.get('source_info') or {}) for c in classes}
+                             for feature, classes in _group_features((state.get('baseline') or {}).get('java_classes') or []).items()}
+        current_features = {feature: {_manifest_rel(c.get('source_info') or {}) for c in classes}
+                            for feature, classes in classes_by_feature.items()}
+        changeset['features'] = feature_changes(previous_features, current_features, changed_paths)
+        if compatible(state.get('baseline')):
+            unchanged = set(changeset['features']['unchanged'])
+            for entry in state['baseline'].get('java_analysis_results') or []:
+                for feature, feature_set in entry.items():
+                    if feature in unchanged:
+                        previous_results[feature] = feature_set
+        logger.info(f"[JAVA] changeset: files { {k: len(v) for k, v in files.items()} }, "
+                    f"features { {k: len(v) for k, v in changeset['features'].items()} }")
+
+    # 같은 내용(파일 digest + span)은 한 번만 꺼낸다
+    rel_digests = {source_info["rel_path"]: file_digests.get(file_path) for file_path, source_info in tasks}
     java_analysis_output = []
+    origins = {}  # (feature, role) -> {본문: 처음 그 본문을 만든 클래스} (컬럼형 산출물의 rel_path/name/spans)
+    write_arrow = columnar_store.enabled()
     for feature, classes in classes_by_feature.items():
+        if feature in previous_results:
+            java_analysis_output.append({feature: previous_results[feature]})
+            if write_arrow:  # 본문은 이전 결과 그대로, 컬럼형 산출물의 출처(rel_path/name/spans)만 다시 계산
+                for r, bodies in _feature_bodies(classes, sources, rel_digests).items():
+                    origins[(feature, r)] = bodies
+            continue
         feature_set = {}
-        for cls in classes:
-            role = (cls.get('role', {}) or {}).get('type', 'unknown').lower()
-            if role == 'serviceimpl':
-                role = 'service'  # 요약 관점에선 SERVICE로 통합
-            path = (cls.get('source_info') or {}).get('rel_path')
-            code = cls.get('body', {})
-            if not code:
-                continue
-            lst = feature_set.setdefault(role, [])
-            if code not in lst:        # <-- 경로 단위 dedup
-                lst.append(code)
+        for r, bodies in _feature_bodies(classes, sources, rel_digests).items():
+            feature_set[r] = list(bodies)
+            origins[(feature, r)] = bodies
 
         if feature_set:
             # 보기 좋게 경로 오름차순 정렬(안정성)
@@ -225,6 +346,7 @@ def analyze_java(state: State) -> State:
                     key=lambda x: json.dumps(x, ensure_ascii=False, sort_keys=True) if isinstance(x, dict) else str(x)
                 )
             java_analysis_output.append({feature: feature_set})
+    sources.clear()
 
     output_dir = "output"
     os.makedirs(output_dir, exist_ok=True)
@@ -233,7 +355,37 @@ def analyze_java(state: State) -> State:
         json.dump(java_analysis_output, f, ensure_ascii=False, indent=4)
 
     logger.info(f"[JAVA] 분석 완료 → Classes: {len(all_classes)}")
-    state['report_files'] = [output_file_name]
+    output_graph_file = os.path.join(output_dir, "java_call_graph.json")
+    graph.save(output_graph_file)
+    state['report_files'] = [output_file_name, output_graph_file]
+
+    bindings_file_name = os.path.join(output_dir, "sql_bindings.json")
+    if mapper_files:
+        with open(bindings_file_name, "w", encoding="utf-8") as f:
+            json.dump(bindings, f, ensure_ascii=False, indent=4)
+        logger.info(f"[JAVA] SQL: {len(query_bank)} statements, {len(bindings)} classes bound")
+        state['report_files'].append(bindings_file_name)
+    elif os.path.exists(bindings_file_name):
+        os.remove(bindings_file_name)
+
+    # 같은 내용의 컬럼형 산출물 (ANALYSIS_ARROW=1 + pyarrow일 때만). 아니면 이전 실행의 .arrow가 남지 않도록 지운다
+    arrow_file_name = os.path.join(output_dir, "java_analysis_results.arrow")
+    if write_arrow:
+        rows = ((feature, role, *_origin(origins.get((feature, role), {}).get(code)), code)
+                for entry in java_analysis_output
+                for feature, feature_set in entry.items()
+                for role, codes in feature_set.items()
+                for code in codes)
+        columnar_store.write_features(arrow_file_name, rows)
+        state['report_files'].append(arrow_file_name)
+    elif os.path.exists(arrow_file_name):
+        os.remove(arrow_file_name)
+    changeset_file = _write_changeset(state, output_dir)
+    if changeset_file:
+        state['report_files'].append(changeset_file)
+    if state.get('snapshot_dir'):
+        save_snapshot(state['snapshot_dir'], state.get('manifest') or {},
+                      java_classes=all_classes, java_analysis_results=java_analysis_output)
     state['classes'] = all_classes
     state['java_analysis'] = java_analysis_output
     return state
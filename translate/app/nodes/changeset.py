@@ -0,0 +1,35 @@
+# app/nodes/changeset.py
+import logging
+from translate.app.states import State
+from translate.app.analyzer.snapshot import load_snapshot, diff_files, compatible
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def compute_changeset(state: State) -> dict:
+    """
+    state['previous_snapshot'](이전 분석 스냅샷 디렉토리)가 있으면 manifest의 내용 해시로 새 업로드와 비교해
+    added/modified/removed/unchanged 파일 목록을 state['changeset']에 남기고, 이전 레코드를 state['baseline']에 싣습니다.
+    analyze 노드는 unchanged 파일을 다시 파싱하지 않고 baseline 레코드를 재사용합니다.
+    (code_files 같은 누적(reducer) 키를 다시 더하지 않도록 바뀐 키만 반환)
+    """
+    logging.info("Executing node: compute_changeset")
+    previous_dir = state.get('previous_snapshot')
+    if not previous_dir:
+        return {}
+
+    baseline = load_snapshot(previous_dir)
+    if baseline is None:
+        logging.warning(f"No usable snapshot at '{previous_dir}', analyzing every file.")
+        return {}
+    if not compatible(baseline):
+        logging.warning("Snapshot was produced by a different analyzer version; records will not be reused.")
+
+    manifest = state.get('manifest') or {}
+    files = diff_files(baseline.get('manifest'), manifest)
+    changeset = {
+        'base': baseline['meta'].get('source'),
+        'source': manifest.get('source'),
+        'files': files,
+    }
+    logging.info(f"Changeset vs '{changeset['base']}': { {k: len(v) for k, v in files.items()} }")
+    return {'baseline': baseline, 'changeset': changeset}
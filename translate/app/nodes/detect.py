@@ -1,8 +1,8 @@
 # app/nodes/detect.py
 import os
 import logging
-import xml.etree.ElementTree as ET
 from translate.app.states import State
+from translate.app.analyzer.project_manifest import parse_build_file, resolve_framework
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -14,13 +14,17 @@ def detect_language(state: State) -> State:
     logging.info("Executing node: detect_language (with Python priority logic)")
     code_files = state.get('code_files', [])
     extract_dir = state.get('extract_dir', '')
+    manifest = state.get('manifest')
 
     # 기본값 설정
     primary_language, framework, egov_version = 'unknown', 'unknown', 'unknown'
 
     # --- 언어 탐지 로직 수정 시작 ---
     # 프로젝트에 포함된 언어 종류를 확인합니다.
-    detected_langs = {lang for _, lang in code_files if lang in ['python', 'java']}
+    if manifest:
+        detected_langs = {lang for lang, count in manifest.get('languages', {}).items() if count and lang in ['python', 'java']}
+    else:
+        detected_langs = {lang for _, lang in code_files if lang in ['python', 'java']}
 
     if 'python' in detected_langs:
         # Python 파일이 있으면 무조건 primary_language를 'python'으로 설정
@@ -34,23 +38,17 @@ def detect_language(state: State) -> State:
     # --- 언어 탐지 로직 수정 끝 ---
 
     # 프레임워크 탐지 로직은 결정된 주요 언어에 따라 동일하게 수행됩니다.
+    # preprocessing이 만든 manifest에 빌드 파일 파싱 결과가 있으므로 extract_dir을 다시 훑지 않습니다.
     if primary_language == 'java':
-        for root, _, files in os.walk(extract_dir):
-            if 'pom.xml' in files:
-                try:
-                    tree = ET.parse(os.path.join(root, 'pom.xml'))
-                    root_pom = tree.getroot()
-                    ns = {'m': 'http://maven.apache.org/POM/4.0.0'}
-                    if root_pom.find('.//m:parent[m:artifactId="spring-boot-starter-parent"]', ns) is not None:
-                        framework = 'Spring Boot'
-                    egov_dep = root_pom.find('.//m:dependency[m:groupId="egovframework.rte"]', ns)
-                    if egov_dep is not None:
-                        framework = 'eGovFrame'
-                        version_tag = egov_dep.find('m:version', ns)
-                        if version_tag is not None: egov_version = version_tag.text
-                    if framework != 'unknown': break
-                except Exception as e:
-                    logging.warning(f"Error parsing pom.xml in {root}: {e}")
+        if manifest:
+            framework, egov_version = manifest.get('framework', 'unknown'), manifest.get('egov_version', 'unknown')
+        else:
+            build_files = []
+            for root, _, files in os.walk(extract_dir):
+                if 'pom.xml' in files:
+                    path = os.path.join(root, 'pom.xml')
+                    build_files.append(parse_build_file(path, os.path.relpath(path, extract_dir).replace(os.sep, '/')))
+            framework, egov_version = resolve_framework(build_files)
 
     # 상태 업데이트
     state['language'] = primary_language
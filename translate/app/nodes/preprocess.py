@@ -4,14 +4,17 @@ import logging
 import tempfile
 from translate.app.states import State
 from translate.app.analyzer.file_extractor import FileExtractor
+from translate.app.analyzer.project_manifest import build_manifest
 
 # 로깅 기본 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def preprocessing(state: State) -> State:
     """
-    주어진 extract_dir 경로에 ZIP 파일의 압축을 해제하고 소스 파일을 탐색합니다.
+    ZIP 멤버를 한 번만 순회하며 지원 확장자 파일만 extract_dir에 풀고(target/, node_modules/, .git/ 등 제외) 목록을 만듭니다.
     FileExtractor가 dict를 반환하더라도, 다음 단계 호환을 위해 (path, lang) 튜플로 정규화합니다.
+    추출하면서 계산한 size/sha256/encoding과 빌드 파일(pom.xml/build.gradle) 파싱 결과는 state['manifest']로 넘겨
+    detect/analyze가 파일시스템을 다시 훑지 않게 합니다.
     """
     logging.info("Executing node: preprocessing")
     input_path = state.get('input_path')
@@ -39,8 +42,7 @@ def preprocessing(state: State) -> State:
 
     try:
         extractor = FileExtractor(input_path, extract_dir)
-        extractor.extract_zip()
-        raw = extractor.find_supported_code_files()
+        raw = extractor.extract_supported()
 
         norm = []
         for it in (raw or []):
@@ -57,7 +59,10 @@ def preprocessing(state: State) -> State:
                 norm.append((os.path.abspath(p), l))
 
         state['code_files'] = norm
-        logging.info(f"Extracted to '{extract_dir}' and found {len(state['code_files'])} supported files.")
+        state['manifest'] = build_manifest(extract_dir, [it for it in (raw or []) if isinstance(it, dict)],
+                                           source=os.path.basename(input_path))
+        logging.info(f"Extracted to '{extract_dir}' and found {len(state['code_files'])} supported files. (skipped: {extractor.skipped})")
+        logging.info(f"Manifest: languages={state['manifest']['languages']}, build_files={len(state['manifest']['build_files'])}")
     except Exception as e:
         logging.error(f"Preprocessing failed: {e}", exc_info=True)
         state['code_files'] = []
@@ -12,7 +12,10 @@ import os, tempfile
 from translate.app.analyze_agent import AnalysisAgent
 from translate.app.python_agent import run_python_agent
 from translate.app.egov_agent import ConversionEgovAgent
-from translate.app.producer import MessageProducer
+from translate.app.progress import ProgressStream
+from translate.app.worker import job_outcome
+from translate.app.artifacts import offload_result
+from translate.app.analyzer.snapshot import project_snapshot_dir, begin_snapshot, promote_snapshot, discard_snapshot
 from translate.app.utils import _is_s3_uri, _is_http_uri, _download_s3_to, _download_http_to
 
 SYSTEM = "너는 코드 마이그레이션 수퍼바이저다. 목표를 달성할 때까지 적절한 도구를 순차적으로 호출하라."
@@ -30,21 +33,30 @@ HUMAN = """
 완료 시 더는 도구를 호출하지 말고 JSON으로 status만 알려라.
 """
 
-producer = MessageProducer()
+progress = ProgressStream()
 
-def run_analysis(user_id, job_id, input_path: str, extract_dir: str) -> Dict[str, Any]:
+# 이번 작업(run)에서 단계별로 보낸 종료 이벤트 [{'agent', 'message'}] — 워커 프로세스당 동시에 작업 1개
+_finished = []
+
+def _finish(message: dict, agent: str):
+    progress.finish(message=message, agent=agent)
+    _finished.append({'agent': agent, 'message': message})
+
+def run_analysis(user_id, job_id, input_path: str, extract_dir: str,
+                 previous_snapshot: str = None, snapshot_dir: str = None) -> Dict[str, Any]:
     summary = {"language": "unknown", "converted": False}
     try:
-        producer.send_message(topic='agent-res', 
-                              message={'userId': user_id, 'jobId': job_id, 'description': '프로젝트 구조 분석을 시작합니다.'},
-                              headers=[('AGENT', 'ANALYSIS')])
+        progress.update(message={'userId': user_id, 'jobId': job_id, 'description': '프로젝트 구조 분석을 시작합니다.'},
+                        agent='ANALYSIS')
         
         graph = AnalysisAgent().build_graph()
-        state = {"input_path": input_path, "extract_dir": extract_dir}
+        state = {"input_path": input_path, "extract_dir": extract_dir,
+                 "previous_snapshot": previous_snapshot, "snapshot_dir": snapshot_dir}
         final_state = graph.invoke(state)
         summary = {
             "language": final_state.get("language"),
-            "converted": bool(final_state.get("classes")) or bool(final_state.get("controller_code"))
+            "converted": bool(final_state.get("classes")) or bool(final_state.get("class_count"))
+                         or bool(final_state.get("controller_code"))
         }
         status = 'SUCCESS'
         description = '프로젝트 구조 분석이 완료되었습니다.'
@@ -53,18 +65,16 @@ def run_analysis(user_id, job_id, input_path: str, extract_dir: str) -> Dict[str
         status = 'FAIL'
         description = '프로젝트 구조 분석이 실패되었습니다.'
     finally:
-        producer.send_message(topic='agent-res', 
-                              message={'userId': user_id, 'jobId': job_id, 'language': summary['language'], 'status': status, 'description': description},
-                              headers=[('AGENT', 'ANALYSIS')])
+        _finish(message={'userId': user_id, 'jobId': job_id, 'language': summary['language'], 'status': status, 'description': description},
+                agent='ANALYSIS')
     return summary
 
 def py_to_java(user_id, job_id) -> Dict[str, Any]:
     try:
-        producer.send_message(topic='agent-res', 
-                              message={'userId': user_id, 'jobId': job_id, 'description': '언어 변환을 시작합니다.'},
-                              headers=[('AGENT', 'PYTHON')])
+        progress.update(message={'userId': user_id, 'jobId': job_id, 'description': '언어 변환을 시작합니다.'},
+                        agent='PYTHON')
         
-        run_python_agent(limit=2)
+        run_python_agent()
         status = 'SUCCESS'
         description = '파이썬을 자바로 변환 완료되었습니다.'
     except Exception as e:
@@ -72,27 +82,27 @@ def py_to_java(user_id, job_id) -> Dict[str, Any]:
         status = 'FAIL'
         description = '파이썬을 자바로 변환 실패되었습니다.'
     finally:
-        producer.send_message(topic='agent-res', 
-                              message={'userId': user_id, 'jobId': job_id, 'status': status, 'description': description},
-                              headers=[('AGENT', 'PYTHON')])
+        _finish(message={'userId': user_id, 'jobId': job_id, 'status': status, 'description': description},
+                agent='PYTHON')
 
 def java_to_egov(user_id, job_id) -> Dict[str, Any]:
     try:
-        producer.send_message(topic='agent-res', 
-                              message={'userId': user_id, 'jobId': job_id, 'description': '전자정부표준프레임워크 변환을 시작합니다.'},
-                              headers=[('AGENT', 'EGOV')])
+        progress.update(message={'userId': user_id, 'jobId': job_id, 'description': '전자정부표준프레임워크 변환을 시작합니다.'},
+                        agent='EGOV')
         
         egov_agent = ConversionEgovAgent()
         graph = egov_agent.build_graph()
-        state = egov_agent.init_state(user_id, job_id)
+        # 증분 재분석이면 analyze가 남긴 changeset으로 변경 없는 feature는 건너뛴다 (output/은 아래에서 지워짐)
+        state = egov_agent.init_state(user_id, job_id, changeset_path='output/changeset.json')
         final_state = graph.invoke(state, config={"recursion_limit": 1000})
         
         # with open("output/conversion_result.json", 'w', encoding='utf-8') as f:
         #     json.dump(final_state, f, ensure_ascii=False, indent=2)
         
+        # artifact store 저장 실패도 변환 실패로 처리 (finally에서 예외가 나면 종료 이벤트가 나가지 않음)
+        result_fields = offload_result(job_id, 'egov-result', final_state)
         status = 'SUCCESS'
         description = '전자정부표준프레임워크 변환 완료되었습니다.'
-        result = final_state
         if os.path.exists('output'):
             shutil.rmtree('output')
             print(f"중간 산출물을 삭제했습니다.")
@@ -100,17 +110,18 @@ def java_to_egov(user_id, job_id) -> Dict[str, Any]:
         print(e)
         status = 'FAIL'
         description = '전자정부표준프레임워크 변환 실패되었습니다.'
-        result = {}
+        result_fields = {'result': {}}
     finally:
-        producer.send_message(topic='agent-res', 
-                              message={'userId': user_id, 'jobId': job_id, 'status': status, 'description': description, 'result': result},
-                              headers=[('AGENT', 'EGOV')])
+        _finish(message={'userId': user_id, 'jobId': job_id, 'status': status, 'description': description, **result_fields},
+                agent='EGOV')
         
 
 class ConversionAgent:
     def __init__(self):
+        # 스냅샷 위치는 LLM이 고르지 않고 run()이 작업(userId + 업로드 이름)에서 정한 값을 그대로 넘긴다
+        self._snapshot = {}
         self.run_analysis_tool     = StructuredTool.from_function(name="run_analysis",     
-                                                                  func=lambda user_id, job_id, input_path, extract_dir: run_analysis(user_id, job_id, input_path, extract_dir), 
+                                                                  func=lambda user_id, job_id, input_path, extract_dir: run_analysis(user_id, job_id, input_path, extract_dir, **self._snapshot), 
                                                                   description="ZIP을 분석해 언어/구조를 탐지")
         self.py_to_java_tool       = StructuredTool.from_function(name="py_to_java",       
                                                                   func=lambda user_id, job_id: py_to_java(user_id, job_id), 
@@ -125,8 +136,32 @@ class ConversionAgent:
         self.agent = create_tool_calling_agent(self.llm, self.tools, self.prompt)
         self.executor = AgentExecutor(agent=self.agent, tools=self.tools, verbose=True)
         
+    @staticmethod
+    def finished() -> list:
+        """직전 run에서 단계별로 보낸 종료 이벤트 (최종 결과 판정은 worker.job_outcome)"""
+        return list(_finished)
+
     def run(self, user_id, job_id, input_path):
+        _finished.clear()
         outdir = f"output/"
+        project_dir = project_snapshot_dir(user_id, input_path)
+        previous_snapshot, snapshot_dir = begin_snapshot(project_dir)
+        self._snapshot = {'previous_snapshot': previous_snapshot, 'snapshot_dir': snapshot_dir}
+        try:
+            result = self._run(user_id, job_id, input_path, outdir)
+        except Exception:
+            discard_snapshot(snapshot_dir)
+            raise
+        finally:
+            self._snapshot = {}
+        # 이번 분석 스냅샷은 모든 단계가 성공했을 때만 다음 작업의 기준(current)이 된다
+        if job_outcome(_finished)[0] == 'SUCCESS':
+            promote_snapshot(snapshot_dir, project_dir)
+        else:
+            discard_snapshot(snapshot_dir)
+        return result
+
+    def _run(self, user_id, job_id, input_path, outdir):
         with tempfile.TemporaryDirectory() as tmp:
             download_dir = os.path.join(tmp, "downloads")   # ZIP 저장
             extract_dir  = os.path.join(tmp, "extracted")   # 압축 풀 위치(이것만 삭제)
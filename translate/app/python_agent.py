@@ -11,6 +11,7 @@ from langchain.tools import StructuredTool
 from langchain.agents import create_tool_calling_agent, AgentExecutor
 from langchain_core.prompts import ChatPromptTemplate
 from translate.app.analyze_agent import AnalysisAgent
+from translate.app.analyzer.jsonl_store import JsonlQueue, iter_jsonl, count_lines
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 assert OPENAI_API_KEY, "Missing OPENAI_API_KEY (set in your env)"
 llm = ChatOpenAI(model="gpt-4o", temperature=0, openai_api_key=OPENAI_API_KEY)
@@ -257,19 +258,18 @@ class JavaGenState(TypedDict):
     vo_code: List[str]
     end: bool
 
-CLASSES: list[dict] = []
+CLASSES = JsonlQueue()  # classes.jsonl을 한 줄씩 읽는 큐 (전체를 메모리에 올리지 않음)
 
-def load_classes(jsonl_path: str):
+def load_classes(jsonl_path: str, limit=None):
     global CLASSES
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        CLASSES = [json.loads(line) for line in f]
+    CLASSES = JsonlQueue(iter_jsonl(jsonl_path), limit)
 
 def pop_next_class_node(state: dict) -> dict:
     if not CLASSES:
         state["end"] = True
         return state
 
-    state["input"] = CLASSES.pop(0)
+    state["input"] = CLASSES.pop()
     state["end"] = False
     return state
 
@@ -478,17 +478,11 @@ def build_executor():
 
 # ✅ 2. 실행 함수
 def run_python_agent(jsonl_path="output/classes.jsonl", limit=None):
-    # 클래스 로드
-    load_classes(jsonl_path)
-    print(f"[INFO] 전체 클래스 수: {len(CLASSES)}")
-
-    # 제한 설정
-    if limit:
-        limited = CLASSES[:limit]
-    else:
-        limited = CLASSES
-
-    print(f"[INFO] 실행할 클래스 수: {len(limited)}")
+    # 클래스 로드 (제한이 있으면 앞에서부터 limit개만)
+    total = count_lines(jsonl_path)
+    load_classes(jsonl_path, limit)
+    print(f"[INFO] 전체 클래스 수: {total}")
+    print(f"[INFO] 실행할 클래스 수: {min(total, limit) if limit else total}")
 
     # LangGraph 실행기 준비
     build_executor()
@@ -505,9 +499,8 @@ def run_python_agent(jsonl_path="output/classes.jsonl", limit=None):
         "end": False,
     }
 
-    # 첫 클래스만 우선 실행 (개별적으로 처리 가능)
-    if limited:
-        state["input"] = limited[0]  # 여기부터 순차 반복 가능
+    # PopClass 노드가 CLASSES에서 한 건씩 꺼내 순차 처리
+    if CLASSES:
         return graph_executor.invoke(state)
     else:
         print("[⚠️] 실행할 클래스가 없습니다.")
@@ -13,8 +13,17 @@ class State(TypedDict, total=False):
 
     # 수집 결과
     code_files: Annotated[List[Tuple[str, str]], operator.add]  # [(abs_path, lang)]
+    manifest:   Dict                                            # project_manifest.build_manifest() 결과 (preprocessing에서 1회)
+
+    # 증분 재분석 (analyzer/snapshot.py)
+    previous_snapshot: Optional[str]  # 이전 분석 스냅샷 디렉토리 (있으면 내용이 같은 파일은 재사용)
+    snapshot_dir:      Optional[str]  # 이번 분석 결과를 스냅샷으로 저장할 디렉토리
+    baseline:          Dict           # load_snapshot() 결과
+    changeset:         Dict           # {base, source, files: {added, modified, removed, unchanged}, features: {...}}
     classes:    Annotated[List[dict], operator.add]             # 분석된 클래스들
     functions:  Annotated[List[dict], operator.add]             # 분석된 함수들
+    class_count:    int                                         # Python: output/classes.jsonl 레코드 수 (레코드는 state에 싣지 않음)
+    function_count: int                                         # Python: output/functions.jsonl 레코드 수
 
     # 요약/부가
     java_analysis: Annotated[List[dict], operator.add]          # Java feature별 매핑
@@ -15,8 +15,7 @@ api_key = os.getenv("OPENAI_API_KEY")
 
 # 1. 압축 해제 + 코드 파일 수집
 extractor = FileExtractor("samples/sample_project.zip")
-extractor.extract_zip()
-code_files = extractor.find_supported_code_files()
+code_files = [(f['path'], f['language']) for f in extractor.extract_supported()]
 
 # 2. 분석기 + 구성요소
 mapper = StructureMapper()
@@ -0,0 +1,306 @@
+# translate/app/transport.py
+# 역할: 메시지 전송 계층 추상화
+#   - MESSAGE_TRANSPORT=kafka (기본): confluent_kafka Producer/Consumer를 그대로 사용
+#   - MESSAGE_TRANSPORT=memory     : 프로세스 내 InMemoryBroker (헤더/키/파티션/오프셋/커밋/리밸런스 콜백 유지)
+#     Kafka 클러스터 없이 orchestrate → translate/security → agent-res 흐름을 한 머신에서 부하 테스트할 때 사용
+#   Producer/Consumer/Message는 서비스 코드가 쓰는 confluent_kafka API와 같은 모양(duck typing)으로 맞춘다.
+
+import os
+import time
+import zlib
+import threading
+from collections import deque
+
+try:
+    from confluent_kafka import TopicPartition, KafkaException as TransportError
+except ImportError:  # memory 전송만 사용하는 환경
+    class TransportError(Exception):
+        pass
+
+    class TopicPartition:
+        def __init__(self, topic, partition=-1, offset=-1001):
+            self.topic, self.partition, self.offset = topic, partition, offset
+
+        def __repr__(self):
+            return f"TopicPartition({self.topic!r}, {self.partition}, {self.offset})"
+
+OFFSET_INVALID = -1001
+
+
+def _as_bytes(v):
+    if v is None or isinstance(v, bytes):
+        return v
+    return str(v).encode('utf-8')
+
+
+class InMemoryMessage:
+    __slots__ = ('_topic', '_partition', '_offset', '_key', '_value', '_headers', '_timestamp')
+
+    def __init__(self, topic, partition, offset, key, value, headers):
+        self._topic, self._partition, self._offset = topic, partition, offset
+        self._key, self._value = key, value
+        self._headers = headers
+        self._timestamp = time.time()
+
+    def topic(self): return self._topic
+    def partition(self): return self._partition
+    def offset(self): return self._offset
+    def key(self): return self._key
+    def value(self): return self._value
+    def headers(self): return self._headers
+    def error(self): return None
+    def timestamp(self): return (1, int(self._timestamp * 1000))
+
+    def __len__(self):
+        return len(self._value or b'')
+
+
+class InMemoryBroker:
+    """토픽은 첫 produce/subscribe 시 num_partitions개 파티션으로 자동 생성"""
+    def __init__(self, num_partitions: int = 3):
+        self.num_partitions = num_partitions
+        self.cond = threading.Condition()
+        self.topics = {}      # topic -> [list[InMemoryMessage], ...]
+        self.committed = {}   # (group, topic, partition) -> offset
+        self.groups = {}      # group -> [InMemoryConsumer]
+        self._rr = 0
+
+    def _partitions(self, topic):
+        if topic not in self.topics:
+            self.topics[topic] = [[] for _ in range(self.num_partitions)]
+        return self.topics[topic]
+
+    def append(self, topic, value, key=None, headers=None, partition=None):
+        with self.cond:
+            partitions = self._partitions(topic)
+            if partition is None or partition < 0:
+                if key is not None:
+                    partition = zlib.crc32(key) % len(partitions)
+                else:
+                    partition = self._rr % len(partitions)
+                    self._rr += 1
+            log = partitions[partition]
+            msg = InMemoryMessage(topic, partition, len(log), key, value, headers)
+            log.append(msg)
+            self.cond.notify_all()
+            return msg
+
+    def join(self, group, consumer):
+        with self.cond:
+            for t in consumer.topics:
+                self._partitions(t)
+            self.groups.setdefault(group, []).append(consumer)
+            self._rebalance(group)
+
+    def leave(self, group, consumer):
+        with self.cond:
+            members = self.groups.get(group, [])
+            if consumer in members:
+                members.remove(consumer)
+                self._rebalance(group)
+
+    def _rebalance(self, group):
+        members = self.groups.get(group, [])
+        targets = {id(m): [] for m in members}
+        topics = sorted({t for m in members for t in m.topics})
+        for topic in topics:
+            subscribers = [m for m in members if topic in m.topics]
+            for p in range(len(self._partitions(topic))):
+                targets[id(subscribers[p % len(subscribers)])].append((topic, p))
+        for m in members:
+            m._pending_assignment = targets[id(m)]
+
+    def fetch(self, topic, partition, offset, max_messages):
+        log = self.topics[topic][partition]
+        return log[offset:offset + max_messages]
+
+    def end_offset(self, topic, partition):
+        return len(self.topics[topic][partition])
+
+
+class InMemoryProducer:
+    def __init__(self, broker: InMemoryBroker, config: dict = None):
+        self.broker = broker
+        self._reports = deque()
+        self._lock = threading.Lock()
+
+    def produce(self, topic, value=None, key=None, headers=None, partition=-1, callback=None, on_delivery=None):
+        headers = [(k, _as_bytes(v)) for k, v in headers] if headers else None
+        msg = self.broker.append(topic, _as_bytes(value), _as_bytes(key), headers, partition)
+        cb = callback or on_delivery
+        if cb:
+            with self._lock:
+                self._reports.append((cb, msg))
+
+    def poll(self, timeout=None):
+        served = 0
+        while True:
+            with self._lock:
+                if not self._reports:
+                    break
+                cb, msg = self._reports.popleft()
+            cb(None, msg)
+            served += 1
+        if not served and timeout:
+            time.sleep(min(timeout, 0.01))
+        return served
+
+    def flush(self, timeout=None):
+        self.poll(0)
+        return 0
+
+    def __len__(self):
+        return len(self._reports)
+
+
+class InMemoryConsumer:
+    def __init__(self, broker: InMemoryBroker, config: dict):
+        self.broker = broker
+        self.group = config.get('group.id') or 'default'
+        self.reset = config.get('auto.offset.reset') or 'latest'
+        self.auto_commit = str(config.get('enable.auto.commit', True)).lower() not in ('false', '0')
+        self.auto_store = str(config.get('enable.auto.offset.store', True)).lower() not in ('false', '0')
+        self.topics = []
+        self.on_assign = self.on_revoke = None
+        self._assignment = []          # [(topic, partition)]
+        self._pending_assignment = None
+        self._positions = {}           # (topic, partition) -> next offset
+        self._stored = {}              # (topic, partition) -> auto commit 대상 offset
+        self._paused = set()
+        self._cursor = 0
+        self._closed = False
+
+    def subscribe(self, topics, on_assign=None, on_revoke=None):
+        self.topics = list(topics)
+        self.on_assign, self.on_revoke = on_assign, on_revoke
+        self.broker.join(self.group, self)
+
+    def _serve_rebalance(self):
+        with self.broker.cond:
+            target, self._pending_assignment = self._pending_assignment, None
+        if target is None:
+            return
+        if self._assignment and self.on_revoke:
+            self.on_revoke(self, [TopicPartition(t, p) for t, p in self._assignment])
+        self._assignment = target
+        self._paused &= set(target)
+        with self.broker.cond:
+            for t, p in target:
+                committed = self.broker.committed.get((self.group, t, p))
+                if committed is not None:
+                    self._positions[(t, p)] = committed
+                elif (t, p) not in self._positions:
+                    self._positions[(t, p)] = 0 if self.reset in ('earliest', 'smallest', 'beginning') else self.broker.end_offset(t, p)
+        if self.on_assign:
+            self.on_assign(self, [TopicPartition(t, p) for t, p in target])
+
+    def _fetch(self, max_messages):
+        out = []
+        active = [tp for tp in self._assignment if tp not in self._paused]
+        for i in range(len(active)):
+            if len(out) >= max_messages:
+                break
+            tp = active[(self._cursor + i) % len(active)]
+            batch = self.broker.fetch(tp[0], tp[1], self._positions[tp], max_messages - len(out))
+            if batch:
+                self._positions[tp] = batch[-1].offset() + 1
+                out.extend(batch)
+        self._cursor += 1
+        if self.auto_store:
+            for m in out:
+                self._stored[(m.topic(), m.partition())] = m.offset() + 1
+        if self.auto_commit:
+            for (t, p), offset in self._stored.items():
+                self.broker.committed[(self.group, t, p)] = offset
+        return out
+
+    def consume(self, num_messages=1, timeout=-1):
+        if self._closed:
+            raise TransportError("consumer closed")
+        deadline = time.monotonic() + (timeout if timeout and timeout > 0 else 0)
+        while True:
+            self._serve_rebalance()
+            with self.broker.cond:
+                out = self._fetch(num_messages)
+                remaining = deadline - time.monotonic()
+                if out or remaining <= 0:
+                    return out
+                self.broker.cond.wait(remaining)
+
+    def poll(self, timeout=None):
+        msgs = self.consume(1, timeout if timeout is not None else -1)
+        return msgs[0] if msgs else None
+
+    def assignment(self):
+        return [TopicPartition(t, p) for t, p in self._assignment]
+
+    def pause(self, partitions):
+        self._paused |= {(tp.topic, tp.partition) for tp in partitions}
+
+    def resume(self, partitions):
+        self._paused -= {(tp.topic, tp.partition) for tp in partitions}
+        with self.broker.cond:
+            self.broker.cond.notify_all()
+
+    def seek(self, partition):
+        self._positions[(partition.topic, partition.partition)] = partition.offset
+
+    def store_offsets(self, message=None, offsets=None):
+        if message is not None:
+            self._stored[(message.topic(), message.partition())] = message.offset() + 1
+        for tp in offsets or []:
+            self._stored[(tp.topic, tp.partition)] = tp.offset
+
+    def commit(self, message=None, offsets=None, asynchronous=True):
+        with self.broker.cond:
+            if message is not None:
+                self.broker.committed[(self.group, message.topic(), message.partition())] = message.offset() + 1
+            for tp in offsets or []:
+                self.broker.committed[(self.group, tp.topic, tp.partition)] = tp.offset
+
+    def committed(self, partitions, timeout=None):
+        return [TopicPartition(tp.topic, tp.partition,
+                               self.broker.committed.get((self.group, tp.topic, tp.partition), OFFSET_INVALID))
+                for tp in partitions]
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self.broker.leave(self.group, self)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def memory_broker() -> InMemoryBroker:
+    """프로세스 공용 InMemoryBroker (부하 테스트에서 여러 서비스가 같은 인스턴스를 공유)"""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = InMemoryBroker(int(os.environ.get('MEMORY_TRANSPORT_PARTITIONS', '3')))
+        return _broker
+
+
+def use_memory_broker(broker: InMemoryBroker):
+    global _broker
+    with _broker_lock:
+        _broker = broker
+
+
+def _transport():
+    return os.environ.get('MESSAGE_TRANSPORT', 'kafka').lower()
+
+
+def create_producer(config: dict):
+    if _transport() == 'memory':
+        return InMemoryProducer(memory_broker(), config)
+    from confluent_kafka import Producer
+    return Producer(config)
+
+
+def create_consumer(config: dict):
+    if _transport() == 'memory':
+        return InMemoryConsumer(memory_broker(), config)
+    from confluent_kafka import Consumer
+    return Consumer(config)
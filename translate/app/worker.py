@@ -0,0 +1,208 @@
+# translate/app/worker.py
+# 역할: poll 스레드 밖에서 변환 작업을 실행하는 bounded worker pool
+#   - ConversionAgent는 cwd 기준 output/ 및 모듈 전역(CLASSES)을 사용하므로 스레드가 아닌 프로세스로 격리하고,
+#     워커 프로세스마다 전용 작업 디렉토리로 chdir 한다 (워커 1개 = 동시에 1개 작업)
+#   - 작업마다 parallel_analyzer가 파일 분석 프로세스 풀을 따로 띄우므로, 워커마다 ANALYZE_WORKERS(기본 CPU 수)를
+#     작업 워커 수로 나눈 만큼만 쓰게 한다 (동시에 도는 분석 프로세스 합 ≤ ANALYZE_WORKERS)
+#   - 같은 key(jobId/userId)의 작업은 도착 순서대로 하나씩만 실행
+#   - 오프셋은 작업이 끝난 것만, 파티션별로 연속된 구간까지만 커밋 대상으로 계산
+
+import os
+import queue
+import logging
+import multiprocessing
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from translate.app.ledger import JobLedger, input_digest
+from translate.app.domain import ToTranslator
+from translate.app.progress import ProgressStream
+from translate.app.utils import _is_s3_uri, _is_http_uri
+
+# consumer가 Logger(name='translate')로 설정한 logger (워커 프로세스는 fork로 handler를 물려받는다)
+logger = logging.getLogger('translate')
+
+_agent = None
+_ledger = None
+
+
+def _init_worker(workdir: str, analyze_workers: int = 0):
+    path = os.path.join(workdir, f"worker-{os.getpid()}")
+    os.makedirs(path, exist_ok=True)
+    os.chdir(path)
+    if analyze_workers:  # parallel_analyzer는 첫 작업에서 import되며 그때 ANALYZE_WORKERS를 읽는다
+        os.environ['ANALYZE_WORKERS'] = str(analyze_workers)
+
+
+def analyze_share(max_workers: int) -> int:
+    """작업 워커 1개의 파일 분석 프로세스 수 = ANALYZE_WORKERS(없으면 CPU 수) // 작업 워커 수, 최소 1"""
+    total = int(os.environ.get('ANALYZE_WORKERS', '0')) or (os.cpu_count() or 1)
+    return max(1, total // max(1, max_workers))
+
+
+def absolute_input(file_path: str) -> str:
+    """워커는 전용 디렉토리로 chdir하므로 로컬 입력은 제출 전에 (consumer cwd 기준) 절대 경로로 고정, s3/http URI는 그대로"""
+    if _is_s3_uri(file_path) or _is_http_uri(file_path):
+        return file_path
+    return os.path.abspath(file_path)
+
+
+def job_outcome(events: list):
+    """
+    단계별 종료 이벤트 → (status, 마지막 종료 이벤트)
+    단계 도구는 예외를 잡고 FAIL 이벤트만 보내므로 ConversionAgent.run이 정상 반환해도 성공이 아닐 수 있다
+    → 실패한 단계가 없고 마지막 단계(EGOV)가 SUCCESS일 때만 'SUCCESS'
+    """
+    final_event = events[-1] if events else None
+    succeeded = (final_event is not None and final_event['agent'] == 'EGOV'
+                 and all(event['message'].get('status') == 'SUCCESS' for event in events))
+    return ('SUCCESS' if succeeded else 'FAIL'), final_event
+
+
+def _agent_instance():
+    global _agent
+    if _agent is None:
+        from translate.app.orchestrator import ConversionAgent
+        _agent = ConversionAgent()
+    return _agent
+
+
+def run_conversion(request: ToTranslator):
+    """
+    워커 프로세스에서 실행: 프로세스당 ConversionAgent 1개를 재사용.
+    원장 상태는 run의 반환 여부가 아니라 단계별 종료 이벤트의 최종 결과(job_outcome)로 기록한다.
+    같은 (jobId, 입력 hash)가 이미 완료(DONE)된 경우 다시 실행하지 않고 저장된 최종 이벤트를 다시 보낸 뒤 결과를 반환한다.
+    jobId가 없는(null) 요청은 멱등 key가 없으므로 원장을 거치지 않고 매번 실행한다 (서로 다른 요청이 결과를 공유하지 않도록).
+    """
+    global _ledger
+    job_id, file_path = request.job_id, request.file_path
+    if job_id is None:
+        return _agent_instance().run(request.user_id, job_id, file_path)
+
+    if _ledger is None:
+        _ledger = JobLedger()
+    digest = input_digest(file_path)
+
+    done, stored = _ledger.completed_result(job_id, digest)
+    if done:
+        logger.info(f"job {job_id} already completed → resend stored final event")
+        final_event = stored.get('final_event')
+        if final_event:
+            ProgressStream().finish(final_event['message'], agent=final_event['agent'])
+        return stored.get('result')
+
+    agent = _agent_instance()
+    _ledger.start(job_id, digest)
+    try:
+        result = agent.run(request.user_id, job_id, file_path)
+    except Exception as e:
+        _ledger.fail(job_id, digest, repr(e))
+        raise
+    status, final_event = job_outcome(agent.finished())
+    if status == 'SUCCESS':
+        _ledger.complete(job_id, digest, {'final_event': final_event, 'result': result})
+    else:
+        _ledger.fail(job_id, digest, f"{(final_event or {}).get('agent')}: {status}")
+    return result
+
+
+class OffsetTracker:
+    """파티션별로 dispatch된 오프셋과 완료 여부를 추적하여 커밋 가능한 위치를 계산"""
+    def __init__(self):
+        self.partitions = {}  # (topic, partition) -> OrderedDict[offset, done]
+
+    def track(self, topic, partition, offset):
+        self.partitions.setdefault((topic, partition), OrderedDict())[offset] = False
+
+    def done(self, topic, partition, offset):
+        offsets = self.partitions.get((topic, partition))
+        if offsets is not None and offset in offsets:
+            offsets[offset] = True
+
+    def committable(self):
+        """{(topic, partition): next_offset} — 앞에서부터 연속으로 완료된 구간까지만"""
+        result = {}
+        for tp, offsets in self.partitions.items():
+            last = None
+            while offsets:
+                offset, finished = next(iter(offsets.items()))
+                if not finished:
+                    break
+                offsets.popitem(last=False)
+                last = offset
+            if last is not None:
+                result[tp] = last + 1
+        return result
+
+    def forget(self, topic, partition):
+        self.partitions.pop((topic, partition), None)
+
+
+class KeyedJobExecutor:
+    """
+    최대 max_workers개 작업을 동시에 실행하고, 받아둔(실행+대기) 작업이 max_pending에 도달하면 saturated.
+    완료 결과는 completed 큐로 전달되며 poll 스레드에서 drain()으로 처리한다.
+    """
+    def __init__(self, fn, max_workers: int, max_pending: int, workdir: str):
+        self.fn = fn
+        self.max_pending = max_pending
+        self.pool = ProcessPoolExecutor(max_workers=max_workers,
+                                        mp_context=multiprocessing.get_context('spawn'),
+                                        initializer=_init_worker,
+                                        initargs=(workdir, analyze_share(max_workers)))
+        self.waiting = {}             # key -> deque[(job, request)]
+        self.running = set()          # 실행 중인 key
+        self.pending = 0
+        self.completed = queue.Queue()
+
+    @property
+    def saturated(self) -> bool:
+        return self.pending >= self.max_pending
+
+    def submit(self, key, job, request):
+        """풀 제출이 실패하면(BrokenProcessPool 등) 예외를 그대로 올리고 pending/running은 바뀌지 않는다"""
+        if key in self.running:
+            self.waiting.setdefault(key, deque()).append((job, request))
+        else:
+            self._start(key, job, request)
+        self.pending += 1
+
+    def _start(self, key, job, request):
+        future = self.pool.submit(self.fn, request)
+        self.running.add(key)
+        future.add_done_callback(lambda f: self.completed.put((key, job, f)))
+
+    def drain(self, timeout: float = 0):
+        """완료된 작업을 (job, result, error) 목록으로 반환하고 같은 key의 다음 작업을 시작"""
+        finished = []
+        while True:
+            try:
+                key, job, future = self.completed.get(timeout=timeout) if timeout else self.completed.get_nowait()
+            except queue.Empty:
+                break
+            timeout = 0
+            self.pending -= 1
+            self.running.discard(key)
+            error = future.exception()
+            finished.append((job, None if error else future.result(), error))
+            finished.extend(self._start_next(key))
+        return finished
+
+    def _start_next(self, key):
+        """같은 key의 다음 대기 작업 시작. 제출에 실패한 작업은 (job, None, error)로 바로 완료 처리"""
+        failed = []
+        backlog = self.waiting.get(key)
+        while backlog:
+            job, request = backlog.popleft()
+            try:
+                self._start(key, job, request)
+                break
+            except Exception as e:
+                self.pending -= 1
+                failed.append((job, None, e))
+        if key in self.waiting and not backlog:
+            del self.waiting[key]
+        return failed
+
+    def shutdown(self, wait: bool = True):
+        self.pool.shutdown(wait=wait, cancel_futures=not wait)